@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Generator
+from typing import Iterable
 
-from collections import defaultdict
 import pytest
 
 import support
@@ -11,16 +11,24 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    elves = defaultdict(int)
-    i = 0
-    for line in s.splitlines():
+def elf_totals(lines: Iterable[str]) -> Generator[int, None, None]:
+    total = 0
+    for line in lines:
         if line == '':
-            i += 1
+            yield total
+            total = 0
         else:
-            elves[i] += int(line)
-        
-    return max(elves.values())
+            total += int(line)
+    yield total
+
+
+def compute_stream(lines: Iterable[str]) -> int:
+    return max(elf_totals(lines))
+
+
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
 
 INPUT_S = '''\
 1000
@@ -52,14 +60,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Iterable
 
 import pytest
 from enum import Enum
@@ -58,13 +58,16 @@ def battle(p2_hand: str, outcome: str) -> int:
     
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     points = 0
-    lines = s.splitlines()
     for line in lines:
         points += battle(*line.split())
     return points
 
+
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
 INPUT_S = '''\
 A Y
 B X
@@ -84,14 +87,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Iterable
 
 import pytest
 from string import ascii_letters
@@ -10,8 +10,7 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    lines = s.splitlines()
+def compute_stream(lines: Iterable[str]) -> int:
     priorities = 0
     d = dict(zip(ascii_letters, range(1, 53)))
     for line in lines:
@@ -21,6 +20,10 @@ def compute(s: str) -> int:
     return priorities
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
@@ -43,14 +46,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import argparse
 import os.path
 from string import ascii_letters
+from typing import Iterable
 
 import pytest
 
@@ -11,6 +11,7 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+@support.variant
 def compute2(s: str) -> int:
     lines = s.splitlines()
     priorities = 0
@@ -23,9 +24,9 @@ def compute2(s: str) -> int:
     return priorities
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     total = 0
-    items = iter(s.splitlines())
+    items = iter(lines)
 
     while True:
         try:
@@ -40,6 +41,10 @@ def compute(s: str) -> int:
     return total
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
@@ -62,14 +67,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Iterable
 
 import pytest
 
@@ -10,21 +10,23 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    lines = s.splitlines()
+def compute_stream(lines: Iterable[str]) -> int:
     total = 0
     for line in lines:
         left, right = line.split(',')
         l1, l2 = map(int, left.split('-'))
         r1, r2 = map(int, right.split('-'))
 
-        left_set, right_set = set(range(l1, l2+1)), set(range(r1, r2+1))
-        if not left_set.isdisjoint(right_set):
+        if l1 <= r2 and r1 <= l2:
             total += 1
 
     return total
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 2-4,6-8
 2-3,4-5
@@ -47,14 +49,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import os.path
 import re
 
@@ -9,6 +8,7 @@ import pytest
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+trace = support.tracer(__file__)
 
 
 def compute(s: str) -> str:
@@ -33,9 +33,11 @@ def compute(s: str) -> str:
         while '' in stack:
             stack.remove('')
     for i, instruction in enumerate(instructions):
-        print(verbal[i])
+        if trace.level:
+            trace(verbal[i])
         move(stacks, *instruction)
-        print(stacks)
+        if trace.level >= 2:
+            trace(stacks, level=2)
 
     return ''.join(stack[-1] for stack in stacks if len(stack) > 0)
 
@@ -72,14 +74,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
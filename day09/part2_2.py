@@ -1,7 +1,6 @@
 """Alternative solution using standard list."""
 from __future__ import annotations
 
-import argparse
 import os.path
 
 import pytest
@@ -9,16 +8,16 @@ import pytest
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+trace = support.tracer(__file__)
 GRID_SIZE = 10
 
 
-def print_grid(grid: dict[tuple[int, int], str]) -> None:
-    """Prid grid string."""
-    for y in range(GRID_SIZE):
-        print('')
-        for x in range(GRID_SIZE):
-            print(grid[(x, y)], end='')
-    print('')
+def format_grid(grid: dict[tuple[int, int], str]) -> str:
+    """Format grid string."""
+    return '\n'.join(
+        ''.join(grid[(x, y)] for x in range(GRID_SIZE))
+        for y in range(GRID_SIZE)
+    )
 
 
 def refresh_grid(
@@ -93,7 +92,7 @@ def make_move(
                 rope[i], rope[i+1] = first, second
 
         # refresh_grid(rope, grid)
-        # print_grid(grid)
+        # trace(format_grid(grid), level=2)
 
     return set(tail_locations)  # type: ignore
 
@@ -113,22 +112,21 @@ def compute(s: str) -> int:
     rope = [starting_point]*10
 
     # refresh_grid(rope, grid)
-    # print_grid(grid)
-    # print(f'== Initial State ==')
-    # print(rope)
+    # trace(format_grid(grid), level=2)
+    # trace('== Initial State ==')
+    # trace(rope)
 
     tail_locations = set(tuple(starting_point))
 
     for _, line in enumerate(s.splitlines()):
         dir, steps = line.split()
-        print(f'== {dir} {steps} ==')
+        if trace.level:
+            trace(f'== {dir} {steps} ==')
         newly_visted = make_move(rope, dir, int(steps), grid)
         tail_locations.update(newly_visted)  # type: ignore
 
     return len(set(tail_locations))
 
-    print_grid(grid)
-
 
 INPUT_S = '''\
 R 4
@@ -154,14 +152,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Generator
+from typing import Iterable
 
 import pytest
 
@@ -10,29 +11,29 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-
-    instructions = []
+def cycle_values(lines: Iterable[str]) -> Generator[int, None, None]:
+    """X during every cycle"""
     X = 1
-    for line in s.splitlines():
+    for line in lines:
         op, *n_s = line.split()
-        n = int(n_s[0]) if n_s else 0
+        yield X
         if op == 'addx':
-            instructions.extend([0, n])
-        else:
-            instructions.append(0)
-    cycle_values = []
-    for i, inst in enumerate(instructions):
-        cycle_values.append(X)
-        # print(f'{i+1}: During {X} | After: {inst} executed.')
-        X += inst
+            yield X
+            X += int(n_s[0])
+
+
+def compute_stream(lines: Iterable[str]) -> int:
     return sum((
         (i+1)*x
-        for i, x in enumerate(cycle_values)
+        for i, x in enumerate(cycle_values(lines))
         if i in range(19, 220, 40)
     ))
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 addx 15
 addx -11
@@ -195,14 +196,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import argparse
+import itertools
 import os.path
+from typing import Generator
+from typing import Iterable
 
 import pytest
 
@@ -10,34 +12,37 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-
-    instructions = []
+def cycle_values(lines: Iterable[str]) -> Generator[int, None, None]:
+    """X during every cycle"""
     X = 1
-    for line in s.splitlines():
+    for line in lines:
         op, *n_s = line.split()
-        n = int(n_s[0]) if n_s else 0
+        yield X
         if op == 'addx':
-            instructions.extend([0, n])
-        else:
-            instructions.append(0)
-    cycle_values = []
-    for i, inst in enumerate(instructions):
-        cycle_values.append(X)
-        # print(f'{i+1}: During {X} | After: {inst} executed.')
-        X += inst
-
-    print('\n')
+            yield X
+            X += int(n_s[0])
+
+
+def compute_stream(lines: Iterable[str]) -> str:
+    """the screen, its letters are the answer"""
+    values = list(itertools.islice(cycle_values(lines), 240))
+
+    rows = []
     for y in range(6):
+        row = []
         for x in range(40):
             current_pixel = (y * 40) + x
-            current_sprite_val = cycle_values[current_pixel] + (y * 40)
+            current_sprite_val = values[current_pixel] + (y * 40)
             if abs(current_sprite_val - current_pixel) <= 1:
-                print('#', end='')
+                row.append('#')
             else:
-                print('.', end='')
-        print('')
-    return 0
+                row.append('.')
+        rows.append(''.join(row))
+    return '\n'.join(rows)
+
+
+def compute(s: str) -> str:
+    return compute_stream(s.splitlines())
 
 
 INPUT_S = '''\
@@ -189,7 +194,7 @@ noop
 noop
 '''
 EXPECTED = '''\
-    ##..##..##..##..##..##..##..##..##..##..
+##..##..##..##..##..##..##..##..##..##..
 ###...###...###...###...###...###...###.
 ####....####....####....####....####....
 #####.....#####.....#####.....#####.....
@@ -203,19 +208,14 @@ EXPECTED = '''\
         (INPUT_S, EXPECTED),
     ),
 )
-def test(input_s: str, expected: int) -> None:
+def test(input_s: str, expected: str) -> None:
     assert compute(input_s) == expected
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import math
 import os.path
 import re
@@ -51,10 +50,8 @@ class Monkey:
             monkey_list[to_monkey].add_item(worry_level)
 
 
-monkeys = []
-
-
 def compute(s: str) -> int:
+    monkeys = []
     monkeys_s = s.split('\n\n')
     for monkey_s in monkeys_s:
         lines = monkey_s.splitlines()[1:]  # skip the monkey name
@@ -117,14 +114,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
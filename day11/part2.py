@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import math
 import operator
 import os.path
@@ -11,11 +10,8 @@ import pytest
 
 import support
 
-
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
-monkeys, ops, ns, mods, tos = [], [], [], [], []
-
 
 def parse_operation(s: str) -> tuple[Callable[[int, int], int], int | None]:
     n_s = s.split()[-1]
@@ -25,6 +21,11 @@ def parse_operation(s: str) -> tuple[Callable[[int, int], int], int | None]:
 
 
 def compute(s: str) -> int:
+    monkeys: list[list[int]] = []
+    ops: list[Callable[[int, int], int]] = []
+    ns: list[int | None] = []
+    mods: list[int] = []
+    tos: list[tuple[int, int]] = []
     monkeys_s = s.split('\n\n')
     for monkey_s in monkeys_s:
         lines = monkey_s.splitlines()[1:]  # skip the monkey name
@@ -96,14 +97,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
-import argparse
+import itertools
 import os.path
 from textwrap import wrap
+from typing import Generator
 
 import pytest
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+trace = support.tracer(__file__)
 
 
-def print_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> None:
-    print('\n\n')
+def format_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> str:
     highlights = {
         'E': '\033[42mE\033[m',
         'S': '\033[41mS\033[m',
     }
-    print(
+    return (
         '\n'.join(
             wrap(
                 ''.join(v for _, v in grid.items()),
@@ -25,7 +26,7 @@ def print_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> None:
             ),
         )
         .replace('E', highlights['E'])
-        .replace('S', highlights['S']),
+        .replace('S', highlights['S'])
     )
 
 
@@ -42,46 +43,30 @@ def compute(s: str) -> int:
         for x, item in enumerate(row):
             grid[(x, y)] = item
 
-    footsteps = {k: '.' if v != 'E' else 'E' for k, v in grid.items()}
-    visited = {k: False for k in grid}
-    parents: dict[tuple[int, int], tuple[tuple[int, int], str]] = {}
     START_POS = [k for k, v in grid.items() if v == 'S'][0]
     END_POS = [k for k, v in grid.items() if v == 'E'][0]
 
     # replace S and E with value to value before 'a' and after 'z'
     grid[START_POS], grid[END_POS] = 'a', '{'
 
-    def bfs(grid: dict[tuple[int, int], str], u: tuple[int, int]) -> None:
-        queue = []
-        visited[u] = True
-        queue.append(u)
-        while queue:
-            v = queue.pop(0)
-            if v == END_POS:
-                return
-            candidates = [
-                (n, step) for n, step in get_neighbors(v).items()
-                if n in grid and (ord(grid[n]) - ord(grid[v]) < 2)
-            ]
-            for c, sprite in candidates:
-                if not visited[c]:
-                    queue.append(c)
-                    visited[c] = True
-                    parents[c] = (v, sprite)
-        return
-
-    bfs(grid, START_POS)
-    path = []
-    p, step = parents[END_POS]
-    while p:
-        footsteps[p] = step
-        path.append(p)
-        try:
-            p, step = parents[p]
-        except KeyError:
-            break
-    print_grid(footsteps, lines)
-    return len(path)
+    def neighbors(
+            v: tuple[int, int],
+    ) -> Generator[tuple[int, int], None, None]:
+        for n in get_neighbors(v):
+            if n in grid and (ord(grid[n]) - ord(grid[v]) < 2):
+                yield n
+
+    result = support.bfs(
+        (START_POS,), neighbors, lambda v: v == END_POS, path=True,
+    )
+    assert result is not None
+    if trace.level:
+        footsteps = dict.fromkeys(grid, '.')
+        footsteps[END_POS] = 'E'
+        for p, n in itertools.pairwise(result.path):
+            footsteps[p] = get_neighbors(p)[n]
+        trace(format_grid(footsteps, lines))
+    return result.cost
 
 
 INPUT_S = '''\
@@ -105,14 +90,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
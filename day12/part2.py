@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import argparse
 import os.path
-from math import inf
 from textwrap import wrap
+from typing import Generator
 
 import pytest
 
@@ -12,13 +11,12 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def print_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> None:
-    print('\n\n')
+def format_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> str:
     highlights = {
         'E': '\033[42mE\033[m',
         'S': '\033[41mS\033[m',
     }
-    print(
+    return (
         '\n'.join(
             wrap(
                 ''.join(v for _, v in grid.items()),
@@ -26,7 +24,7 @@ def print_grid(grid: dict[tuple[int, int], str], lines: list[str]) -> None:
             ),
         )
         .replace('E', highlights['E'])
-        .replace('S', highlights['S']),
+        .replace('S', highlights['S'])
     )
 
 
@@ -52,47 +50,18 @@ def compute(s: str) -> int:
 
     # replace S and E with value to value before 'a' and after 'z'
     grid[starting_s], grid[END_POS] = 'a', '{'
-    min_path_len = inf
-
-    def bfs(grid: dict[tuple[int, int], str], u: tuple[int, int]) -> None:
-        queue = []
-        visited[u] = True
-        queue.append(u)
-        while queue:
-            v = queue.pop(0)
-            if v == END_POS:
-                return
-            candidates = [
-                (n, step) for n, step in get_neighbors(v).items()
-                if n in grid and (ord(grid[n]) - ord(grid[v]) < 2)
-            ]
-            for c, sprite in candidates:
-                if not visited[c]:
-                    queue.append(c)
-                    visited[c] = True
-                    parents[c] = (v, sprite)
-        return
-
-    for option in starting_options:
-        footsteps = {k: '.' if v != 'E' else 'E' for k, v in grid.items()}
-        visited = {k: False for k in grid}
-        parents: dict[tuple[int, int], tuple[tuple[int, int], str]] = {}
-
-        bfs(grid, option)
-        path: list[tuple[int, int]] = []
-        p, step = parents[END_POS]
-        while p:
-            footsteps[p] = step
-            path.append(p)
-            try:
-                p, step = parents[p]
-            except KeyError:
-                break
-        if len(path) < min_path_len:
-            min_path_len = len(path)
-            shortest_path = path
-            # print_grid(footsteps, lines)
-    return len(shortest_path)
+
+    def neighbors(
+            v: tuple[int, int],
+    ) -> Generator[tuple[int, int], None, None]:
+        for n in get_neighbors(v):
+            if n in grid and (ord(grid[n]) - ord(grid[v]) < 2):
+                yield n
+
+    # search from every starting option at once
+    result = support.bfs(starting_options, neighbors, lambda v: v == END_POS)
+    assert result is not None
+    return result.cost
 
 
 INPUT_S = '''\
@@ -116,14 +85,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
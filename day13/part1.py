@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import os.path
 from typing import Any
 
@@ -51,10 +50,8 @@ def compare(left: list[Any] | int, right: list[Any] | int) -> bool | None:
     return None
 
 
-correct = []
-
-
 def compute(s: str) -> int:
+    correct = []
     pairs = s.strip().split('\n\n')
     for i, pair in enumerate(pairs):
         # print(f'\n== Pair {i+1} ==')
@@ -106,14 +103,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import argparse
-import enum
 import itertools
 import os.path
 from ast import literal_eval
@@ -12,6 +10,7 @@ import pytest
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+trace = support.tracer(__file__)
 
 
 def get_points(
@@ -47,38 +46,24 @@ def get_window_dimensions(
     return x_min, x_max, y_min, y_max
 
 
-def print_grid(
-    grid: dict[tuple[int, int], str],
+def format_grid(
+    grid: support.Grid,
     window: tuple[float, int, int, int],
-) -> None:
+) -> str:
     x_min, x_max, y_min, y_max = window
     x_min = int(x_min)
-    for y in range(y_min, y_max + 1):
-        for x in range(x_min, x_max + 1):
-            print(grid[(x, y)], end='')
-        print('')
-
-
-class Direction4(enum.Enum):
-    UP = (0, -1)
-    RIGHT = (1, 0)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-
-
-def move(point: tuple[int, int], *dir: Direction4) -> tuple[int, int]:
-    for d in dir:
-        point = tuple([sum(x) for x in zip(point, d.value)])  # type: ignore
-    return point
+    return '\n'.join(
+        ''.join(grid[(x, y)] for x in range(x_min, x_max + 1))
+        for y in range(y_min, y_max + 1)
+    )
 
 
 def foo(
-    point: tuple[int, int], grid: dict[tuple[int, int], str],
+    point: tuple[int, int], grid: support.Grid,
     floor: int,
 ) -> tuple[tuple[int, int], bool]:
-    down = move(point, Direction4.DOWN)
-    down_left = move(point, Direction4.DOWN, Direction4.LEFT)
-    down_right = move(point, Direction4.DOWN, Direction4.RIGHT)
+    x, y = point
+    down, down_left, down_right = (x, y + 1), (x - 1, y + 1), (x + 1, y + 1)
 
     if point[1] >= floor:
         return point, True
@@ -103,10 +88,7 @@ def foo(
 
 def compute(s: str) -> int:
     window = (inf, 0, 0, 0)
-    grid = {}
-    for y in range(550):
-        for x in range(550):
-            grid[(x, y)] = '.'
+    grid = support.Grid(550, 550)
 
     lines = s.splitlines()
     for line in lines:
@@ -121,7 +103,8 @@ def compute(s: str) -> int:
     while True:
         landing_spot, hit_bottom = foo((500, 0), grid, floor)
         if hit_bottom:
-            print_grid(grid, window)
+            if trace.level:
+                trace(format_grid(grid, window))
             return total
         else:
             total += 1
@@ -146,14 +129,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import argparse
-import enum
 import itertools
 import os.path
 from ast import literal_eval
@@ -48,7 +46,7 @@ def get_window_dimensions(
 
 
 def print_grid(
-    grid: dict[tuple[int, int], str],
+    grid: support.Grid,
     window: tuple[int, int, int, int],
 ) -> None:
     x_min, x_max, y_min, y_max = window
@@ -58,26 +56,12 @@ def print_grid(
         print('')
 
 
-class Direction4(enum.Enum):
-    UP = (0, -1)
-    RIGHT = (1, 0)
-    DOWN = (0, 1)
-    LEFT = (-1, 0)
-
-
-def move(point: tuple[int, int], *dir: Direction4) -> tuple[int, int]:
-    for d in dir:
-        point = tuple([sum(x) for x in zip(point, d.value)])  # type: ignore
-    return point
-
-
 def foo(
-    point: tuple[int, int], grid: dict[tuple[int, int], str],
+    point: tuple[int, int], grid: support.Grid,
     floor: int,
 ) -> tuple[tuple[int, int], bool]:
-    down = move(point, Direction4.DOWN)
-    down_left = move(point, Direction4.DOWN, Direction4.LEFT)
-    down_right = move(point, Direction4.DOWN, Direction4.RIGHT)
+    x, y = point
+    down, down_left, down_right = (x, y + 1), (x - 1, y + 1), (x + 1, y + 1)
 
     if (
         grid[down_left] != '.'
@@ -99,10 +83,7 @@ def foo(
 
 def compute(s: str) -> int:
     window = (inf, 0, 0, 0)
-    grid = {}
-    for y in range(550):
-        for x in range(1000):
-            grid[(x, y)] = '.'
+    grid = support.Grid(1000, 550)
 
     lines = s.splitlines()
     for line in lines:
@@ -146,14 +127,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
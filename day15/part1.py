@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import argparse
 import os.path
 import re
-from collections import defaultdict
-from typing import DefaultDict
 
 import pytest
 
@@ -18,80 +15,36 @@ def manhattan_dist(coord1: tuple[int, int], coord2: tuple[int, int]) -> int:
     return abs(x1-x2) + abs(y1-y2)
 
 
-locations = {}
 ROW = 2000000
 
 
-def is_inside_polygon(
-    vertices: tuple[tuple[int, int], ...],
-    point: tuple[int, int],
-) -> bool:
-    """Check if a point is to the left of every edge of a polygon.
-    If so, it lies inside the polygon.
-    """
-    v1, v2, v3, v4 = vertices
-    pairs = ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-    xp, yp = point
-
-    for v1, v2 in pairs:
-        x1, y1 = v1
-        x2, y2 = v2
-        # if D > 0, the point is on the lhs, > 0 then rhs, 0 is on the line
-        D = (x2 - x1) * (yp - y1) - (xp - x1) * (y2 - y1)
-        if D > 0:  # inverted inequality because y is flipped in this problem
-            return False
-    return True
-
-
-def compute(s: str) -> int:
+def parse(s: str) -> dict[tuple[int, int], tuple[int, int]]:
+    """the closest beacon of each sensor"""
+    locations = {}
     lines = s.splitlines()
     for line in lines:
         sx, sy, bx, by = map(int, re.findall(r'-*\d+', line))
         locations[(sx, sy)] = (bx, by)
+    return locations
 
-    # find maxima and minima for row of interest
-    min_x = min(x for x, _ in locations)
-    max_x = max(x for x, _ in locations)
-
-    sensors_of_interest: DefaultDict[
-        tuple[int, int], tuple[tuple[int, int], int],
-    ] = defaultdict()
 
-    # find nearby sensors
+def solve(locations: dict[tuple[int, int], tuple[int, int]]) -> int:
+    # each sensor covers a (possibly empty) span of the row, the closer the
+    # sensor is to the row the wider the span
+    spans = []
     for sensor, beacon in locations.items():
-        dist = manhattan_dist(sensor, beacon)
         x, y = sensor
+        half = manhattan_dist(sensor, beacon) - abs(y - ROW)
+        spans.append((x - half, x + half))
+    covered = support.IntervalSet(spans)
 
-        # minimum x needs to be the leftmost sensor minus manhattan distance
-        if x == min_x:
-            min_x = x - dist
-        if x == max_x:
-            max_x = x + dist
-        if ROW in range(y-dist, y+dist):
-            sensors_of_interest[sensor] = (beacon, dist)
-
-    # for every point on the row, check if it lies inside the
-    # von neumann neighbood of nearby sensors
-    # -- basically checking if it's inside or out of the sensor field square
-
-    row = {(x, ROW): False for x in range(min_x, max_x+1)}
-    for point, _ in row.items():
-        for sensor, (beacon, dist) in sensors_of_interest.items():
-            x, y = sensor
-            ccw_vertices = (
-                (x, y+dist),
-                (x+dist, y),
-                (x, y-dist),
-                (x-dist, y),
-            )
-            if (
-                point != beacon and point != sensor
-                and is_inside_polygon(ccw_vertices, point)
-            ):
-                row[point] = True
-                break
-
-    return sum(row.values())
+    # sensors and beacons on the row don't count
+    occupied = {x for x, y in (*locations, *locations.values()) if y == ROW}
+    return len(covered) - sum(x in covered for x in occupied)
+
+
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
 
 
 INPUT_S = '''\
@@ -124,14 +77,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
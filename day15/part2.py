@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import argparse
 import os.path
 import re
 
-import geopandas as gpd
 import pytest
-from shapely import Polygon
-from shapely import unary_union
 
 import support
 
+gpd = support.lazy_import('geopandas')
+shapely = support.lazy_import('shapely')
+
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
@@ -19,15 +18,17 @@ def manhattan_dist(coord1: tuple[int, int], coord2: tuple[int, int]) -> int:
     return abs(x1-x2) + abs(y1-y2)
 
 
-locations = {}
-
-
-def compute(s: str) -> int:
+def parse(s: str) -> dict[tuple[int, int], tuple[int, int]]:
+    """the closest beacon of each sensor"""
+    locations = {}
     lines = s.splitlines()
     for line in lines:
         sx, sy, bx, by = map(int, re.findall(r'-*\d+', line))
         locations[(sx, sy)] = (bx, by)
+    return locations
+
 
+def solve(locations: dict[tuple[int, int], tuple[int, int]]) -> int:
     # get full listing of sensors, and the vertices of their Von Neumann
     # neighborhood (offset is man. dist). We'll use them to construct polygons
     polygons = []
@@ -41,10 +42,10 @@ def compute(s: str) -> int:
             (x, y-dist),
             (x-dist, y),
         )
-        polygons.append(Polygon(ccw_vertices))
+        polygons.append(shapely.Polygon(ccw_vertices))
 
     # Create the polygon consisting of all the merged VNNs.
-    boundary = gpd.GeoSeries(unary_union(polygons))
+    boundary = gpd.GeoSeries(shapely.unary_union(polygons))
 
     # Clip the polygon by the stated window w: 0 <= w <= 4e6
     boundary.clip_by_rect(0, 0, 4e6, 4e6).to_json()
@@ -68,6 +69,10 @@ def compute(s: str) -> int:
     return x * 4_000_000 + y
 
 
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
+
+
 INPUT_S = '''\
 Sensor at x=2, y=18: closest beacon is at x=-2, y=15
 Sensor at x=9, y=16: closest beacon is at x=10, y=16
@@ -98,14 +103,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
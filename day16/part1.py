@@ -1,10 +1,8 @@
 """NOTE: Solution gotten from https://www.youtube.com/watch?v=rN4tVLnkgJU"""
 from __future__ import annotations
 
-import argparse
 import os.path
 import re
-from functools import cache
 from typing import NamedTuple
 
 import pytest
@@ -17,47 +15,58 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 class Valve(NamedTuple):
     name: str
     flow_rate: int
-    neighbors: tuple[Valve, ...]
+    neighbors: tuple[str, ...]
 
     def release(self, time: int) -> int:
         return (30 - time - 1) * self.flow_rate
 
 
-valves = {}
+class Valves:
+    """the parsed input, hashed by identity so it is a cheap memo key"""
+    __slots__ = ('by_name',)
 
+    def __init__(self, by_name: dict[str, Valve]) -> None:
+        self.by_name = by_name
 
-def compute(s: str) -> int:
-    lines = s.splitlines()
-    for line in lines:
-        first, rest = line.split(';')
-        match = re.search(r'([A-Z]{2}).*=(\d+)', first)
-        assert match is not None
-        name, flow_rate = match.groups()
-        neighbors = tuple(re.findall(r'[A-Z]{2}', rest))
-        valves[name] = Valve(name, int(flow_rate), neighbors)
-
-    return solve('AA', 30, frozenset())
 
-
-@cache
-def solve(pos: str, time: int, opened: set[str]) -> int:
+@support.memo
+def solve(valves: Valves, pos: str, time: int, opened: frozenset[str]) -> int:
     if time == 0:
         return 0
+    valve = valves.by_name[pos]
     score = max(
-        solve(n, time - 1, opened)  # type: ignore
-        for n in valves[pos].neighbors
+        solve(valves, n, time - 1, opened)
+        for n in valve.neighbors
     )
-    if valves[pos].flow_rate > 0 and pos not in opened:
+    if valve.flow_rate > 0 and pos not in opened:
         new_opened = set(opened)
         new_opened.add(pos)
         score = max(
             score,
-            (time - 1) * valves[pos].flow_rate +
-            solve(pos, time - 1, frozenset(new_opened)),
+            (time - 1) * valve.flow_rate +
+            solve(valves, pos, time - 1, frozenset(new_opened)),
         )
     return score
 
 
+def compute(s: str) -> int:
+    valves: dict[str, Valve] = {}
+    lines = s.splitlines()
+    for line in lines:
+        first, rest = line.split(';')
+        match = re.search(r'([A-Z]{2}).*=(\d+)', first)
+        assert match is not None
+        name, flow_rate = match.groups()
+        neighbors = tuple(re.findall(r'[A-Z]{2}', rest))
+        valves[name] = Valve(name, int(flow_rate), neighbors)
+
+    # the entries are keyed by this input's valves, no use to another call
+    try:
+        return solve(Valves(valves), 'AA', 30, frozenset())
+    finally:
+        solve.clear()
+
+
 INPUT_S = '''\
 Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
 Valve BB has flow rate=13; tunnels lead to valves CC, AA
@@ -84,14 +93,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
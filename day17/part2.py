@@ -1,10 +1,9 @@
 """NOTE: credit to Anthony Sotille for this solution."""
 from __future__ import annotations
 
-import argparse
 import functools
-import itertools
 import os.path
+from typing import NamedTuple
 
 import pytest
 
@@ -16,6 +15,7 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 class Piece:
     def __init__(self, places: set[tuple[int, int]]) -> None:
         self.places = frozenset((x, -y) for x, y in places)
+        self.points = support.PointSet(self.places)
 
     @functools.cached_property
     def height(self) -> int:
@@ -27,9 +27,6 @@ class Piece:
         bx, _ = support.bounds(self.places)
         return bx.max - bx.min + 1
 
-    def at(self, dx: int, dy: int) -> set[tuple[int, int]]:
-        return {(x + dx, y + dy) for x, y in self.places}
-
     def __hash__(self) -> int:
         return hash(self.places)
 
@@ -75,19 +72,19 @@ def print_coords_hash(coords: set[tuple[int, int]]) -> None:
 
 
 def move(
-    coords: set[tuple[int, int]],
+    coords: support.PointSet,
     piece: Piece,
     x: int,
     y: int,
     direction: str,
 ) -> int:
     if direction == '<':
-        if x == 0 or piece.at(x - 1, y) & coords:
+        if x == 0 or coords.intersects(piece.points, x - 1, y):
             return x
         else:
             return x - 1
     elif direction == '>':
-        if x == 7 - piece.width or piece.at(x + 1, y) & coords:
+        if x == 7 - piece.width or coords.intersects(piece.points, x + 1, y):
             return x
         else:
             return x + 1
@@ -95,76 +92,72 @@ def move(
         raise NotImplementedError(f'??? {direction=}')
 
 
-def get_fingerprint(
-    piece_id: int,
-    gas_id: int,
-    coords: set[tuple[int, int]],
-) -> tuple[int, int, frozenset[tuple[int, int]]]:
-    max_ys = [
-        max(y for x, y in coords if x == i)
-        for i in range(7)
-    ]
-    min_y = min(max_ys)
-    return (
-        piece_id,
-        gas_id,
-        frozenset((x, y - min_y) for x, y in coords if y >= min_y),
-    )
+class State(NamedTuple):
+    piece_id: int
+    gas_id: int
+    # packed points rocks can still touch, shifted so the lowest is at 0
+    surface: frozenset[int]
+    top: int
+    height: int
 
 
-def compute(s: str) -> int:
-    s = s.strip()
-    pieces = itertools.cycle(enumerate(PIECES))
-    gas = itertools.cycle(enumerate(s))
-
-    fingerprints: dict[
-        tuple[int, int, frozenset[tuple[int, int]]],
-        tuple[int, int],
-    ]
-    fingerprints = {}
-    coords = support.parse_coords_hash('#######')
-    max_height = 0
-
-    done_at = None
-    done_at_val = None
-    done_at_delta_height = None
-    i = 0
+def drop(gas: str, state: State) -> State:
+    coords = support.PointSet.from_packed(state.surface)
+    piece = PIECES[state.piece_id]
+    gas_id = state.gas_id
+    x = 2
+    y = state.top + piece.height + 3  # spawns 3 above
+
     while True:
-        piece_id, piece = next(pieces)
-        gas_id, direction = next(gas)
-        x = 2
-        y = max_height + piece.height + 3  # spawns 3 above
-
-        key = get_fingerprint(piece_id, gas_id, coords)
-        if key in fingerprints:
-            start_i, start_height = fingerprints[key]
-            period = i - start_i
-            remaining = 1_000_000_000_000 - start_i
-            n = remaining // period
-            done_at = i + remaining % period
-            done_at_val = start_height + n * (max_height - start_height)
-            done_at_delta_height = max_height
+        x = move(coords, piece, x, y, gas[gas_id])
+        gas_id = (gas_id + 1) % len(gas)
+        # whatever is below the surface is treated as solid
+        if (
+                y - piece.height < 0 or
+                coords.intersects(piece.points, x, y - 1)
+        ):
+            coords.update(piece.points.translate(x, y))
+            break
         else:
-            fingerprints[key] = (i, max_height)
-
-        if done_at is not None and i == done_at:
-            assert done_at_val is not None
-            assert done_at_delta_height is not None
-            return done_at_val + (max_height - done_at_delta_height)
+            y -= 1
+
+    top = max(y, state.top)
+    # rocks can only reach the air connected to the top, everything below
+    # the lowest such air can be forgotten
+    air = {(x, top + 1) for x in range(7)}
+    todo = list(air)
+    while todo:
+        ax, ay = todo.pop()
+        for n in ((ax - 1, ay), (ax + 1, ay), (ax, ay - 1)):
+            if (
+                    0 <= n[0] < 7 and n[1] >= 0 and
+                    n not in air and n not in coords
+            ):
+                air.add(n)
+                todo.append(n)
+    min_y = max(min(ay for _, ay in air) - 1, 0)
+    d = support.pack_offset(0, -min_y)
+    # (packed points order by y first, so a row starts at its smallest x)
+    row_start = support.pack(-2 ** 31, min_y)
+    return State(
+        piece_id=(state.piece_id + 1) % len(PIECES),
+        gas_id=gas_id,
+        surface=frozenset(p + d for p in coords.packed if p >= row_start),
+        top=top - min_y,
+        height=state.height + top - state.top,
+    )
 
-        x = move(coords, piece, x, y, direction)
-        y -= 1
 
-        while True:
-            gas_id, direction = next(gas)
-            x = move(coords, piece, x, y, direction)
-            if piece.at(x, y - 1) & coords:
-                coords |= piece.at(x, y)
-                max_height = max(y, max_height)
-                break
-            else:
-                y -= 1
-        i += 1
+def compute(s: str) -> int:
+    step = functools.partial(drop, s.strip())
+    floor = frozenset(support.PointSet.parse('#######').packed)
+    start = State(piece_id=0, gas_id=0, surface=floor, top=0, height=0)
+
+    cycle = support.find_cycle(start, step, key=lambda st: st[:3])
+    return support.extrapolate(
+        start, step, 1_000_000_000_000, cycle,
+        value=lambda st: st.height,
+    )
 
 
 INPUT_S = '''\
@@ -184,14 +177,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
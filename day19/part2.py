@@ -1,7 +1,6 @@
 """NOTE: credit for solution goes to Anthony Sotille"""
 from __future__ import annotations
 
-import argparse
 import collections
 import os.path
 import re
@@ -24,22 +23,27 @@ class Cost(NamedTuple):
     geo_bot_obs: int
 
 
-def _compute_one(items: list[tuple[str, str, str, str, str]]) -> int:
-    costs: dict[str, dict[str, int]] = collections.defaultdict(dict)
-    for bot_tp, n1_s, cost1_s, n2_s, cost2_s in items:
-        costs[bot_tp][cost1_s] = int(n1_s)
-        if n2_s:
-            costs[bot_tp][cost2_s] = int(n2_s)
-
-    cost = Cost(
-        ore_bot_ore=costs['ore']['ore'],
-        cla_bot_ore=costs['clay']['ore'],
-        obs_bot_ore=costs['obsidian']['ore'],
-        obs_bot_cla=costs['obsidian']['clay'],
-        geo_bot_ore=costs['geode']['ore'],
-        geo_bot_obs=costs['geode']['obsidian'],
-    )
+def parse(s: str) -> list[tuple[int, ...]]:
+    """the costs of each blueprint, in the order of `Cost`"""
+    ret: list[tuple[int, ...]] = []
+    for line in s.splitlines():
+        costs: dict[str, dict[str, int]] = collections.defaultdict(dict)
+        for bot_tp, n1_s, cost1_s, n2_s, cost2_s in REG.findall(line):
+            costs[bot_tp][cost1_s] = int(n1_s)
+            if n2_s:
+                costs[bot_tp][cost2_s] = int(n2_s)
+        ret.append((
+            costs['ore']['ore'],
+            costs['clay']['ore'],
+            costs['obsidian']['ore'],
+            costs['obsidian']['clay'],
+            costs['geode']['ore'],
+            costs['geode']['obsidian'],
+        ))
+    return ret
 
+
+def _compute_one(cost: Cost) -> int:
     max_ore = max(
         cost.ore_bot_ore,
         cost.cla_bot_ore,
@@ -142,15 +146,19 @@ def _compute_one(items: list[tuple[str, str, str, str, str]]) -> int:
     return best_at[32]
 
 
-def compute(s: str) -> int:
+def solve(blueprints: list[tuple[int, ...]]) -> int:
     ret = 1
 
-    for line in s.splitlines()[:3]:
-        ret *= _compute_one(REG.findall(line))
+    for blueprint in blueprints[:3]:
+        ret *= _compute_one(Cost(*blueprint))
 
     return ret
 
 
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
+
+
 INPUT_S = '''\
 Blueprint 1: Each ore robot costs 4 ore. Each clay robot costs 2 ore. Each obsidian robot costs 3 ore and 14 clay. Each geode robot costs 2 ore and 7 obsidian.
 Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. Each obsidian robot costs 3 ore and 8 clay. Each geode robot costs 3 ore and 12 obsidian.
@@ -169,14 +177,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
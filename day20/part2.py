@@ -1,9 +1,9 @@
 """NOTE: Credit to Anthony Sotille for this solution."""
 from __future__ import annotations
 
-import argparse
 import collections
 import os.path
+from typing import Iterable
 from unittest import mock
 
 import pytest
@@ -13,9 +13,9 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    orig_lst = list(map(int, s.splitlines()))
-    orig_lst = [x * 811589153 for x in orig_lst]
+def compute_stream(lines: Iterable[str]) -> int:
+    # mixing moves numbers anywhere, so they all have to be in memory
+    orig_lst = [int(line) * 811589153 for line in lines]
     numbers = collections.deque(list(enumerate(orig_lst)))
 
     for _ in range(10):
@@ -33,6 +33,10 @@ def compute(s: str) -> int:
     )
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 1
 2
@@ -56,14 +60,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
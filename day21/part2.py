@@ -1,16 +1,14 @@
 """NOTE: Credit for solution goes to Anthony Sotille"""
 from __future__ import annotations
 
-import argparse
 import os.path
 
 import pytest
-from z3 import Int
-from z3 import Optimize
-from z3 import sat
 
 import support
 
+z3 = support.lazy_import('z3')
+
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 OPS = {
@@ -23,23 +21,23 @@ OPS = {
 
 
 def compute(s: str) -> int:
-    o = Optimize()
+    o = z3.Optimize()
     for line in s.splitlines():
         if line.startswith('humn:'):
             continue
         elif line.startswith('root:'):
             _, a, _, b = line.split()
-            o.add(Int(a) == Int(b))
+            o.add(z3.Int(a) == z3.Int(b))
         elif len(line.split()) == 4:
             name, rest = line.split(': ')
             op1, op, op2 = rest.split()
-            o.add(Int(name) == OPS[op](Int(op1), Int(op2)))
+            o.add(z3.Int(name) == OPS[op](z3.Int(op1), z3.Int(op2)))
         else:
             name, rest = line.split(': ')
-            o.add(Int(name) == int(rest))
+            o.add(z3.Int(name) == int(rest))
 
-    assert o.check() == sat
-    return o.model()[Int('humn')].as_long()
+    assert o.check() == z3.sat
+    return o.model()[z3.Int('humn')].as_long()
 
 
 INPUT_S = '''\
@@ -73,14 +71,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
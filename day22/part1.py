@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import collections
 import enum
 import os.path
@@ -13,6 +12,13 @@ import support
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 REG = re.compile(r'([LR])(\d+)')
 
+# the board, where it starts and the (turn, steps) instructions
+Parsed = tuple[
+    dict[tuple[int, int], str],
+    tuple[int, int],
+    list[tuple[str, int]],
+]
+
 
 class Facing(enum.Enum):
     RIGHT = 0
@@ -104,7 +110,7 @@ def move(
     return x, y
 
 
-def compute(s: str) -> int:
+def parse(s: str) -> Parsed:
     board, instr = s.split('\n\n')
     instr = 'R' + instr.strip()
     coords = {}
@@ -118,6 +124,11 @@ def compute(s: str) -> int:
             coords[(x, y)] = c
 
     instr_lst = [(x, int(y)) for x, y in REG.findall(instr)]
+    return coords, start, instr_lst
+
+
+def solve(parsed: Parsed) -> int:
+    coords, start, instr_lst = parsed
     curr_pos = start
     curr_facing = Facing.UP
 
@@ -128,6 +139,10 @@ def compute(s: str) -> int:
     return 4 * (curr_pos[0] + 1) + 1000 * (curr_pos[1] + 1) + curr_facing.value
 
 
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
+
+
 INPUT_S = '''\
         ...#
         .#..
@@ -158,14 +173,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
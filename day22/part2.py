@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import collections
 import enum
 import itertools
@@ -8,36 +7,43 @@ import math as m
 import os.path
 import re
 from typing import Any
+from typing import Iterator
 
-import numpy as np
 import pytest
 
 import support
 
+np = support.lazy_import('numpy')
+
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 REG = re.compile(r'([LR])(\d+)')
-xpos, ypos, zpos = np.array(((1, 0, 0), (0, 1, 0), (0, 0, 1)))
-xneg, yneg, zneg = -1 * xpos, -1 * ypos, -1 * zpos
-
-cw_y = itertools.cycle((zpos, xpos, zneg))
-ccw_y = itertools.cycle((zpos, xneg, zneg))
-
-cw_x = itertools.cycle((zpos, yneg, zneg))
-ccw_x = itertools.cycle((zpos, ypos, zneg))
-
-# no need for first adj b/c already up in the x direction due to first fold
-cw_z = itertools.cycle((ypos, xneg))
-ccw_z = itertools.cycle((yneg, xneg))
-
-# these offsets simulate the wrap-around of flaps with multiple faces
-OFFSETS = {
-    ('x', 'cw'): cw_x,
-    ('x', 'ccw'): ccw_x,
-    ('y', 'cw'): cw_y,
-    ('y', 'ccw'): ccw_y,
-    ('z', 'cw'): cw_z,
-    ('z', 'ccw'): ccw_z,
-}
+
+# the board, where it starts and the (turn, steps) instructions
+Parsed = tuple[
+    dict[tuple[int, int, int], str],
+    tuple[int, int, int],
+    list[tuple[str, int]],
+]
+
+
+def offsets() -> dict[tuple[str, str], Iterator[np.array]]:
+    """these offsets simulate the wrap-around of flaps with multiple faces
+
+    built per compute() so numpy is only imported once it's needed.
+    """
+    xpos, ypos, zpos = np.array(((1, 0, 0), (0, 1, 0), (0, 0, 1)))
+    xneg, yneg, zneg = -1 * xpos, -1 * ypos, -1 * zpos
+
+    return {
+        ('x', 'cw'): itertools.cycle((zpos, yneg, zneg)),
+        ('x', 'ccw'): itertools.cycle((zpos, ypos, zneg)),
+        ('y', 'cw'): itertools.cycle((zpos, xpos, zneg)),
+        ('y', 'ccw'): itertools.cycle((zpos, xneg, zneg)),
+        # no need for first adj b/c already up in the x direction due to
+        # first fold
+        ('z', 'cw'): itertools.cycle((ypos, xneg)),
+        ('z', 'ccw'): itertools.cycle((yneg, xneg)),
+    }
 
 
 class Facing(enum.Enum):
@@ -161,8 +167,8 @@ def edge(*args: np.array, onto: np.array) -> np.array:
 
 def fold(
     *args: np.array, axis: str, direction: str, onto: np.array,
+    offs: dict[tuple[str, str], Iterator[np.array]],
 ) -> np.array:
-    offs = OFFSETS[(axis, direction)]
 
     if axis not in ('x', 'y', 'z'):
         raise ValueError(f'{axis=} not valid.')
@@ -174,7 +180,7 @@ def fold(
         raise ValueError(f'{direction=} not valid')
 
     A = np.vstack(args)
-    off = next(offs)
+    off = next(offs[(axis, direction)])
     reset_origin_tx = edge(A, onto=onto)
     A = translate3d(A, *reset_origin_tx * -1)
     A = rotate(A, axis, theta)
@@ -317,7 +323,7 @@ def find_coord_face(coord: tuple[int, ...], cube: dict[str, np.array]) -> str:
     raise AssertionError('coord not found')
 
 
-def compute(s: str) -> int:
+def parse(s: str) -> Parsed:
     board, instr = s.split('\n\n')
     instr = 'R' + instr.strip()
     coords = {}
@@ -327,6 +333,11 @@ def compute(s: str) -> int:
         for x, c in enumerate(line):
             coords[(x, y, 0)] = c
     instr_lst = [(x, int(y)) for x, y in REG.findall(instr)]
+    return coords, start, instr_lst
+
+
+def solve(parsed: Parsed) -> int:
+    coords, start, instr_lst = parsed
     curr_pos = start
     curr_facing = Facing.UP
 
@@ -365,18 +376,24 @@ def compute(s: str) -> int:
     }
 
     # fold cubes
+    offs = offsets()
     f3, f2, f1 = np.vsplit(
-        fold(three, two, one, onto=four, axis='x', direction='cw'), 3,
+        fold(
+            three, two, one, onto=four, axis='x', direction='cw', offs=offs,
+        ),
+        3,
+    )
+    f2, f1 = np.vsplit(
+        fold(f2, f1, onto=f3, axis='z', direction='cw', offs=offs), 2,
     )
-    f2, f1 = np.vsplit(fold(f2, f1, onto=f3, axis='z', direction='cw'), 2)
     f1 = translate3d(f1, 0, -2, 0)
     f2 = translate3d(f2, 0, -2, 0)
-    f1 = fold(f1, onto=f2, axis='y', direction='cw')
+    f1 = fold(f1, onto=f2, axis='y', direction='cw', offs=offs)
     f1 = translate3d(f1, 1, 0, -1)
     f5, f6 = np.vsplit(
-        fold(five, six, onto=four, axis='x', direction='ccw'), 2,
+        fold(five, six, onto=four, axis='x', direction='ccw', offs=offs), 2,
     )
-    f6 = fold(f6, onto=f5, axis='z', direction='cw')
+    f6 = fold(f6, onto=f5, axis='z', direction='cw', offs=offs)
     f6 = translate3d(f6, 1, 1, 0)
 
     cube = {
@@ -460,6 +477,10 @@ def compute(s: str) -> int:
     return 4 * (curr_pos[0] + 1) + 1000 * (curr_pos[1] + 1) + curr_facing.value
 
 
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
+
+
 INPUT_S = '''\
         ...#
         .#..
@@ -490,14 +511,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
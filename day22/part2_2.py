@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import collections
 import enum
 import itertools
@@ -8,14 +7,23 @@ import os.path
 import re
 from typing import Any
 
-import numpy as np
 import pytest
 
 import support
 
+np = support.lazy_import('numpy')
+
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+trace = support.tracer(__file__)
 REG = re.compile(r'([LR])(\d+)')
 
+# the board, where it starts and the (turn, steps) instructions
+Parsed = tuple[
+    dict[tuple[int, int], str],
+    tuple[int, int],
+    list[tuple[str, int]],
+]
+
 
 class Facing(enum.Enum):
     RIGHT = 0
@@ -127,8 +135,7 @@ def move(
     return (x, y), curr_facing
 
 
-def compute(s: str) -> int:
-    visited: set[tuple[int, int]] = set()
+def parse(s: str) -> Parsed:
     board, instr = s.split('\n\n')
     instr = 'R' + instr.strip()
     coords = {}
@@ -139,6 +146,12 @@ def compute(s: str) -> int:
             coords[(x, y)] = c
 
     instr_lst = [(x, int(y)) for x, y in REG.findall(instr)]
+    return coords, start, instr_lst
+
+
+def solve(parsed: Parsed) -> int:
+    coords, start, instr_lst = parsed
+    visited: set[tuple[int, int]] = set()
 
     # edges of each cube face
     FACES = {
@@ -229,10 +242,15 @@ def compute(s: str) -> int:
             coords, cube_points, pointmap, visited,
         )
 
-    support.print_coords_hash(visited)
+    if trace.level:
+        trace(support.format_coords_hash(visited))
     return 4 * (curr_pos[0] + 1) + 1000 * (curr_pos[1] + 1) + curr_facing.value
 
 
+def compute(s: str) -> int:
+    return support.parse_solve(parse, solve, s)
+
+
 INPUT_S = '''\
         ...#
         .#..
@@ -263,14 +281,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
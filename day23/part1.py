@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import argparse
 import collections
 import os.path
 from typing import Generator
@@ -26,31 +25,40 @@ def adjacent_3_dir(
             yield a
 
 
-coords = {}
-elves, spaces = {}, {}
 dirs = (
     support.Direction4.RIGHT, support.Direction4.UP,
     support.Direction4.DOWN, support.Direction4.LEFT,
 )
-dir_proposals = collections.deque(dirs)
+
+# neighbourhoods as packed offsets, checked against a support.PointSet
+ADJ_8 = tuple(
+    support.pack_offset(dx, dy) for dx, dy in support.adjacent_8(0, 0)
+)
+ADJ_3 = {
+    d: tuple(support.pack_offset(dx, dy) for dx, dy in adjacent_3_dir(0, 0, d))
+    for d in dirs
+}
 
 
 def compute(s: str) -> int:
+    coords = {}
+    elves = {}
+    dir_proposals = collections.deque(dirs)
     lines = s.splitlines()
     for y, line in enumerate(lines):
         for x, c in enumerate(line):
             coords[(x, y)] = c
             if c == '#':
                 elves[(x, y)] = (x, y)
-                spaces[(x, y)] = (x, y)
     for _ in range(10):
         dir_proposals.rotate(-1)
         elves_iters = {k: iter(dir_proposals) for k in elves}
         elf_proposals = {}
-        elf_values = set(elves.values())
+        elf_values = support.PointSet(elves.values()).packed
         for elf, pos in elves.items():
 
-            if not elf_values & set(support.adjacent_8(*pos)):
+            packed = support.pack(*pos)
+            if not any(packed + d in elf_values for d in ADJ_8):
                 continue
             else:
                 while True:
@@ -60,16 +68,18 @@ def compute(s: str) -> int:
                         break
                     else:
                         # propose square if no elves in that direction
-                        if not elf_values & set(adjacent_3_dir(*pos, p)):
+                        if not any(
+                            packed + d in elf_values for d in ADJ_3[p]
+                        ):
                             elf_proposals[elf] = support.Direction4.apply(
                                 p, *pos,
                             )
                             break
 
         # move elves that were the only ones to propose their proposed location
+        counts = collections.Counter(elf_proposals.values())
         movers = tuple(
-            (k, v) for k, v in elf_proposals.items()
-            if collections.Counter(elf_proposals.values())[v] == 1
+            (k, v) for k, v in elf_proposals.items() if counts[v] == 1
         )
         for elf, move in movers:
             elves[elf] = move
@@ -122,14 +132,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
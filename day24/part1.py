@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import argparse
-import collections
-import heapq
+import functools
 import os.path
 from copy import copy
+from typing import Generator
 
 import pytest
 
@@ -18,6 +17,7 @@ ARROWS = {
     '>': support.Direction4.RIGHT,
     '<': support.Direction4.LEFT,
 }
+DELTAS = {arrow: d.value for arrow, d in ARROWS.items()}
 
 
 def format_coords_hash(coords: dict[tuple[int, int], str]) -> str:
@@ -44,13 +44,16 @@ def pch(coords: dict[tuple[int, int], str]) -> None:
 
 def move_blizzards(
     coords: dict[tuple[int, int], str],
+    bx: support.Bound,
+    by: support.Bound,
     b_pos: dict[tuple[int, str], tuple[int, int]],
-) -> tuple[dict[tuple[int, int], str], dict[tuple[int, str], tuple[int, int]]]:
-    coords, b_pos = copy(coords), copy(b_pos)
-    bx, by = support.bounds(coords)
+) -> dict[tuple[int, str], tuple[int, int]]:
+    """`coords` is the initial valley, only its walls are looked at"""
+    b_pos = copy(b_pos)
     for k, v in b_pos.items():
         _, arrow = k
-        pos = support.Direction4.apply(ARROWS[arrow], *v)
+        dx, dy = DELTAS[arrow]
+        pos = (v[0] + dx, v[1] + dy)
         if coords[pos] == '#':  # wrap around
             if arrow == '>':
                 pos = (bx.min + 1, v[1])
@@ -63,16 +66,7 @@ def move_blizzards(
             else:
                 raise AssertionError()
         b_pos[k] = pos
-        coords[pos] = arrow
-    c_b_pos = collections.Counter(b_pos.values())
-    for coord, co in c_b_pos.items():
-        if co != 1:
-            coords[coord] = str(co)
-    for c in (set(coords) - set(b_pos.values())):
-        if coords[c] != '#':
-            coords[c] = '.'
-
-    return coords, b_pos
+    return b_pos
 
 
 def compute(s: str) -> int:
@@ -91,40 +85,32 @@ def compute(s: str) -> int:
     ar, pos = zip(*blizzards)
     b_pos = dict(zip(enumerate(ar), pos))
 
-    seen = set()
+    # blizzards only ever wrap around, so they cycle from the very start
+    step = functools.partial(move_blizzards, coords, bx, by)
+    cycle = support.find_cycle(
+        b_pos, step, key=lambda b_pos: tuple(b_pos.values()),
+    )
     states = []
-    while True:
-        if frozenset(coords.items()) in seen:
-            break
-        else:
-            seen.add(frozenset(coords.items()))
-            states.append(coords)
-        coords, b_pos = move_blizzards(coords, b_pos)
-
-    visited = set()
-    todo = [(0, start)]
-    while todo:
-        t, pos = heapq.heappop(todo)
-        state = states[t % len(states)]
-        # print(f'{t=} {pos=}')
-        # pch({**state, **{pos: 'E'}})
-        if pos == end:
-            return t
-        if (t, pos) in visited:
-            continue
-        if state[pos] != '.':
-            continue
-        else:
-            visited.add((t, pos))
-            neighbors = list(
-                n for n in support.adjacent_4(
-                    *pos,
-                ) if n in coords and states[(t+1) % len(states)][n] == '.'
-            )
-            neighbors.append(pos)
-            for n in neighbors:
-                heapq.heappush(todo, (t + 1, n))
-    return -1
+    for _ in range(cycle.period):
+        states.append(frozenset(b_pos.values()))
+        b_pos = step(b_pos)
+
+    def neighbors(
+            node: tuple[int, tuple[int, int]],
+    ) -> Generator[tuple[int, tuple[int, int]], None, None]:
+        t, pos = node
+        blizzards = states[(t + 1) % len(states)]
+        for n in (*support.adjacent_4(*pos), pos):
+            if n not in blizzards and coords.get(n, '#') != '#':
+                yield t + 1, n
+
+    result = support.bfs(
+        ((0, start),),
+        neighbors,
+        lambda node: node[1] == end,
+        key=lambda node: (node[0] % len(states), node[1]),
+    )
+    return -1 if result is None else result.cost
 
 
 INPUT_S = '''\
@@ -149,14 +135,7 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(compute, INPUT_TXT)
 
 
 if __name__ == '__main__':
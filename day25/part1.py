@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import argparse
 import os.path
+from typing import Iterable
 
 import pytest
 
@@ -57,8 +57,12 @@ def snafu2dec(s: str) -> int:
     return ret
 
 
+def compute_stream(lines: Iterable[str]) -> str:
+    return dec2snafu(sum(snafu2dec(line) for line in lines))
+
+
 def compute(s: str) -> str:
-    return dec2snafu(sum(snafu2dec(line) for line in s.splitlines()))
+    return compute_stream(s.splitlines())
 
 
 INPUT_S = '''\
@@ -90,14 +94,9 @@ def test(input_s: str, expected: int) -> None:
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
-    args = parser.parse_args()
-
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
-
-    return 0
+    return support.part_main(
+        compute, INPUT_TXT, compute_stream=compute_stream,
+    )
 
 
 if __name__ == '__main__':
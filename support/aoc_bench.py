@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any
+from typing import NamedTuple
+from typing import Sequence
+
+import support
+
+
+def format_bytes(n: int) -> str:
+    for unit, scale in (('GiB', 1 << 30), ('MiB', 1 << 20), ('KiB', 1 << 10)):
+        if n >= scale:
+            return f'{n / scale:.1f} {unit}'
+    return f'{n} B'
+
+
+class Memory(NamedTuple):
+    max_rss: int
+    tracemalloc_peak: int
+
+
+class ImportTime(NamedTuple):
+    total: int
+    heaviest: tuple[tuple[str, int], ...]
+
+
+class Result(NamedTuple):
+    part: str
+    times: tuple[int, ...]
+    memory: Memory | None = None
+    import_time: ImportTime | None = None
+    answer: str | None = None
+
+    @property
+    def min(self) -> int:
+        return min(self.times)
+
+    @property
+    def median(self) -> int:
+        return int(statistics.median(self.times))
+
+    @property
+    def p95(self) -> int:
+        return percentile(self.times, 95)
+
+    def to_json(self) -> dict[str, Any]:
+        ret: dict[str, Any] = {
+            'min_ns': self.min,
+            'median_ns': self.median,
+            'p95_ns': self.p95,
+            'runs': len(self.times),
+        }
+        if self.memory is not None:
+            ret['max_rss_bytes'] = self.memory.max_rss
+            ret['tracemalloc_peak_bytes'] = self.memory.tracemalloc_peak
+        if self.import_time is not None:
+            ret['import_ns'] = self.import_time.total
+            ret['heaviest_imports'] = dict(self.import_time.heaviest)
+        return ret
+
+
+METRICS = (
+    ('median_ns', support.format_ns),
+    ('max_rss_bytes', format_bytes),
+    ('tracemalloc_peak_bytes', format_bytes),
+    ('import_ns', support.format_ns),
+)
+IMPORT_TIME_RE = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$')
+IMPORT_START = '# aoc-bench: import start'
+IMPORT_END = '# aoc-bench: import end'
+
+
+def percentile(values: Sequence[int], pct: float) -> int:
+    """nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+def bench_part(
+        part: support.Part,
+        *,
+        warmup: int,
+        repeat: int,
+        func: str = 'compute',
+) -> Result:
+    variant = support.Variant(part, func)
+    compute = support.load_variant(variant)
+    with open(part.input_txt) as f:
+        s = f.read()
+
+    times = []
+    # solutions may print while they work, keep that out of the report
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmup):
+            compute(s)
+            support.clear_memos()
+        for _ in range(repeat):
+            # every run starts cold, rather than timing cache hits
+            support.clear_memos()
+            before = time.perf_counter_ns()
+            answer = compute(s)
+            times.append(time.perf_counter_ns() - before)
+
+    return Result(variant.id, tuple(times), answer=str(answer))
+
+
+def compare_variants(
+        groups: dict[str, list[Result]],
+        failed: dict[str, list[str]],
+) -> tuple[dict[str, str], list[str]]:
+    """the fastest variant of each part, and why the other parts have none
+
+    a part only gets a fastest variant if all of its variants ran (none
+    is in `failed`) and their answers agree.
+    """
+    fastest = {}
+    problems = []
+    for group, results in groups.items():
+        if failed.get(group):
+            problems.append(f'{group}: {", ".join(failed[group])} failed')
+        elif len({r.answer for r in results}) > 1:
+            answers = ', '.join(f'{r.part}={r.answer}' for r in results)
+            problems.append(f'{group}: answers differ: {answers}')
+        elif results:
+            fastest[group] = min(results, key=lambda r: r.median).part
+    return fastest, problems
+
+
+def _measure_memory(part: support.Part) -> Memory:
+    """runs in a fresh interpreter, see `measure_memory`"""
+    mod = support.load_part(part)
+    with open(part.input_txt) as f:
+        s = f.read()
+
+    tracemalloc.start()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        mod.compute(s)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':  # linux reports kilobytes
+        max_rss *= 1024
+    return Memory(max_rss, peak)
+
+
+def measure_memory(part: support.Part) -> Memory:
+    """peak memory of one compute() in a fresh interpreter
+
+    the rss includes the overhead of tracing the allocations.
+    """
+    proc = subprocess.run(
+        (sys.executable, __file__, '--memory-child', part.path),
+        capture_output=True, text=True, check=True,
+    )
+    return Memory(*json.loads(proc.stdout))
+
+
+def _measure_import(part: support.Part) -> int:
+    """runs in a fresh interpreter, see `measure_import`"""
+    print(IMPORT_START, file=sys.stderr, flush=True)
+    before = time.perf_counter_ns()
+    support.load_part(part)
+    t = time.perf_counter_ns() - before
+    print(IMPORT_END, file=sys.stderr, flush=True)
+    return t
+
+
+def parse_importtime(lines: Sequence[str]) -> tuple[tuple[str, int], ...]:
+    """cumulative ns of the outermost imports in `-X importtime` output"""
+    imports = []
+    for line in lines:
+        match = IMPORT_TIME_RE.match(line)
+        if match is not None:
+            imports.append((len(match[2]), match[3], int(match[1]) * 1000))
+    if not imports:
+        return ()
+    outermost = min(depth for depth, _, _ in imports)
+    return tuple(
+        (name, t) for depth, name, t in imports if depth == outermost
+    )
+
+
+def measure_import(part: support.Part, *, top: int = 3) -> ImportTime:
+    """time to import a part (and what it imports) in a fresh interpreter
+
+    support is already imported at that point, everything else a part
+    imports counts against it.
+    """
+    proc = subprocess.run(
+        (
+            sys.executable, '-X', 'importtime',
+            __file__, '--import-child', part.path,
+        ),
+        capture_output=True, text=True, check=True,
+    )
+    lines = proc.stderr.splitlines()
+    window = lines[lines.index(IMPORT_START) + 1:lines.index(IMPORT_END)]
+    heaviest = sorted(parse_importtime(window), key=lambda kv: -kv[1])
+    return ImportTime(int(proc.stdout), tuple(heaviest[:top]))
+
+
+def format_table(
+        results: Sequence[Result],
+        *,
+        answers: bool = False,
+) -> str:
+    width = max((len(r.part) for r in results), default=4)
+    header = f'{"part":<{width}}  {"min":>10}  {"median":>10}  {"p95":>10}'
+    if any(r.memory is not None for r in results):
+        header += f'  {"max rss":>10}  {"py peak":>10}'
+    if any(r.import_time is not None for r in results):
+        header += f'  {"import":>10}  heaviest import'
+    if answers:
+        header += '  answer'
+    lines = [header]
+    for r in results:
+        line = (
+            f'{r.part:<{width}}  '
+            f'{support.format_ns(r.min):>10}  '
+            f'{support.format_ns(r.median):>10}  '
+            f'{support.format_ns(r.p95):>10}'
+        )
+        if r.memory is not None:
+            line += (
+                f'  {format_bytes(r.memory.max_rss):>10}'
+                f'  {format_bytes(r.memory.tracemalloc_peak):>10}'
+            )
+        if r.import_time is not None:
+            line += f'  {support.format_ns(r.import_time.total):>10}'
+            if r.import_time.heaviest:
+                name, t = r.import_time.heaviest[0]
+                line += f'  {name} ({support.format_ns(t)})'
+        if answers:
+            line += f'  {r.answer}'
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def find_regressions(
+        results: Sequence[Result],
+        baseline: dict[str, dict[str, int]],
+        *,
+        tolerance: float,
+) -> list[str]:
+    regressions = []
+    for r in results:
+        if r.part not in baseline:
+            continue
+        current = r.to_json()
+        for metric, fmt in METRICS:
+            if metric not in current or metric not in baseline[r.part]:
+                continue
+            before, after = baseline[r.part][metric], current[metric]
+            if after > before * (1 + tolerance / 100):
+                if before == 0:
+                    change = 'new'
+                else:
+                    change = f'+{(after / before - 1) * 100:.0f}%'
+                regressions.append(
+                    f'{r.part}: {metric} {fmt(before)} -> {fmt(after)} '
+                    f'({change})',
+                )
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'parts', nargs='*',
+        help='restrict to parts, e.g. `day16` or `day16/part2`',
+    )
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--json', action='store_true')
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='also record peak rss and tracemalloc peak of each part, '
+             'measured in a fresh interpreter per part',
+    )
+    parser.add_argument(
+        '--import-time', action='store_true',
+        help='also record how long importing each part takes, '
+             'measured with `-X importtime` in a fresh interpreter per part',
+    )
+    parser.add_argument(
+        '--save-baseline', metavar='FILE',
+        help='write the results as a baseline json file',
+    )
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help='compare median times (and memory) against a saved baseline',
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=10, metavar='PCT',
+        help='allowed slowdown against the baseline (default: %(default)s%%)',
+    )
+    parser.add_argument(
+        '--variants', action='store_true',
+        help='bench the variants of each part (`partN_M.py` and '
+             '`@support.variant` functions) against each other, check '
+             'their answers agree and record the fastest for aoc-run',
+    )
+    parser.add_argument('--memory-child', help=argparse.SUPPRESS)
+    parser.add_argument('--import-child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.memory_child:
+        part = support.Part.from_path(args.memory_child)
+        print(json.dumps(_measure_memory(part)))
+        return 0
+    elif args.import_child:
+        print(_measure_import(support.Part.from_path(args.import_child)))
+        return 0
+
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+    if args.variants and (args.memory or args.import_time):
+        parser.error('--variants only compares times')
+
+    parts = [
+        part for part in support.iter_parts(*args.parts)
+        if os.path.exists(part.input_txt)
+    ]
+    if args.variants:
+        groups = {
+            group: variants
+            for group, variants in support.group_variants(
+                support.iter_variants(parts),
+            ).items()
+            if len(variants) > 1
+        }
+    else:
+        groups = {part.id: [support.Variant(part)] for part in parts}
+
+    ret = 0
+    results = []
+    group_results: dict[str, list[Result]] = {}
+    failed: dict[str, list[str]] = {}
+    for group, variants in groups.items():
+        group_results[group] = []
+        failed[group] = []
+        for v in variants:
+            part = v.part
+            try:
+                result = bench_part(
+                    part, warmup=args.warmup, repeat=args.repeat, func=v.func,
+                )
+                if args.memory:
+                    result = result._replace(memory=measure_memory(part))
+                if args.import_time:
+                    result = result._replace(import_time=measure_import(part))
+            except Exception as e:
+                print(f'{v.id}: {type(e).__name__}: {e}', file=sys.stderr)
+                failed[group].append(v.id)
+                ret = 1
+            else:
+                results.append(result)
+                group_results[group].append(result)
+
+    report = {r.part: r.to_json() for r in results}
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_table(results, answers=args.variants))
+
+    if args.variants:
+        fastest, problems = compare_variants(group_results, failed)
+        for problem in problems:
+            print(f'\033[41mno fastest\033[m {problem}', file=sys.stderr)
+        if problems:
+            ret = 1
+        for group, variant_id in fastest.items():
+            print(f'> {group}: {variant_id} is fastest', file=sys.stderr)
+        if fastest:
+            support.record_fastest(fastest)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(
+            results, baseline, tolerance=args.tolerance,
+        )
+        for regression in regressions:
+            print(f'\033[41mregression\033[m {regression}', file=sys.stderr)
+        if regressions:
+            ret = 1
+
+    return ret
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import sys
+from typing import Generator
+
+import pytest
+
+import aoc_bench
+import support
+
+
+@pytest.fixture
+def fake_root(
+        tmp_path: pathlib.Path,
+) -> Generator[pathlib.Path, None, None]:
+    for day in ('day00', 'day01'):
+        tmp_path.joinpath(day).mkdir()
+        tmp_path.joinpath(day, 'input.txt').write_text('1\n2\n3\n')
+        tmp_path.joinpath(day, 'part1.py').write_text(
+            'def compute(s):\n'
+            '    print("noise")\n'
+            '    return sum(int(x) for x in s.split())\n',
+        )
+    tmp_path.joinpath('day01', 'part2_2.py').write_text(
+        'def compute(s):\n    return 0\n',
+    )
+    tmp_path.joinpath('day01', 'notes.py').write_text('')
+    yield tmp_path
+    for name in ('day01.part1', 'day01.part2', 'day01.part2_2'):
+        sys.modules.pop(name, None)
+
+
+def test_iter_parts(fake_root: pathlib.Path) -> None:
+    parts = list(support.iter_parts(root=str(fake_root)))
+    assert [p.id for p in parts] == ['day01/part1', 'day01/part2_2']
+    assert parts[0].input_txt == str(fake_root / 'day01' / 'input.txt')
+
+
+def test_iter_parts_patterns(fake_root: pathlib.Path) -> None:
+    parts = support.iter_parts('day01/part2_2', root=str(fake_root))
+    assert [p.id for p in parts] == ['day01/part2_2']
+    parts = support.iter_parts('day01/part2', root=str(fake_root))
+    assert [p.id for p in parts] == []
+
+
+def test_percentile() -> None:
+    assert aoc_bench.percentile([5, 1, 4, 2, 3], 50) == 3
+    assert aoc_bench.percentile(list(range(1, 101)), 95) == 95
+    assert aoc_bench.percentile([7], 95) == 7
+
+
+def test_bench_part(
+        fake_root: pathlib.Path,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    part, _ = support.iter_parts(root=str(fake_root))
+    result = aoc_bench.bench_part(part, warmup=1, repeat=3)
+    assert result.part == 'day01/part1'
+    assert len(result.times) == 3
+    assert result.min <= result.median <= result.p95
+    assert capsys.readouterr().out == ''
+
+
+def test_main_json(
+        fake_root: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(support, 'ROOT', str(fake_root))
+    assert aoc_bench.main(['--json', '--repeat', '2', 'day01/part1']) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert list(report) == ['day01/part1']
+    assert report['day01/part1']['runs'] == 2
+
+
+@pytest.mark.parametrize(
+    ('part2_2', 'expected'),
+    (
+        ('def compute(s):\n    return 6\n', 0),
+        ('def compute(s):\n    return 0\n', 1),
+    ),
+)
+def test_main_variants(
+        fake_root: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        part2_2: str,
+        expected: int,
+) -> None:
+    monkeypatch.setattr(support, 'ROOT', str(fake_root))
+    monkeypatch.setenv('AOC_CACHE_DIR', str(fake_root.joinpath('cache')))
+    fake_root.joinpath('day01', 'part2.py').write_text(
+        'import support\n'
+        'def compute(s):\n'
+        '    return sum(int(x) for x in s.split())\n'
+        '@support.variant\n'
+        'def compute_loop(s):\n'
+        '    return sum(int(x) for x in s.split())\n',
+    )
+    fake_root.joinpath('day01', 'part2_2.py').write_text(part2_2)
+
+    ret = aoc_bench.main(['--variants', '--json', '--repeat', '1'])
+    assert ret == expected
+    report = json.loads(capsys.readouterr().out)
+    # day01/part1 has no other variants to compare with
+    assert list(report) == [
+        'day01/part2', 'day01/part2:compute_loop', 'day01/part2_2',
+    ]
+    fastest = support.fastest_variants()
+    if expected == 0:
+        assert fastest['day01/part2'] in report
+    else:
+        assert fastest == {}
+
+
+def test_main_variants_failed(
+        fake_root: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(support, 'ROOT', str(fake_root))
+    monkeypatch.setenv('AOC_CACHE_DIR', str(fake_root.joinpath('cache')))
+    fake_root.joinpath('day01', 'part2.py').write_text(
+        'def compute(s):\n    raise KeyError(1)\n',
+    )
+
+    assert aoc_bench.main(['--variants', '--repeat', '1']) == 1
+    # the one that ran isn't the fastest, it's the only one
+    err = capsys.readouterr().err
+    assert 'day01/part2: KeyError: 1' in err
+    assert 'no fastest\033[m day01/part2: day01/part2 failed' in err
+    assert support.fastest_variants() == {}
+
+
+def test_measure_memory(fake_root: pathlib.Path) -> None:
+    part, _ = support.iter_parts(root=str(fake_root))
+    memory = aoc_bench.measure_memory(part)
+    assert memory.max_rss > memory.tracemalloc_peak > 0
+
+
+def test_parse_importtime() -> None:
+    lines = [
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |     _inner',
+        'import time:        50 |        150 |   pytest',
+        'import time:       900 |       1200 |   numpy',
+        'unrelated',
+    ]
+    assert aoc_bench.parse_importtime(lines) == (
+        ('pytest', 150_000),
+        ('numpy', 1_200_000),
+    )
+    assert aoc_bench.parse_importtime([]) == ()
+
+
+def test_measure_import(fake_root: pathlib.Path) -> None:
+    fake_root.joinpath('day01', 'part1.py').write_text(
+        'import json\n\n\ndef compute(s):\n    return 0\n',
+    )
+    part, _ = support.iter_parts(root=str(fake_root))
+    import_time = aoc_bench.measure_import(part)
+    assert import_time.total > 0
+
+
+def test_find_regressions_memory() -> None:
+    memory = aoc_bench.Memory(max_rss=300, tracemalloc_peak=100)
+    results = [aoc_bench.Result('day01/part1', (1,), memory)]
+    baseline = {
+        'day01/part1': {
+            'median_ns': 1,
+            'max_rss_bytes': 100,
+            'tracemalloc_peak_bytes': 100,
+        },
+    }
+    regressions = aoc_bench.find_regressions(results, baseline, tolerance=10)
+    assert regressions == ['day01/part1: max_rss_bytes 100 B -> 300 B (+200%)']
+
+
+def test_find_regressions_from_zero() -> None:
+    memory = aoc_bench.Memory(max_rss=100, tracemalloc_peak=50)
+    results = [aoc_bench.Result('day01/part1', (1,), memory)]
+    baseline = {'day01/part1': {'tracemalloc_peak_bytes': 0}}
+    regressions = aoc_bench.find_regressions(results, baseline, tolerance=10)
+    assert regressions == [
+        'day01/part1: tracemalloc_peak_bytes 0 B -> 50 B (new)',
+    ]
+
+
+def test_find_regressions() -> None:
+    results = [
+        aoc_bench.Result('day01/part1', (100, 100, 100)),
+        aoc_bench.Result('day01/part2', (200, 200, 200)),
+        aoc_bench.Result('day02/part1', (999, 999, 999)),
+    ]
+    baseline = {
+        'day01/part1': {'median_ns': 95},
+        'day01/part2': {'median_ns': 100},
+    }
+    regressions = aoc_bench.find_regressions(results, baseline, tolerance=10)
+    assert regressions == ['day01/part2: median_ns 100 ns -> 200 ns (+100%)']
+
+
+def test_main_baseline(
+        fake_root: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(support, 'ROOT', str(fake_root))
+    baseline = fake_root.joinpath('baseline.json')
+    assert aoc_bench.main(['--save-baseline', str(baseline)]) == 0
+    args = ['--baseline', str(baseline), '--tolerance', '1e9']
+    assert aoc_bench.main(args) == 0
+
+    report = json.loads(baseline.read_text())
+    report['day01/part1']['median_ns'] = 0.001
+    baseline.write_text(json.dumps(report))
+    assert aoc_bench.main(['--baseline', str(baseline)]) == 1
@@ -0,0 +1,613 @@
+"""generate puzzle-shaped inputs of any size, for measuring how parts scale
+
+`scale` 1 is about the size of a real puzzle input, so `--scale 1000` is an
+input 1000x as big (more lines, or more cells for the 2d days).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import string
+import sys
+from typing import Any
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import Sequence
+
+Lines = Generator[str, None, None]
+
+GENERATORS: dict[int, Callable[[random.Random, float], Iterable[str]]] = {}
+
+
+def generator(
+        day: int,
+) -> Callable[
+    [Callable[[random.Random, float], Lines]],
+    Callable[[random.Random, float], Lines],
+]:
+    def register(
+            func: Callable[[random.Random, float], Lines],
+    ) -> Callable[[random.Random, float], Lines]:
+        GENERATORS[day] = func
+        return func
+    return register
+
+
+def _count(base: int, scale: float) -> int:
+    return max(1, round(base * scale))
+
+
+def _side(base: int, scale: float) -> int:
+    """side of a square-ish board with `scale` times as many cells"""
+    return max(2, round(base * math.sqrt(scale)))
+
+
+def _names(rng: random.Random, n: int, length: int) -> list[str]:
+    names: set[str] = set()
+    while len(names) < n:
+        names.add(''.join(rng.choices(string.ascii_lowercase, k=length)))
+    return sorted(names)
+
+
+@generator(1)
+def day01(rng: random.Random, scale: float) -> Lines:
+    n = _count(2250, scale)
+    i = 0
+    while i < n:
+        if i:
+            yield ''
+        for _ in range(rng.randint(1, 14)):
+            yield str(rng.randint(1000, 60000))
+            i += 1
+
+
+@generator(2)
+def day02(rng: random.Random, scale: float) -> Lines:
+    for _ in range(_count(2500, scale)):
+        yield f'{rng.choice("ABC")} {rng.choice("XYZ")}'
+
+
+@generator(3)
+def day03(rng: random.Random, scale: float) -> Lines:
+    for _ in range(_count(100, scale)):
+        # each elf of a group only uses its own letters plus the badge, so
+        # the badge is the only letter all three have in common
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, rest = letters[0], letters[1:]
+        for pool in (rest[:17], rest[17:34], rest[34:]):
+            shared = rng.choice((badge, *pool))
+            pool = [c for c in pool if c != shared]
+            half = len(pool) // 2
+            left_pool, right_pool = pool[:half], pool[half:]
+            n = rng.randint(4, 24)
+            left = [shared, *rng.choices(left_pool, k=n - 1)]
+            right = [shared, *rng.choices(right_pool, k=n - 1)]
+            if shared != badge:
+                left[1] = badge
+            rng.shuffle(left)
+            rng.shuffle(right)
+            yield ''.join(left + right)
+
+
+@generator(4)
+def day04(rng: random.Random, scale: float) -> Lines:
+    # the ranges get wider along with the number of lines
+    width = _count(99, scale)
+    for _ in range(_count(1000, scale)):
+        l1, l2 = sorted((rng.randint(1, width), rng.randint(1, width)))
+        r1, r2 = sorted((rng.randint(1, width), rng.randint(1, width)))
+        yield f'{l1}-{l2},{r1}-{r2}'
+
+
+@generator(5)
+def day05(rng: random.Random, scale: float) -> Lines:
+    max_height = _count(8, scale) + 1
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, max_height))
+        for _ in range(9)
+    ]
+    height = max(len(stack) for stack in stacks)
+    for y in range(height - 1, -1, -1):
+        yield ''.join(
+            f'[{stack[y]}] ' if y < len(stack) else '    '
+            for stack in stacks
+        )
+    yield ' '.join(f' {i} ' for i in range(1, len(stacks) + 1))
+    yield ''
+
+    # every stack keeps a crate, the answer is the crates on top
+    sizes = [len(stack) for stack in stacks]
+    for _ in range(_count(500, scale)):
+        src = rng.choice([i for i, size in enumerate(sizes) if size > 1])
+        dst = rng.choice([i for i in range(len(sizes)) if i != src])
+        qty = rng.randint(1, min(sizes[src] - 1, 20))
+        sizes[src] -= qty
+        sizes[dst] += qty
+        yield f'move {qty} from {src + 1} to {dst + 1}'
+
+
+@generator(6)
+def day06(rng: random.Random, scale: float) -> Lines:
+    # at most 3 different letters in a row until the markers near the end
+    n = _count(4096, scale)
+    marker_at = n * 9 // 10
+    chars = rng.choices('abc', k=marker_at)
+    chars.extend(rng.sample(string.ascii_lowercase, 14))
+    chars.extend(rng.choices(string.ascii_lowercase, k=max(n - len(chars), 0)))
+    yield ''.join(chars)
+
+
+@generator(7)
+def day07(rng: random.Random, scale: float) -> Lines:
+    n = _count(180, scale)
+    children: list[list[int]] = [[] for _ in range(n)]
+    for i in range(1, n):
+        children[rng.randrange(i)].append(i)
+
+    def names(k: int) -> list[str]:
+        ret: set[str] = set()
+        while len(ret) < k:
+            length = rng.randint(3, 8)
+            name = ''.join(rng.choices(string.ascii_lowercase, k=length))
+            if rng.random() < .5:
+                name += '.' + ''.join(rng.choices(string.ascii_lowercase, k=3))
+            ret.add(name)
+        return list(ret)
+
+    def walk(i: int) -> Lines:
+        files = rng.randint(0, 4)
+        all_names = names(len(children[i]) + files)
+        dir_names = all_names[:len(children[i])]
+        listing = [f'dir {name}' for name in dir_names]
+        listing.extend(
+            f'{rng.randint(1000, 300000)} {name}'
+            for name in all_names[len(children[i]):]
+        )
+        rng.shuffle(listing)
+        yield '$ ls'
+        yield from listing
+        for child, name in zip(children[i], dir_names):
+            yield f'$ cd {name}'
+            yield from walk(child)
+            yield '$ cd ..'
+
+    yield '$ cd /'
+    yield from walk(0)
+
+
+@generator(8)
+def day08(rng: random.Random, scale: float) -> Lines:
+    side = _side(99, scale)
+    for _ in range(side):
+        yield ''.join(rng.choices(string.digits, k=side))
+
+
+@generator(9)
+def day09(rng: random.Random, scale: float) -> Lines:
+    for _ in range(_count(2000, scale)):
+        yield f'{rng.choice("UDLR")} {rng.randint(1, 19)}'
+
+
+@generator(10)
+def day10(rng: random.Random, scale: float) -> Lines:
+    # part 2 draws 240 cycles, so there are always at least that many
+    x = 1
+    for _ in range(max(_count(150, scale), 240)):
+        if rng.random() < .35:
+            yield 'noop'
+        else:
+            n = rng.randint(-10, 10)
+            if not -1 <= x + n <= 40:
+                n = -n
+            x += n
+            yield f'addx {n}'
+
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+
+
+@generator(11)
+def day11(rng: random.Random, scale: float) -> Lines:
+    # like the real inputs one monkey squares, nothing is thrown back to it
+    # so part 1's worry levels (which are never reduced mod anything) stay
+    # reasonably small
+    n = max(_count(8, scale), 4)
+    squares = rng.randrange(n)
+    for i in range(n):
+        if i:
+            yield ''
+        items = ', '.join(
+            str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8))
+        )
+        if i == squares:
+            op = 'old * old'
+        elif rng.random() < .4:
+            op = f'old * {rng.randint(2, 19)}'
+        else:
+            op = f'old + {rng.randint(1, 8)}'
+        targets = [j for j in range(n) if j not in (i, squares)]
+        if_true, if_false = rng.sample(targets, 2)
+        yield f'Monkey {i}:'
+        yield f'  Starting items: {items}'
+        yield f'  Operation: new = {op}'
+        yield f'  Test: divisible by {rng.choice(PRIMES)}'
+        yield f'    If true: throw to monkey {if_true}'
+        yield f'    If false: throw to monkey {if_false}'
+
+
+@generator(12)
+def day12(rng: random.Random, scale: float) -> Lines:
+    # the ground rises a letter at a time from left to right, some squares
+    # are sunk to `a`.  the middle row is never sunk so E can be reached.
+    width, height = _side(159, scale), _side(41, scale)
+    width = max(width, 26)
+    mid = height // 2
+    for y in range(height):
+        row = [
+            'a' if y != mid and rng.random() < .15 else
+            string.ascii_lowercase[x * 26 // width]
+            for x in range(width)
+        ]
+        if y == mid:
+            row[0], row[-1] = 'S', 'E'
+        yield ''.join(row)
+
+
+def _compare(left: Any, right: Any) -> int:
+    if isinstance(left, int) and isinstance(right, int):
+        return (left > right) - (left < right)
+    elif isinstance(left, int):
+        return _compare([left], right)
+    elif isinstance(right, int):
+        return _compare(left, [right])
+    for a, b in zip(left, right):
+        cmp = _compare(a, b)
+        if cmp:
+            return cmp
+    return (len(left) > len(right)) - (len(left) < len(right))
+
+
+def _packet(rng: random.Random, depth: int) -> list[Any]:
+    ret: list[Any] = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < .3:
+            ret.append(_packet(rng, depth + 1))
+        else:
+            ret.append(rng.randint(0, 10))
+    return ret
+
+
+@generator(13)
+def day13(rng: random.Random, scale: float) -> Lines:
+    for i in range(_count(150, scale)):
+        if i:
+            yield ''
+        # the parts can't order packets that compare equal
+        left, right = _packet(rng, 0), _packet(rng, 0)
+        while _compare(left, right) == 0:
+            right = _packet(rng, 0)
+        yield json.dumps(left, separators=(',', ':'))
+        yield json.dumps(right, separators=(',', ':'))
+
+
+@generator(14)
+def day14(rng: random.Random, scale: float) -> Lines:
+    # the parts simulate on fixed size boards, so the cave stays within
+    # x 460-540 and at most 480 deep: more scale means more rock in it
+    depth = min(_side(160, scale), 480)
+    for _ in range(_count(150, scale)):
+        x, y = rng.randint(465, 535), rng.randint(13, depth)
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            if i % 2 == 0:
+                x = min(max(x + rng.randint(-8, 8), 460), 540)
+            else:
+                y = min(max(y + rng.randint(-8, 8), 13), depth)
+            points.append((x, y))
+        yield ' -> '.join(f'{x},{y}' for x, y in points)
+
+
+@generator(15)
+def day15(rng: random.Random, scale: float) -> Lines:
+    # a grid of sensors covers the whole 0-4000000 square, except for the
+    # distress beacon: sensors near it shrink to leave it out and four
+    # sensors diagonal to it cover everything else around it
+    size = 4_000_000
+    per_side = max(round(math.sqrt(26 * scale)) - 1, 1)
+    step = -(-size // per_side)
+    px, py = rng.randint(0, size), rng.randint(0, size)
+
+    sensors = []
+    for i in range(per_side + 1):
+        for j in range(per_side + 1):
+            x, y = i * step, j * step
+            r = min(step, abs(x - px) + abs(y - py) - 1)
+            if r >= 1:
+                sensors.append((x, y, r))
+    a = 2 * step
+    for dx, dy in ((-a, -a), (-a, a), (a, -a), (a, a)):
+        sensors.append((px + dx, py + dy, 2 * a - 1))
+    rng.shuffle(sensors)
+
+    for x, y, r in sensors:
+        dx = rng.randint(0, r)
+        bx = x + dx * rng.choice((-1, 1))
+        by = y + (r - dx) * rng.choice((-1, 1))
+        yield (
+            f'Sensor at x={x}, y={y}: closest beacon is at x={bx}, y={by}'
+        )
+
+
+@generator(16)
+def day16(rng: random.Random, scale: float) -> Lines:
+    # like the real inputs: valves with a flow rate, joined by corridors of
+    # one to three broken valves.  valves are named with two letters, so
+    # there can be at most 676 of them (100 working ones)
+    working = min(_count(15, scale), 100)
+    tunnels: list[set[int]] = [set() for _ in range(working + 1)]
+
+    def connect(i: int, j: int) -> None:
+        prev = i
+        for _ in range(rng.randint(1, 3)):
+            tunnels.append(set())
+            tunnels[prev].add(len(tunnels) - 1)
+            tunnels[-1].add(prev)
+            prev = len(tunnels) - 1
+        tunnels[prev].add(j)
+        tunnels[j].add(prev)
+
+    for i in range(1, working + 1):
+        connect(i, rng.randrange(i))
+    for _ in range(working // 2):
+        connect(*rng.sample(range(working + 1), 2))
+
+    names = [
+        a + b
+        for a in string.ascii_uppercase
+        for b in string.ascii_uppercase
+        if a + b != 'AA'
+    ]
+    names = ['AA', *rng.sample(names, len(tunnels) - 1)]
+    order = list(range(len(tunnels)))
+    rng.shuffle(order)
+    for i in order:
+        flow = rng.randint(1, 25) if 0 < i <= working else 0
+        leads = ', '.join(sorted(names[j] for j in tunnels[i]))
+        if len(tunnels[i]) == 1:
+            leads = f'tunnel leads to valve {leads}'
+        else:
+            leads = f'tunnels lead to valves {leads}'
+        yield f'Valve {names[i]} has flow rate={flow}; {leads}'
+
+
+@generator(17)
+def day17(rng: random.Random, scale: float) -> Lines:
+    yield ''.join(rng.choices('<>', k=_count(10091, scale)))
+
+
+@generator(18)
+def day18(rng: random.Random, scale: float) -> Lines:
+    # a porous ball of cubes.  part 2 only looks at coordinates up to 25,
+    # which a ball scaled much past 2x outgrows
+    radius = 10 * scale ** (1 / 3)
+    side = math.ceil(2 * radius)
+    for x in range(side + 1):
+        for y in range(side + 1):
+            for z in range(side + 1):
+                dist = math.dist((x, y, z), (radius, radius, radius))
+                if dist <= radius and rng.random() < .65:
+                    yield f'{x},{y},{z}'
+
+
+@generator(19)
+def day19(rng: random.Random, scale: float) -> Lines:
+    for i in range(1, _count(30, scale) + 1):
+        yield (
+            f'Blueprint {i}: '
+            f'Each ore robot costs {rng.randint(2, 4)} ore. '
+            f'Each clay robot costs {rng.randint(2, 4)} ore. '
+            f'Each obsidian robot costs {rng.randint(2, 4)} ore '
+            f'and {rng.randint(5, 20)} clay. '
+            f'Each geode robot costs {rng.randint(2, 4)} ore '
+            f'and {rng.randint(7, 20)} obsidian.'
+        )
+
+
+@generator(20)
+def day20(rng: random.Random, scale: float) -> Lines:
+    n = _count(5000, scale)
+    zero_at = rng.randrange(n)
+    for i in range(n):
+        if i == zero_at:
+            yield '0'
+        else:
+            yield str(rng.choice((-1, 1)) * rng.randint(1, 10000))
+
+
+@generator(21)
+def day21(rng: random.Random, scale: float) -> Lines:
+    n_leaves = _count(1350, scale)
+    names = iter(_names(rng, 2 * n_leaves + 2, 4 if n_leaves < 100_000 else 5))
+
+    lines = []
+    # (name, value, (m, c) when humn is below it and value = m * humn + c)
+    pool: list[tuple[str, int, tuple[int, int] | None]] = []
+    humn = rng.randint(1, 1000)
+    pool.append(('humn', humn, (1, 0)))
+    lines.append(f'humn: {humn}')
+    for _ in range(n_leaves - 1):
+        name, value = next(names), rng.randint(1, 20)
+        pool.append((name, value, None))
+        lines.append(f'{name}: {value}')
+
+    limit = 10 ** 12  # keeps part 1's float division exact
+    while len(pool) > 2:
+        i = rng.randrange(len(pool))
+        pool[i], pool[-1] = pool[-1], pool[i]
+        a = pool.pop()
+        i = rng.randrange(len(pool))
+        pool[i], pool[-1] = pool[-1], pool[i]
+        b = pool.pop()
+
+        op = rng.choice('+-*/')
+        # humn is only ever multiplied by a constant, and never divided, so
+        # it is linear in the root's equation
+        if op == '*' and (
+                abs(a[1] * b[1]) > limit or
+                (a[2] or b[2]) and (a[1] if b[2] else b[1]) == 0
+        ):
+            op = '+'
+        elif op == '/' and (a[2] or b[2] or b[1] == 0 or a[1] % b[1]):
+            op = '+'
+        if op in '+-' and abs(a[1] + b[1]) > limit:
+            op = '-' if abs(a[1] - b[1]) <= limit else '+'
+
+        if op == '+':
+            value = a[1] + b[1]
+        elif op == '-':
+            value = a[1] - b[1]
+        elif op == '*':
+            value = a[1] * b[1]
+        else:
+            value = a[1] // b[1]
+        coef = None
+        if a[2] or b[2]:
+            am, ac = a[2] or (0, a[1])
+            bm, bc = b[2] or (0, b[1])
+            if op == '+':
+                coef = (am + bm, ac + bc)
+            elif op == '-':
+                coef = (am - bm, ac - bc)
+            else:  # `*`, one side is a constant
+                coef = (am * bc + bm * ac, ac * bc)
+
+        name = next(names)
+        pool.append((name, value, coef))
+        lines.append(f'{name}: {a[0]} {op} {b[0]}')
+
+    # make the two sides of root equal for some other humn
+    left, right = pool
+    if right[2]:
+        left, right = right, left
+    assert left[2] is not None
+    m, c = left[2]
+    diff = m * rng.randint(1, 10 ** 4) + c - right[1]
+    k, fixed = next(names), next(names)
+    lines.append(f'{k}: {abs(diff)}')
+    lines.append(f'{fixed}: {right[0]} {"+" if diff >= 0 else "-"} {k}')
+    lines.append(f'root: {left[0]} + {fixed}')
+
+    rng.shuffle(lines)
+    yield from lines
+
+
+@generator(22)
+def day22(rng: random.Random, scale: float) -> Lines:
+    # part 2 folds this exact 50x50 face layout, so only the path scales
+    for y in range(200):
+        if y < 50:
+            indent, width = 50, 100
+        elif y < 100:
+            indent, width = 50, 50
+        elif y < 150:
+            indent, width = 0, 100
+        else:
+            indent, width = 0, 50
+        row = [
+            '#' if rng.random() < .1 else '.' for _ in range(width)
+        ]
+        if y == 0:
+            row[0] = '.'
+        yield ' ' * indent + ''.join(row)
+    yield ''
+
+    path = [str(rng.randint(1, 50))]
+    for _ in range(_count(2000, scale)):
+        path.append(rng.choice('LR'))
+        path.append(str(rng.randint(1, 50)))
+    yield ''.join(path)
+
+
+@generator(23)
+def day23(rng: random.Random, scale: float) -> Lines:
+    side = _side(73, scale)
+    for _ in range(side):
+        yield ''.join(rng.choice('.#') for _ in range(side))
+
+
+@generator(24)
+def day24(rng: random.Random, scale: float) -> Lines:
+    width, height = _side(120, scale), _side(25, scale)
+    yield '#.' + '#' * width
+    for y in range(height):
+        row = []
+        for x in range(width):
+            if rng.random() < .3:
+                row.append('.')
+            # nothing may blow up or down into the entrance or the exit
+            elif x in (0, width - 1):
+                row.append(rng.choice('<>'))
+            else:
+                row.append(rng.choice('<>^v'))
+        # the entrance and the exit are always reachable
+        if y == 0:
+            row[0] = '.'
+        elif y == height - 1:
+            row[-1] = '.'
+        yield '#' + ''.join(row) + '#'
+    yield '#' * width + '.#'
+
+
+def _snafu(n: int) -> str:
+    ret = []
+    while n:
+        n, d = divmod(n, 5)
+        if d > 2:
+            n += 1
+            d -= 5
+        ret.append('=-012'[d + 2])
+    return ''.join(reversed(ret)) or '0'
+
+
+@generator(25)
+def day25(rng: random.Random, scale: float) -> Lines:
+    for _ in range(_count(100, scale)):
+        yield _snafu(rng.randint(1, 5 ** rng.randint(1, 20)))
+
+
+def generate(day: int, *, scale: float = 1, seed: int = 0) -> Iterable[str]:
+    return GENERATORS[day](random.Random(seed), scale)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS))
+    parser.add_argument(
+        '--scale', type=float, default=1,
+        help='size relative to a real input (default: %(default)s)',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '-o', '--output', metavar='FILE',
+        help='write the input to FILE instead of stdout',
+    )
+    args = parser.parse_args(argv)
+
+    if args.scale <= 0:
+        parser.error('--scale must be positive')
+
+    lines = generate(args.day, scale=args.scale, seed=args.seed)
+    if args.output:
+        with open(args.output, 'w', buffering=1 << 20) as f:
+            f.writelines(f'{line}\n' for line in lines)
+    else:
+        sys.stdout.writelines(f'{line}\n' for line in lines)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
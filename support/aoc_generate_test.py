@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os.path
+import pathlib
+
+import pytest
+
+import aoc_generate
+import support
+
+
+def _compute(day: int, name: str, s: str) -> object:
+    path = os.path.join(support.ROOT, f'day{day:02}', f'{name}.py')
+    return support.load_part(support.Part.from_path(path)).compute(s)
+
+
+@pytest.mark.parametrize('day', sorted(aoc_generate.GENERATORS))
+def test_generate_is_seeded(day: int) -> None:
+    first = list(aoc_generate.generate(day, scale=.5, seed=1))
+    assert first
+    assert list(aoc_generate.generate(day, scale=.5, seed=1)) == first
+
+
+def test_generate_scales() -> None:
+    small = list(aoc_generate.generate(1, scale=1))
+    big = list(aoc_generate.generate(1, scale=10))
+    assert 9 < len(big) / len(small) < 11
+
+    small = list(aoc_generate.generate(8, scale=1))
+    big = list(aoc_generate.generate(8, scale=100))
+    assert len(big) == 10 * len(small)
+
+
+def test_snafu() -> None:
+    assert aoc_generate._snafu(1) == '1'
+    assert aoc_generate._snafu(2022) == '1=11-2'
+    assert aoc_generate._snafu(314159265) == '1121-1110-1=0'
+
+
+@pytest.mark.parametrize(
+    ('day', 'name'),
+    (
+        (3, 'part1'), (3, 'part2'), (12, 'part1'), (15, 'part1'),
+        (21, 'part1'), (25, 'part1'),
+    ),
+)
+def test_generated_inputs_solve(day: int, name: str) -> None:
+    s = '\n'.join(aoc_generate.generate(day)) + '\n'
+    assert _compute(day, name, s)
+
+
+def test_main(tmp_path: pathlib.Path) -> None:
+    out = tmp_path.joinpath('input.txt')
+    args = ['2', '--scale', '0.01', '--seed', '3', '-o', str(out)]
+    assert aoc_generate.main(args) == 0
+    assert out.read_text().splitlines() == list(
+        aoc_generate.generate(2, scale=.01, seed=3),
+    )
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import json
+import math
+import os
+import sys
+import time
+from typing import NamedTuple
+from typing import Sequence
+
+import support
+
+# the days known to take the longest, scheduled first without timings
+SLOW_DAYS = frozenset((16, 19, 24))
+
+
+class Answer(NamedTuple):
+    part: str
+    answer: str
+    time: int
+    error: str = ''
+    cached: bool = False
+
+
+def run_compute(
+        part: support.Part,
+        s: str,
+        func: str = 'compute',
+) -> Answer:
+    variant = support.Variant(part, func)
+    support.set_parse_cache(True)
+    try:
+        compute = support.load_variant(variant)
+        with open(os.devnull, 'w') as devnull, \
+                contextlib.redirect_stdout(devnull):
+            before = time.perf_counter_ns()
+            answer = compute(s)
+            t = time.perf_counter_ns() - before
+    except Exception as e:
+        return Answer(variant.id, '', 0, f'{type(e).__name__}: {e}')
+    else:
+        return Answer(variant.id, str(answer), t)
+    finally:
+        # workers run many parts, don't let one part's caches pile up
+        support.clear_memos()
+
+
+def run_part(path: str, func: str = 'compute') -> Answer:
+    part = support.Part.from_path(path)
+    try:
+        with open(part.input_txt) as f:
+            s = f.read()
+    except OSError as e:
+        variant_id = support.Variant(part, func).id
+        return Answer(variant_id, '', 0, f'{type(e).__name__}: {e}')
+    return run_compute(part, s, func)
+
+
+def schedule(
+        variants: Sequence[support.Variant],
+        timings: dict[str, int],
+) -> list[support.Variant]:
+    """longest first, so the slowest parts don't start last"""
+    def key(v: support.Variant) -> float:
+        if v.id in timings:
+            return -timings[v.id]
+        elif v.part.day in SLOW_DAYS:
+            return -math.inf
+        else:
+            return 0
+
+    return sorted(variants, key=key)
+
+
+def run_parts(
+        variants: Sequence[support.Variant],
+        *,
+        jobs: int | None,
+        timings: dict[str, int],
+        cache: support.ResultCache | None = None,
+) -> list[Answer]:
+    answers = []
+    todo = []
+    keys = {}
+    for v in variants:
+        if cache is not None:
+            part = v.part
+            key = (
+                part.path if v.func == 'compute' else f'{part.path}:{v.func}',
+                support.source_hash(part),
+                support.file_hash(part.input_txt),
+            )
+            cached = cache.get(*key)
+            if cached is not None:
+                answers.append(
+                    Answer(v.id, cached.answer, cached.time, cached=True),
+                )
+                continue
+            keys[v.id] = key
+        todo.append(v)
+
+    if todo:
+        with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+            futures = [
+                executor.submit(run_part, v.part.path, v.func)
+                for v in schedule(todo, timings)
+            ]
+            for future in futures:
+                answer = future.result()
+                if cache is not None and not answer.error:
+                    result = support.CachedResult(answer.answer, answer.time)
+                    cache.put(*keys[answer.part], result)
+                answers.append(answer)
+
+    return sorted(answers)
+
+
+def format_report(answers: Sequence[Answer]) -> str:
+    width = max((len(a.part) for a in answers), default=4)
+    lines = []
+    for a in answers:
+        if a.error:
+            lines.append(f'{a.part:<{width}}  \033[41merror\033[m {a.error}')
+        else:
+            cached = ' (cached)' if a.cached else ''
+            lines.append(
+                f'{a.part:<{width}}  {support.format_ns(a.time):>10}  '
+                f'{a.answer}{cached}',
+            )
+    return '\n'.join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'parts', nargs='*',
+        help='parts to run, e.g. `day16` or `day16/part2`',
+    )
+    parser.add_argument('--all', action='store_true', help='run every part')
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='worker processes (default: number of cpus)',
+    )
+    parser.add_argument(
+        '--timings', metavar='FILE',
+        help='aoc-bench json used to schedule the slowest parts first',
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='run every part, even if its code and input are unchanged',
+    )
+    parser.add_argument(
+        '--every-variant', action='store_true',
+        help='run every `partN_M.py` module, not only the fastest '
+             'variant of each part (as measured by `aoc-bench --variants`)',
+    )
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    if not args.all and not args.parts:
+        parser.error('pass parts to run or --all')
+
+    timings = {}
+    if args.timings:
+        with open(args.timings) as f:
+            timings = {k: v['median_ns'] for k, v in json.load(f).items()}
+
+    parts = [
+        part for part in support.iter_parts(*args.parts)
+        if os.path.exists(part.input_txt)
+    ]
+    if args.every_variant:
+        variants = [support.Variant(part) for part in parts]
+    else:
+        variants = support.pick_fastest(parts, support.fastest_variants())
+
+    before = time.perf_counter_ns()
+    if args.no_cache:
+        answers = run_parts(variants, jobs=args.jobs, timings=timings)
+    else:
+        with support.ResultCache() as cache:
+            answers = run_parts(
+                variants, jobs=args.jobs, timings=timings, cache=cache,
+            )
+    wall = time.perf_counter_ns() - before
+
+    if args.json:
+        print(json.dumps([a._asdict() for a in answers], indent=2))
+    else:
+        print(format_report(answers))
+        total = sum(a.time for a in answers)
+        print(
+            f'> {support.format_ns(wall)} wall '
+            f'({support.format_ns(total)} summed over {len(answers)} parts)',
+            file=sys.stderr,
+        )
+
+    return int(any(a.error for a in answers))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
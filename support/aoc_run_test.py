@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+
+import aoc_run
+import support
+
+
+@pytest.fixture
+def fake_root(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> pathlib.Path:
+    for day in ('day01', 'day16'):
+        tmp_path.joinpath(day).mkdir()
+        tmp_path.joinpath(day, 'input.txt').write_text('1\n2\n3\n')
+    tmp_path.joinpath('day01', 'part1.py').write_text(
+        'def compute(s):\n    return sum(int(x) for x in s.split())\n',
+    )
+    tmp_path.joinpath('day16', 'part1.py').write_text(
+        'def compute(s):\n    raise ValueError("nope")\n',
+    )
+    monkeypatch.setattr(support, 'ROOT', str(tmp_path))
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path.joinpath('cache')))
+    return tmp_path
+
+
+def _part(day: int, name: str) -> support.Variant:
+    return support.Variant(support.Part(day, name, f'day{day:02}/{name}.py'))
+
+
+def test_schedule_slow_days_first() -> None:
+    parts = [_part(1, 'part1'), _part(16, 'part1'), _part(2, 'part1')]
+    ordered = aoc_run.schedule(parts, {})
+    assert [p.id for p in ordered] == [
+        'day16/part1', 'day01/part1', 'day02/part1',
+    ]
+
+
+def test_schedule_by_timings() -> None:
+    parts = [_part(1, 'part1'), _part(16, 'part1'), _part(2, 'part1')]
+    timings = {'day01/part1': 5, 'day02/part1': 10, 'day16/part1': 1}
+    ordered = aoc_run.schedule(parts, timings)
+    assert [p.id for p in ordered] == [
+        'day02/part1', 'day01/part1', 'day16/part1',
+    ]
+
+
+def test_main(
+        fake_root: pathlib.Path,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert aoc_run.main(['--all', '--json', '--jobs', '2']) == 1
+    answers = json.loads(capsys.readouterr().out)
+    assert [(a['part'], a['answer'], a['error']) for a in answers] == [
+        ('day01/part1', '6', ''),
+        ('day16/part1', '', 'ValueError: nope'),
+    ]
+
+
+def test_main_cached(
+        fake_root: pathlib.Path,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    def run() -> list[tuple[str, bool]]:
+        aoc_run.main(['day01', '--json'])
+        return [
+            (a['answer'], a['cached'])
+            for a in json.loads(capsys.readouterr().out)
+        ]
+
+    assert run() == [('6', False)]
+    assert run() == [('6', True)]
+    fake_root.joinpath('day01', 'input.txt').write_text('4\n')
+    assert run() == [('4', False)]
+
+
+def test_main_requires_parts(fake_root: pathlib.Path) -> None:
+    with pytest.raises(SystemExit):
+        aoc_run.main([])
+
+
+def test_main_picks_fastest(
+        fake_root: pathlib.Path,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    fake_root.joinpath('day01', 'part1_2.py').write_text(
+        'def compute(s):\n    return 6\n',
+    )
+    support.record_fastest({'day01/part1': 'day01/part1_2'})
+
+    aoc_run.main(['day01', '--json'])
+    answers = json.loads(capsys.readouterr().out)
+    assert [a['part'] for a in answers] == ['day01/part1_2']
+
+    aoc_run.main(['day01', '--json', '--every-variant'])
+    answers = json.loads(capsys.readouterr().out)
+    assert [a['part'] for a in answers] == ['day01/part1', 'day01/part1_2']
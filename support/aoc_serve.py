@@ -0,0 +1,181 @@
+"""a long lived solver: every part stays imported in a pool of workers
+
+ask it over http (on localhost, or a unix socket with --socket):
+
+    curl --data-binary @input.txt localhost:8022/day16/part1
+
+the response is json: the answer, how long compute() took (`time`) and
+how long the request took including waiting for a worker (`wall`), both
+in nanoseconds.  `GET /parts` lists the parts it can run.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import functools
+import http.server
+import json
+import multiprocessing
+import multiprocessing.synchronize
+import os
+import socketserver
+import sys
+import time
+from typing import Any
+from typing import NamedTuple
+from typing import Sequence
+
+import aoc_run
+import support
+
+PORT = 8022
+# see `make_executor`, set in each worker
+_started: multiprocessing.synchronize.Barrier | None = None
+
+
+class State(NamedTuple):
+    executor: concurrent.futures.Executor
+    parts: dict[str, support.Part]
+
+
+def _warm(
+        paths: Sequence[str],
+        started: multiprocessing.synchronize.Barrier,
+) -> None:
+    """runs once in each worker, so requests don't pay for imports"""
+    global _started
+    _started = started
+    for path in paths:
+        try:
+            support.load_part(support.Part.from_path(path))
+        except Exception:
+            pass  # reported when the part is asked for
+
+
+def _wait_for_workers() -> None:
+    """holds its worker until every worker has taken one of these"""
+    assert _started is not None
+    _started.wait(timeout=60)
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def __init__(self, state: State, *args: Any, **kwargs: Any) -> None:
+        self.state = state
+        super().__init__(*args, **kwargs)
+
+    def _respond(self, status: int, body: object) -> None:
+        data = json.dumps(body).encode() + b'\n'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == '/parts':
+            self._respond(200, sorted(self.state.parts))
+        else:
+            self._respond(404, {'error': f'not found: {self.path}'})
+
+    def do_POST(self) -> None:
+        part = self.state.parts.get(self.path.strip('/'))
+        if part is None:
+            self._respond(404, {'error': f'no such part: {self.path}'})
+            return
+        length = int(self.headers.get('Content-Length', 0))
+        s = self.rfile.read(length).decode()
+
+        before = time.perf_counter_ns()
+        future = self.state.executor.submit(aoc_run.run_compute, part, s)
+        answer = future.result()
+        ret = answer._asdict()
+        del ret['cached']
+        ret['wall'] = time.perf_counter_ns() - before
+        self._respond(500 if answer.error else 200, ret)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        print(f'> {format % args}', file=sys.stderr)
+
+
+class _UnixHTTPServer(
+        socketserver.ThreadingMixIn,
+        socketserver.UnixStreamServer,
+):
+    daemon_threads = True
+
+
+def make_server(
+        state: State,
+        *,
+        port: int = PORT,
+        socket_path: str | None = None,
+) -> socketserver.TCPServer:
+    """one thread per connection, the answers come from the worker pool"""
+    handler = functools.partial(Handler, state)
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        return _UnixHTTPServer(socket_path, handler)
+    else:
+        return http.server.ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+
+def make_executor(
+        parts: Sequence[support.Part],
+        *,
+        jobs: int | None,
+) -> concurrent.futures.ProcessPoolExecutor:
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    started = multiprocessing.Barrier(jobs)
+    executor = concurrent.futures.ProcessPoolExecutor(
+        jobs, initializer=_warm, initargs=([p.path for p in parts], started),
+    )
+    # start (and warm) every worker now rather than on the first requests:
+    # none of these returns before each worker has one, so no worker can
+    # drain them all while the others are still starting
+    for future in [executor.submit(_wait_for_workers) for _ in range(jobs)]:
+        future.result()
+    return executor
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'parts', nargs='*',
+        help='restrict to parts, e.g. `day16` or `day16/part2`',
+    )
+    parser.add_argument(
+        '--port', type=int, default=PORT,
+        help='localhost port to listen on (default: %(default)s)',
+    )
+    parser.add_argument(
+        '--socket', metavar='PATH',
+        help='listen on a unix socket instead of a port',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='worker processes (default: number of cpus)',
+    )
+    args = parser.parse_args(argv)
+
+    parts = list(support.iter_parts(*args.parts))
+    with make_executor(parts, jobs=args.jobs) as executor:
+        state = State(executor, {part.id: part for part in parts})
+        with make_server(
+                state, port=args.port, socket_path=args.socket,
+        ) as server:
+            where = args.socket or f'http://127.0.0.1:{args.port}'
+            print(f'> serving {len(parts)} parts on {where}', file=sys.stderr)
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if args.socket:
+                    os.remove(args.socket)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import contextlib
+import http.client
+import json
+import os
+import pathlib
+import socket
+import sys
+import threading
+from typing import Any
+from typing import Generator
+
+import pytest
+
+import aoc_serve
+import support
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str) -> None:
+        super().__init__('localhost')
+        self.path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+@pytest.fixture
+def state(tmp_path: pathlib.Path) -> Generator[aoc_serve.State, None, None]:
+    for day in ('day01', 'day02'):
+        tmp_path.joinpath(day).mkdir()
+    tmp_path.joinpath('day01', 'part1.py').write_text(
+        'def compute(s):\n'
+        '    print("noise")\n'
+        '    return sum(int(x) for x in s.split())\n',
+    )
+    tmp_path.joinpath('day02', 'part1.py').write_text(
+        'def compute(s):\n    raise ValueError("nope")\n',
+    )
+    parts = list(support.iter_parts(root=str(tmp_path)))
+    with aoc_serve.make_executor(parts, jobs=2) as executor:
+        yield aoc_serve.State(executor, {p.id: p for p in parts})
+
+
+def _loaded() -> tuple[int, bool]:
+    return os.getpid(), 'day01.part1' in sys.modules
+
+
+def test_make_executor_warms_every_worker(state: aoc_serve.State) -> None:
+    futures = [state.executor.submit(_loaded) for _ in range(20)]
+    results = {future.result() for future in futures}
+    assert all(loaded for _, loaded in results)
+    assert len(state.executor._processes) == 2  # type: ignore[attr-defined]
+
+
+@contextlib.contextmanager
+def _serve(
+        state: aoc_serve.State,
+        **kwargs: Any,
+) -> Generator[Any, None, None]:
+    with aoc_serve.make_server(state, **kwargs) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            yield server.server_address
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def _request(
+        conn: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: str | None = None,
+) -> tuple[int, Any]:
+    conn.request(method, path, body)
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read())
+
+
+def test_serve_http(state: aoc_serve.State) -> None:
+    with _serve(state, port=0) as (host, port):
+        conn = http.client.HTTPConnection(host, port)
+
+        assert _request(conn, 'GET', '/parts') == (
+            200, ['day01/part1', 'day02/part1'],
+        )
+
+        # the same connection serves many requests
+        for body, expected in (('1 2 3\n', '6'), ('4\n', '4')):
+            status, ret = _request(conn, 'POST', '/day01/part1', body)
+            assert status == 200
+            assert ret['part'] == 'day01/part1'
+            assert ret['answer'] == expected
+            assert ret['error'] == ''
+            assert ret['wall'] >= ret['time'] > 0
+
+        status, ret = _request(conn, 'POST', '/day02/part1', '1\n')
+        assert (status, ret['error']) == (500, 'ValueError: nope')
+
+        status, _ = _request(conn, 'POST', '/day03/part1', '1\n')
+        assert status == 404
+
+
+def test_serve_unix_socket(
+        state: aoc_serve.State,
+        tmp_path: pathlib.Path,
+) -> None:
+    socket_path = str(tmp_path.joinpath('aoc.sock'))
+    with _serve(state, socket_path=socket_path):
+        conn = UnixHTTPConnection(socket_path)
+        status, ret = _request(conn, 'POST', '/day01/part1', '1 2\n')
+        assert (status, ret['answer']) == (200, '3')
@@ -1,37 +1,221 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import bisect
+import collections
+import concurrent.futures
 import contextlib
+import cProfile
 import enum
+import functools
+import hashlib
+import heapq
+import http.client
+import importlib.util
+import itertools
+import json
+import marshal
 import os.path
+import pstats
+import random
 import re
+import sqlite3
 import sys
 import time
+import tracemalloc
 import urllib.error
 import urllib.parse
 import urllib.request
+import weakref
+from types import ModuleType
+from typing import Any
+from typing import Callable
 from typing import Generator
+from typing import Generic
+from typing import Hashable
+from typing import IO
 from typing import Iterable
 from typing import NamedTuple
+from typing import Protocol
+from typing import TypeVar
+from typing import cast
+from typing import overload
+
+T = TypeVar('T')
+R = TypeVar('R')
+T_co = TypeVar('T_co', covariant=True)
+CallableT = TypeVar('CallableT', bound=Callable[..., object])
 
 HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+AOC_URL = 'https://adventofcode.com'
+READ_BUFFER = 1 << 20
 
 
-@contextlib.contextmanager
-def timing(name: str = '') -> Generator[None, None, None]:
-    before = time.time()
-    try:
-        yield
-    finally:
-        after = time.time()
-        t = (after - before) * 1000
-        unit = 'ms'
-        if t < 100:
-            t *= 1000
-            unit = 'μs'
-        if name:
-            name = f' ({name})'
-        print(f'> {int(t)} {unit}{name}', file=sys.stderr, flush=True)
+def format_ns(ns: int) -> str:
+    for unit, scale in (('s', 10 ** 9), ('ms', 10 ** 6), ('μs', 10 ** 3)):
+        if ns >= scale:
+            return f'{ns / scale:.2f} {unit}'
+    return f'{ns} ns'
+
+
+class TimingStats:
+    __slots__ = ('count', 'total', 'min', 'max')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min = sys.maxsize
+        self.max = 0
+
+    def add(self, ns: int) -> None:
+        self.count += 1
+        self.total += ns
+        if ns < self.min:
+            self.min = ns
+        if ns > self.max:
+            self.max = ns
+
+    @property
+    def mean(self) -> int:
+        return self.total // self.count
+
+
+TIMINGS: dict[str, TimingStats] = {}
+_sections: list[_Timer] = []
+_summary_registered = False
+
+
+def format_timings() -> str:
+    width = max((len(name) for name in TIMINGS), default=7)
+    lines = [
+        f'{"section":<{width}}  {"count":>8}  {"total":>10}  '
+        f'{"mean":>10}  {"min":>10}  {"max":>10}',
+    ]
+    for name, stats in TIMINGS.items():
+        lines.append(
+            f'{name:<{width}}  {stats.count:>8}  '
+            f'{format_ns(stats.total):>10}  {format_ns(stats.mean):>10}  '
+            f'{format_ns(stats.min):>10}  {format_ns(stats.max):>10}',
+        )
+    return '\n'.join(lines)
+
+
+def _print_timings() -> None:
+    if TIMINGS:
+        print(format_timings(), file=sys.stderr, flush=True)
+
+
+class _Timer:
+    __slots__ = ('name', 'quiet', 'before')
+
+    def __init__(self, name: str, quiet: bool) -> None:
+        self.name = name
+        self.quiet = quiet
+
+    def __enter__(self) -> None:
+        global _summary_registered
+        if self.quiet and not _summary_registered:
+            atexit.register(_print_timings)
+            _summary_registered = True
+        _sections.append(self)
+        self.before = time.perf_counter_ns()
+
+    def __exit__(self, *args: object) -> None:
+        t = time.perf_counter_ns() - self.before
+        key = '/'.join(timer.name for timer in _sections if timer.name)
+        key = key or '<total>'
+        _sections.pop()
+        try:
+            stats = TIMINGS[key]
+        except KeyError:
+            stats = TIMINGS[key] = TimingStats()
+        stats.add(t)
+        if not self.quiet:
+            name = '' if key == '<total>' else f' ({key})'
+            print(f'> {format_ns(t)}{name}', file=sys.stderr, flush=True)
+
+
+def timing(name: str = '', *, quiet: bool = False) -> _Timer:
+    """time a block, nested blocks are recorded as `outer/inner`
+
+    every block is aggregated into `TIMINGS`.  quiet blocks skip the
+    per-call print and the aggregate table is printed at exit instead.
+    """
+    return _Timer(name, quiet)
+
+
+def reset_timings() -> None:
+    TIMINGS.clear()
+
+
+def _parse_trace_levels(spec: str) -> dict[str, int]:
+    """`day05=2,day12` -> {'day05': 2, 'day12': 1}, a bare level is `*`"""
+    ret = {}
+    for part in filter(None, spec.split(',')):
+        name, _, level_s = part.strip().partition('=')
+        if name.isdigit():
+            name, level_s = '*', name
+        ret[name] = int(level_s or 1)
+    return ret
+
+
+TRACE_LEVELS = _parse_trace_levels(os.environ.get('AOC_TRACE', ''))
+_tracers: list[Tracer] = []
+_trace_file: IO[str] | None = None
+
+
+class Tracer:
+    """debug output of one day, silent unless its level is turned up
+
+    levels come from `AOC_TRACE` (e.g. `AOC_TRACE=day05=2,day12`) or a
+    part's `--trace`.  anything costly to format should be guarded so a
+    disabled tracer costs one attribute check::
+
+        if trace.level >= 2:
+            trace(format_grid(grid), level=2)
+    """
+    __slots__ = ('day', 'level')
+
+    def __init__(self, day: str) -> None:
+        self.day = day
+        self.level = TRACE_LEVELS.get(day, TRACE_LEVELS.get('*', 0))
+
+    def __call__(self, *args: object, level: int = 1) -> None:
+        if self.level >= level:
+            print(*args, file=_trace_file or sys.stderr)
+
+
+def _day_of(path: str) -> str:
+    return os.path.basename(os.path.dirname(os.path.abspath(path)))
+
+
+def tracer(path: str) -> Tracer:
+    """the tracer of the day `path` (usually `__file__`) belongs to"""
+    ret = Tracer(_day_of(path))
+    _tracers.append(ret)
+    return ret
+
+
+def set_trace_level(day: str, level: int) -> None:
+    TRACE_LEVELS[day] = level
+    for t in _tracers:
+        if day in ('*', t.day):
+            t.level = level
+
+
+def trace_to(path: str | None) -> None:
+    """send traces to a (buffered) file instead of stderr, None to undo"""
+    global _trace_file
+    if _trace_file is not None:
+        _trace_file.close()
+        atexit.unregister(_trace_file.close)
+        _trace_file = None
+    if path is not None:
+        _trace_file = open(path, 'w', buffering=1 << 20)
+        atexit.register(_trace_file.close)
 
 
 def _get_cookie_headers() -> dict[str, str]:
@@ -40,10 +224,66 @@ def _get_cookie_headers() -> dict[str, str]:
     return {'Cookie': contents}
 
 
-def get_input(year: int, day: int) -> str:
-    url = f'https://adventofcode.com/{year}/day/{day}/input'
+def cache_dir() -> str:
+    if os.environ.get('AOC_CACHE_DIR'):
+        return os.environ['AOC_CACHE_DIR']
+    xdg = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(xdg, 'aoc')
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _input_paths(year: int, day: int) -> tuple[str, str]:
+    """the (year, day) index file and the content-addressed objects dir"""
+    base = os.path.join(cache_dir(), 'inputs')
+    index = os.path.join(base, str(year), f'{day:02}')
+    return index, os.path.join(base, 'objects')
+
+
+def _cached_input(year: int, day: int) -> str | None:
+    index, objects = _input_paths(year, day)
+    try:
+        with open(index) as f:
+            digest = f.read().strip()
+        with open(os.path.join(objects, digest), 'rb') as fb:
+            data = fb.read()
+    except OSError:
+        return None
+
+    if hashlib.sha256(data).hexdigest() != digest:
+        # corrupt object: drop it and fetch again
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(objects, digest))
+        return None
+
+    return data.decode()
+
+
+def _store_input(year: int, day: int, s: str) -> None:
+    index, objects = _input_paths(year, day)
+    data = s.encode()
+    digest = hashlib.sha256(data).hexdigest()
+    _write_atomic(os.path.join(objects, digest), data)
+    _write_atomic(index, f'{digest}\n'.encode())
+
+
+def get_input(year: int, day: int, *, refresh: bool = False) -> str:
+    if not refresh:
+        cached = _cached_input(year, day)
+        if cached is not None:
+            return cached
+
+    url = f'{AOC_URL}/{year}/day/{day}/input'
     req = urllib.request.Request(url, headers=_get_cookie_headers())
-    return urllib.request.urlopen(req).read().decode()
+    s = urllib.request.urlopen(req).read().decode()
+    _store_input(year, day, s)
+    return s
 
 
 def get_year_day() -> tuple[int, int]:
@@ -57,25 +297,227 @@ def get_year_day() -> tuple[int, int]:
     return int(year_s[len('aoc'):]), int(day_s[len('day'):])
 
 
+def _backoff(attempt: int, base: float) -> float:
+    """exponential backoff with (full) jitter, so retries don't line up"""
+    return random.uniform(0, base * 2 ** attempt)
+
+
+# not unlocked yet, rate limited or a server hiccup: worth trying again
+RETRY_STATUS = frozenset((404, 429, 500, 502, 503, 504))
+
+
+class HTTPStatusError(Exception):
+    def __init__(self, status: int, path: str) -> None:
+        super().__init__(f'HTTP {status}: {path}')
+        self.status = status
+
+
+class _AocConnection:
+    """one keep-alive connection to adventofcode.com for many requests"""
+
+    def __init__(self, url: str) -> None:
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme == 'https':
+            self.conn: http.client.HTTPConnection = (
+                http.client.HTTPSConnection(parsed.netloc)
+            )
+        else:
+            self.conn = http.client.HTTPConnection(parsed.netloc)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _request(
+            self,
+            method: str,
+            path: str,
+            body: str | None,
+            headers: dict[str, str],
+    ) -> bytes:
+        reused = self.conn.sock is not None
+        try:
+            self.conn.request(method, path, body, headers)
+            resp = self.conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError):
+            self.conn.close()
+            if not reused:
+                raise
+            # the server dropped the idle connection before our request
+            self.conn.request(method, path, body, headers)
+            resp = self.conn.getresponse()
+        contents = resp.read()
+        if resp.status != 200:
+            raise HTTPStatusError(resp.status, path)
+        return contents
+
+    def get(self, path: str) -> bytes:
+        return self._request('GET', path, None, _get_cookie_headers())
+
+    def post(self, path: str, params: dict[str, object]) -> str:
+        body = urllib.parse.urlencode(params)
+        headers = {
+            **_get_cookie_headers(),
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }
+        return self._request('POST', path, body, headers).decode()
+
+
+class Download(NamedTuple):
+    day: int
+    input: str = ''
+    error: str = ''
+
+
+async def _download_inputs(
+        year: int,
+        days: Iterable[int],
+        *,
+        jobs: int,
+        retries: int,
+        backoff: float,
+        refresh: bool,
+) -> list[Download]:
+    days_iter = iter(days)
+    ret = []
+
+    async def fetch(conn: _AocConnection, day: int) -> Download:
+        if not refresh:
+            cached = _cached_input(year, day)
+            if cached is not None:
+                return Download(day, cached)
+        error = ''
+        for attempt in range(1 + retries):
+            if attempt:
+                await asyncio.sleep(_backoff(attempt - 1, backoff))
+            path = f'/{year}/day/{day}/input'
+            try:
+                s = (await asyncio.to_thread(conn.get, path)).decode()
+            except HTTPStatusError as e:
+                error = str(e)
+                if e.status not in RETRY_STATUS:
+                    break
+            except (OSError, http.client.HTTPException) as e:
+                # dropped, or a garbled response: start over on a new one
+                conn.close()
+                error = f'{type(e).__name__}: {e}'
+            else:
+                _store_input(year, day, s)
+                return Download(day, s)
+        return Download(day, error=error)
+
+    async def worker() -> None:
+        # each worker keeps one connection open (its requests block in a
+        # thread), and the days are shared out as workers become free
+        conn = _AocConnection(AOC_URL)
+        try:
+            for day in days_iter:
+                ret.append(await fetch(conn, day))
+        finally:
+            conn.close()
+
+    await asyncio.gather(*(worker() for _ in range(jobs)))
+    return sorted(ret)
+
+
+def download_inputs(
+        year: int,
+        days: Iterable[int],
+        *,
+        jobs: int = 4,
+        retries: int = 5,
+        backoff: float = 1,
+        refresh: bool = False,
+) -> list[Download]:
+    """download many days at once, over `jobs` concurrent connections
+
+    failed requests are retried up to `retries` times with exponential
+    backoff (starting around `backoff` seconds), the downloads that still
+    fail have an `error`.
+    """
+    return asyncio.run(
+        _download_inputs(
+            year, days,
+            jobs=jobs, retries=retries, backoff=backoff, refresh=refresh,
+        ),
+    )
+
+
+def _get_year_dir() -> tuple[int, str]:
+    """the year and its directory, from either it or one of its days"""
+    cwd = os.getcwd()
+    if DAY_RE.match(os.path.basename(cwd)):
+        cwd = os.path.dirname(cwd)
+    year_s = os.path.basename(cwd)
+    if not year_s.startswith('aoc'):
+        raise AssertionError(f'unexpected working dir: {cwd}')
+    return int(year_s[len('aoc'):]), cwd
+
+
+def _download_many(
+        days: list[int] | None,
+        *,
+        jobs: int,
+        refresh: bool,
+) -> int:
+    year, year_dir = _get_year_dir()
+    if days is None:
+        days = [
+            int(match[1])
+            for match in map(DAY_RE.match, sorted(os.listdir(year_dir)))
+            if match is not None and match[1] != '00'
+        ]
+
+    ret = 0
+    for download in download_inputs(year, days, jobs=jobs, refresh=refresh):
+        if download.error:
+            print(f'day{download.day:02}: \033[41m{download.error}\033[m')
+            ret = 1
+        else:
+            path = os.path.join(year_dir, f'day{download.day:02}', 'input.txt')
+            _write_atomic(path, download.input.encode())
+            n = len(download.input.splitlines())
+            print(f'day{download.day:02}: {n} lines')
+    return ret
+
+
 def download_input() -> int:
     parser = argparse.ArgumentParser()
-    parser.parse_args()
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help='ignore the local input cache and download again',
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        '--all', action='store_true',
+        help='download every day that has a directory, run from the year',
+    )
+    mode.add_argument(
+        '--days', type=int, nargs='+', metavar='DAY',
+        help='download these days, run from the year',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=4,
+        help='concurrent downloads for --all / --days (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    if args.all or args.days:
+        return _download_many(args.days, jobs=args.jobs, refresh=args.refresh)
 
     year, day = get_year_day()
 
     for i in range(5):
         try:
-            s = get_input(year, day)
+            s = get_input(year, day, refresh=args.refresh)
         except urllib.error.URLError as e:
             print(f'zzz: not ready yet: {e}')
-            time.sleep(1)
+            time.sleep(_backoff(i, 1))
         else:
             break
     else:
         raise SystemExit('timed out after attempting many times')
 
-    with open('input.txt', 'w') as f:
-        f.write(s)
+    _write_atomic(os.path.abspath('input.txt'), s.encode())
 
     lines = s.splitlines()
     if len(lines) > 10:
@@ -98,7 +540,7 @@ ALREADY_DONE = re.compile(r"You don't seem to be solving.*\?")
 def _post_answer(year: int, day: int, part: int, answer: int) -> str:
     params = urllib.parse.urlencode({'level': part, 'answer': answer})
     req = urllib.request.Request(
-        f'https://adventofcode.com/{year}/day/{day}/answer',
+        f'{AOC_URL}/{year}/day/{day}/answer',
         method='POST',
         data=params.encode(),
         headers=_get_cookie_headers(),
@@ -108,31 +550,206 @@ def _post_answer(year: int, day: int, part: int, answer: int) -> str:
     return resp.read().decode()
 
 
-def submit_solution() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--part', type=int, required=True)
-    args = parser.parse_args()
+WAIT = re.compile(r'You have (?:(\d+)m )?(\d+)s left to wait')
 
-    year, day = get_year_day()
-    answer = int(sys.stdin.read())
 
-    print(f'answer: {answer}')
+class Submission(NamedTuple):
+    year: int
+    day: int
+    part: int
+    answer: int
 
-    contents = _post_answer(year, day, args.part, answer)
 
-    for error_regex in (WRONG, TOO_QUICK, ALREADY_DONE):
-        error_match = error_regex.search(contents)
-        if error_match:
-            print(f'\033[41m{error_match[0]}\033[m')
-            return 1
+class SubmitResult(NamedTuple):
+    submission: Submission
+    verdict: str  # right, wrong, done, too quick or unknown
+    message: str
+    cached: bool = False
 
-    if RIGHT in contents:
-        print(f'\033[42m{RIGHT}\033[m')
-        return 0
+
+class SubmissionLog:
+    """the verdicts of answers already submitted
+
+    an answer that was accepted (or rejected) is never worth sending again,
+    and once a part is solved every other answer to it is wrong.  "done"
+    isn't remembered: aoc says the same for a part that is still locked.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        if path is None:
+            path = os.path.join(cache_dir(), 'submissions.sqlite')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS submissions ('
+            '    year INTEGER NOT NULL,'
+            '    day INTEGER NOT NULL,'
+            '    part INTEGER NOT NULL,'
+            '    answer TEXT NOT NULL,'
+            '    verdict TEXT NOT NULL,'
+            '    message TEXT NOT NULL,'
+            '    PRIMARY KEY (year, day, part, answer)'
+            ')',
+        )
+
+    def __enter__(self) -> SubmissionLog:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.db.close()
+
+    def get(self, sub: Submission) -> SubmitResult | None:
+        rows = self.db.execute(
+            'SELECT answer, verdict, message FROM submissions '
+            'WHERE year = ? AND day = ? AND part = ?',
+            sub[:3],
+        ).fetchall()
+        for answer, verdict, message in rows:
+            if answer == str(sub.answer):
+                return SubmitResult(sub, verdict, message, cached=True)
+        for answer, verdict, message in rows:
+            if verdict == 'right':
+                message = f'already solved with {answer}'
+                return SubmitResult(sub, 'wrong', message, cached=True)
+        return None
+
+    def put(self, result: SubmitResult) -> None:
+        sub = result.submission
+        with self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO submissions VALUES (?, ?, ?, ?, ?, ?)',
+                (*sub[:3], str(sub.answer), result.verdict, result.message),
+            )
+
+
+class SubmitQueue:
+    """submit answers in order, waiting out the rate limit when told to
+
+    a "too quick" response says how long to wait, the answer is submitted
+    again after that, and other answers to the same day wait too rather
+    than being throttled in turn.
+    """
+
+    def __init__(
+            self,
+            log: SubmissionLog,
+            *,
+            retries: int = 5,
+            sleep: Callable[[float], None] = time.sleep,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.log = log
+        self.retries = retries
+        self.sleep = sleep
+        self.clock = clock
+        self.not_before: dict[tuple[int, int], float] = {}
+        self._conn = _AocConnection(AOC_URL)
+
+    def __enter__(self) -> SubmitQueue:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._conn.close()
+
+    def _post(self, sub: Submission) -> SubmitResult | float:
+        """the result, or how many seconds to wait before trying again"""
+        contents = self._conn.post(
+            f'/{sub.year}/day/{sub.day}/answer',
+            {'level': sub.part, 'answer': sub.answer},
+        )
+        if RIGHT in contents:
+            return SubmitResult(sub, 'right', RIGHT)
+        for verdict, error_regex in (
+                ('wrong', WRONG),
+                ('too quick', TOO_QUICK),
+                ('done', ALREADY_DONE),
+        ):
+            error_match = error_regex.search(contents)
+            if error_match is None:
+                continue
+            elif verdict == 'too quick':
+                wait_match = WAIT.search(contents)
+                if wait_match is None:
+                    return 60
+                minutes, seconds = wait_match.groups()
+                return int(minutes or 0) * 60 + int(seconds)
+            else:
+                return SubmitResult(sub, verdict, error_match[0])
+        return SubmitResult(sub, 'unknown', contents)
+
+    def submit(
+            self,
+            subs: Iterable[Submission],
+    ) -> Generator[SubmitResult, None, None]:
+        """yields the results as the answers are decided"""
+        todo = [(0., i, sub, 0) for i, sub in enumerate(subs)]
+        while todo:
+            ready, i, sub, attempt = heapq.heappop(todo)
+            not_before = self.not_before.get(sub[:2], 0)
+            if not_before > ready:
+                heapq.heappush(todo, (not_before, i, sub, attempt))
+                continue
+
+            cached = self.log.get(sub)
+            if cached is not None:
+                yield cached
+                continue
+
+            self.sleep(max(ready - self.clock(), 0))
+            result = self._post(sub)
+            if isinstance(result, SubmitResult):
+                if result.verdict in ('right', 'wrong'):
+                    self.log.put(result)
+                yield result
+            elif attempt == self.retries:
+                message = f'still too quick after {attempt} retries'
+                yield SubmitResult(sub, 'too quick', message)
+            else:
+                print(f'zzz: too quick, waiting {result}s', file=sys.stderr)
+                self.not_before[sub[:2]] = self.clock() + result
+                heapq.heappush(todo, (0., i, sub, attempt + 1))
+
+
+def submit_solution() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--part', type=int)
+    parser.add_argument(
+        '--batch', action='store_true',
+        help='submit `day part answer` lines from stdin, run from the year',
+    )
+    args = parser.parse_args()
+
+    if args.batch:
+        year, _ = _get_year_dir()
+        subs = [
+            Submission(year, *map(int, line.split()))
+            for line in sys.stdin.read().splitlines()
+            if line.strip()
+        ]
+    elif args.part is None:
+        parser.error('--part is required without --batch')
     else:
-        # unexpected output?
-        print(contents)
-        return 1
+        year, day = get_year_day()
+        subs = [Submission(year, day, args.part, int(sys.stdin.read()))]
+
+    ret = 0
+    with SubmissionLog() as log, SubmitQueue(log) as queue:
+        for result in queue.submit(subs):
+            if args.batch:
+                sub = result.submission
+                print(f'day{sub.day:02} part {sub.part}: ', end='')
+            print(f'answer: {result.submission.answer}')
+            cached = ' (already submitted)' if result.cached else ''
+            if result.verdict == 'right':
+                print(f'\033[42m{result.message}\033[m{cached}')
+            elif result.verdict == 'unknown':
+                # unexpected output?
+                print(result.message)
+                ret = 1
+            else:
+                print(f'\033[41m{result.message}\033[m{cached}')
+                ret = 1
+    return ret
 
 
 def submit_25_pt2() -> int:
@@ -152,6 +769,783 @@ def submit_25_pt2() -> int:
         return 1
 
 
+DAY_RE = re.compile(r'^day(\d\d)$')
+PART_RE = re.compile(r'^part\d+(_\d+)?\.py$')
+
+
+class Part(NamedTuple):
+    day: int
+    name: str
+    path: str
+
+    @property
+    def id(self) -> str:
+        return f'day{self.day:02}/{self.name}'
+
+    @property
+    def input_txt(self) -> str:
+        return os.path.join(os.path.dirname(self.path), 'input.txt')
+
+    @classmethod
+    def from_path(cls, path: str) -> Part:
+        day_s = os.path.basename(os.path.dirname(path))
+        return cls(int(day_s[len('day'):]), os.path.basename(path)[:-3], path)
+
+    def matches(self, pattern: str) -> bool:
+        return self.id == pattern or self.id.startswith(f'{pattern}/')
+
+
+def iter_parts(
+        *patterns: str,
+        root: str | None = None,
+) -> Generator[Part, None, None]:
+    root = ROOT if root is None else root
+    for day_s in sorted(os.listdir(root)):
+        day_match = DAY_RE.match(day_s)
+        # day00 is the template for new days, not a solution
+        if day_match is None or day_s == 'day00':
+            continue
+        for part_s in sorted(os.listdir(os.path.join(root, day_s))):
+            if not PART_RE.match(part_s):
+                continue
+            part = Part.from_path(os.path.join(root, day_s, part_s))
+            if not patterns or any(part.matches(p) for p in patterns):
+                yield part
+
+
+def load_part(part: Part) -> ModuleType:
+    mod_name = f'day{part.day:02}.{part.name}'
+    if mod_name in sys.modules:
+        return sys.modules[mod_name]
+    spec = importlib.util.spec_from_file_location(mod_name, part.path)
+    assert spec is not None and spec.loader is not None, part
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[mod_name] = mod
+    # a fresh import registers its variants again, forget the old ones
+    _VARIANTS.pop(mod_name, None)
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[mod_name]
+        raise
+    return mod
+
+
+# module name -> the names of its other compute() implementations
+_VARIANTS: dict[str, list[str]] = collections.defaultdict(list)
+
+
+def variant(func: CallableT) -> CallableT:
+    """mark another implementation of the `compute` in the same module
+
+    variants (with `partN_M.py` modules, which are variants of `partN`)
+    are benchmarked against each other by `aoc-bench --variants`.
+    """
+    names = _VARIANTS[func.__module__]
+    if func.__name__ not in names:  # the module may be imported again
+        names.append(func.__name__)
+    return func
+
+
+class Variant(NamedTuple):
+    part: Part
+    func: str = 'compute'
+
+    @property
+    def id(self) -> str:
+        if self.func == 'compute':
+            return self.part.id
+        else:
+            return f'{self.part.id}:{self.func}'
+
+    @property
+    def group(self) -> str:
+        """the part this is a variant of, `day09/part2` for `part2_2`"""
+        return f'day{self.part.day:02}/{self.part.name.partition("_")[0]}'
+
+
+def load_variant(v: Variant) -> Callable[[str], object]:
+    return getattr(load_part(v.part), v.func)
+
+
+def iter_variants(parts: Iterable[Part]) -> Generator[Variant, None, None]:
+    """every implementation of the parts, their modules get imported"""
+    for part in parts:
+        yield Variant(part)
+        for func in _VARIANTS.get(load_part(part).__name__, ()):
+            yield Variant(part, func)
+
+
+def group_variants(
+        variants: Iterable[Variant],
+) -> dict[str, list[Variant]]:
+    ret: dict[str, list[Variant]] = {}
+    for v in variants:
+        ret.setdefault(v.group, []).append(v)
+    return ret
+
+
+def _fastest_path() -> str:
+    return os.path.join(cache_dir(), 'fastest.json')
+
+
+def fastest_variants() -> dict[str, str]:
+    """the fastest variant id of each part, as last measured by aoc-bench"""
+    try:
+        with open(_fastest_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def record_fastest(fastest: dict[str, str]) -> None:
+    data = {**fastest_variants(), **fastest}
+    _write_atomic(_fastest_path(), f'{json.dumps(data, indent=2)}\n'.encode())
+
+
+def pick_fastest(
+        parts: Iterable[Part],
+        fastest: dict[str, str],
+) -> list[Variant]:
+    """one variant per part: the fastest one, if it was measured"""
+    ret = []
+    for group, variants in group_variants(map(Variant, parts)).items():
+        by_id = {v.id: v for v in variants}
+        if group in fastest:
+            part_id, _, func = fastest[group].partition(':')
+            if part_id in by_id:
+                ret.append(by_id[part_id]._replace(func=func or 'compute'))
+                continue
+        ret.extend(variants)
+    return ret
+
+
+def lazy_import(name: str) -> ModuleType:
+    """import `name` on first attribute access instead of right away
+
+    keeps heavy dependencies out of the import time of a part until its
+    compute() actually uses them.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    loader.exec_module(mod)
+    return mod
+
+
+def file_hash(*paths: str) -> str:
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def source_hash(part: Part) -> str:
+    """hash of a part's source, and of the helpers it uses from here"""
+    return file_hash(part.path, __file__)
+
+
+class CachedResult(NamedTuple):
+    answer: str
+    time: int
+
+
+class ResultCache:
+    """answers of compute() by (module path, source hash, input hash)
+
+    least recently used entries are evicted past `max_entries`.
+    """
+
+    def __init__(
+            self,
+            path: str | None = None,
+            *,
+            max_entries: int = 1000,
+    ) -> None:
+        if path is None:
+            path = os.path.join(cache_dir(), 'results.sqlite')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.max_entries = max_entries
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            '    module TEXT NOT NULL,'
+            '    source_hash TEXT NOT NULL,'
+            '    input_hash TEXT NOT NULL,'
+            '    answer TEXT NOT NULL,'
+            '    time_ns INTEGER NOT NULL,'
+            '    last_used INTEGER NOT NULL,'
+            '    PRIMARY KEY (module, source_hash, input_hash)'
+            ')',
+        )
+
+    def __enter__(self) -> ResultCache:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.db.close()
+
+    def get(
+            self,
+            module: str,
+            source_hash: str,
+            input_hash: str,
+    ) -> CachedResult | None:
+        key = (module, source_hash, input_hash)
+        with self.db:
+            row = self.db.execute(
+                'SELECT answer, time_ns FROM results '
+                'WHERE module = ? AND source_hash = ? AND input_hash = ?',
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self.db.execute(
+                'UPDATE results SET last_used = ? '
+                'WHERE module = ? AND source_hash = ? AND input_hash = ?',
+                (time.time_ns(), *key),
+            )
+        return CachedResult(*row)
+
+    def put(
+            self,
+            module: str,
+            source_hash: str,
+            input_hash: str,
+            result: CachedResult,
+    ) -> None:
+        with self.db:
+            self.db.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    module, source_hash, input_hash,
+                    result.answer, result.time, time.time_ns(),
+                ),
+            )
+            self.db.execute(
+                'DELETE FROM results WHERE rowid IN ('
+                '    SELECT rowid FROM results ORDER BY last_used DESC '
+                '    LIMIT -1 OFFSET ?'
+                ')',
+                (self.max_entries,),
+            )
+
+    def __len__(self) -> int:
+        count, = self.db.execute('SELECT COUNT(*) FROM results').fetchone()
+        return count
+
+
+PARSED_MAX_ENTRIES = 64
+# off by default so tests and plain imports leave the cache dir alone
+_parse_cache = False
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_hash(path: str, mtime_ns: int) -> str:
+    """hash of a parser's module (and of this one), while it's unchanged"""
+    return file_hash(path, __file__)
+
+
+def cached_parse(parse: Callable[[str], T], s: str) -> T:
+    """`parse(s)`, kept on disk by the input and the parser's source
+
+    the result is stored with marshal, so `parse` has to return plain
+    builtins (tuples, lists, dicts, sets, ints, strs, ...).  only the
+    `PARSED_MAX_ENTRIES` most recently used inputs are kept.
+    """
+    mod_file = getattr(sys.modules.get(parse.__module__), '__file__', None)
+    if mod_file is None:
+        return parse(s)
+
+    mtime_ns = os.stat(mod_file).st_mtime_ns
+    h = hashlib.sha256(_parser_hash(mod_file, mtime_ns).encode())
+    h.update(parse.__qualname__.encode())
+    h.update(s.encode())
+    parsed_dir = os.path.join(cache_dir(), 'parsed')
+    path = os.path.join(parsed_dir, f'{h.hexdigest()}.marshal')
+
+    try:
+        with open(path, 'rb') as f:
+            ret = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass  # not cached yet, or unreadable
+    else:
+        # other workers may be evicting it meanwhile, it's only a hint
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return cast(T, ret)
+
+    ret = parse(s)
+    # the cache is an optimization, it must never fail the parse
+    with contextlib.suppress(OSError):
+        _write_atomic(path, marshal.dumps(cast(Any, ret)))
+        _prune_parsed(parsed_dir)
+    return ret
+
+
+def _prune_parsed(parsed_dir: str) -> None:
+    """keep the `PARSED_MAX_ENTRIES` most recently used parsed inputs
+
+    other processes write and prune here too: their temporary files are
+    left alone, and files that vanish under us are skipped.
+    """
+    mtimes = []
+    for name in os.listdir(parsed_dir):
+        if name.endswith('.tmp'):
+            continue
+        path = os.path.join(parsed_dir, name)
+        try:
+            mtimes.append((os.path.getmtime(path), path))
+        except OSError:
+            continue
+    if len(mtimes) > PARSED_MAX_ENTRIES:
+        mtimes.sort()
+        for _, stale in mtimes[:-PARSED_MAX_ENTRIES]:
+            with contextlib.suppress(OSError):
+                os.remove(stale)
+
+
+def set_parse_cache(enabled: bool) -> None:
+    """whether `parse_solve` keeps parsed inputs on disk
+
+    `part_main` and aoc-run turn it on.
+    """
+    global _parse_cache
+    _parse_cache = enabled
+
+
+def parse_solve(
+        parse: Callable[[str], T],
+        solve: Callable[[T], R],
+        s: str,
+        *,
+        cache: bool | None = None,
+) -> R:
+    """`solve(parse(s))`, optionally with the parsed input cached
+
+    `cache` defaults to what `set_parse_cache` chose.  inside a `timing`
+    block the phases are timed as `parse` and `solve` (quiet if that
+    block is), so the parsing cost can be told apart from the algorithm.
+    parts following the convention define `parse(s)` and
+    `solve(parsed)` and have `compute(s)` call this.
+    """
+    if cache is None:
+        cache = _parse_cache
+    if not _sections:
+        parsed = cached_parse(parse, s) if cache else parse(s)
+        return solve(parsed)
+
+    quiet = _sections[-1].quiet
+    with timing('parse', quiet=quiet):
+        parsed = cached_parse(parse, s) if cache else parse(s)
+    with timing('solve', quiet=quiet):
+        return solve(parsed)
+
+
+class MemoInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    # sum of the entries' costs, the same as `entries` without a `cost`
+    size: int
+    maxsize: int | None
+
+    @property
+    def hit_rate(self) -> float:
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0
+
+
+class Memo(Protocol[T_co]):
+    """what `memo` returns: the memoized function plus `info` / `clear`"""
+    __qualname__: str
+
+    def __call__(self, *args: Hashable, **kwargs: Hashable) -> T_co: ...
+    def info(self) -> MemoInfo: ...
+    def clear(self) -> None: ...
+
+
+class _CostMemo(Generic[T]):
+    """lru with a cost per entry, see `memo`"""
+
+    def __init__(
+            self,
+            func: Callable[..., T],
+            *,
+            maxsize: int | None,
+            cost: Callable[[T], int],
+    ) -> None:
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.cost = cost
+        self._cache: collections.OrderedDict[Hashable, tuple[T, int]]
+        self._cache = collections.OrderedDict()
+        self.hits = self.misses = self.evictions = self.size = 0
+
+    def __call__(self, *args: Hashable, **kwargs: Hashable) -> T:
+        key = (args, frozenset(kwargs.items())) if kwargs else args
+        try:
+            value, _ = self._cache[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.func(*args, **kwargs)
+        cost = self.cost(value)
+        if key in self._cache:  # filled in by a recursive call meanwhile
+            self.size -= self._cache[key][1]
+        self._cache[key] = (value, cost)
+        self.size += cost
+        if self.maxsize is not None:
+            while self.size > self.maxsize and self._cache:
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self.size -= evicted
+                self.evictions += 1
+        return value
+
+    def info(self) -> MemoInfo:
+        return MemoInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._cache),
+            size=self.size,
+            maxsize=self.maxsize,
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = self.misses = self.evictions = self.size = 0
+
+
+def _lru_info(func: functools._lru_cache_wrapper[Any]) -> MemoInfo:
+    """only used without a `maxsize`, so nothing is ever evicted"""
+    hits, misses, maxsize, entries = func.cache_info()
+    return MemoInfo(
+        hits=hits,
+        misses=misses,
+        evictions=0,
+        entries=entries,
+        size=entries,
+        maxsize=maxsize,
+    )
+
+
+def _unit_cost(value: object) -> int:
+    return 1
+
+
+_MEMOS: weakref.WeakSet[Memo[Any]] = weakref.WeakSet()
+
+
+@overload
+def memo(func: Callable[..., T]) -> Memo[T]: ...
+
+
+@overload
+def memo(
+        *,
+        maxsize: int | None = None,
+) -> Callable[[Callable[..., T]], Memo[T]]: ...
+
+
+@overload
+def memo(
+        *,
+        maxsize: int | None = None,
+        cost: Callable[[T], int],
+) -> Callable[[Callable[..., T]], Memo[T]]: ...
+
+
+def memo(
+        func: Callable[..., T] | None = None,
+        *,
+        maxsize: int | None = None,
+        cost: Callable[[T], int] | None = None,
+) -> Memo[T] | Callable[[Callable[..., T]], Memo[T]]:
+    """`functools.cache` with a size limit and counters
+
+    with `maxsize` the least recently used entries are evicted once the
+    entries' total `cost` (1 each by default, e.g. `len` for containers)
+    goes over it.  `.info()` has the hit / miss counts and `.clear()` drops
+    everything, `clear_memos()` does so for every memoized function.
+    """
+    def decorator(func: Callable[..., T]) -> Memo[T]:
+        ret: Any
+        if maxsize is not None or cost is not None:
+            # bounded caches count their evictions as they happen
+            ret = _CostMemo(func, maxsize=maxsize, cost=cost or _unit_cost)
+        else:
+            # the c implementation, a pure python wrapper costs ~2x per call
+            ret = functools.lru_cache(maxsize=None)(func)
+            ret.info = functools.partial(_lru_info, ret)
+            ret.clear = ret.cache_clear
+        _MEMOS.add(ret)
+        return cast(Memo[T], ret)
+
+    if func is not None:
+        return decorator(func)
+    else:
+        return decorator
+
+
+def clear_memos() -> None:
+    for m in tuple(_MEMOS):
+        m.clear()
+
+
+def _print_memos() -> None:
+    for m in sorted(_MEMOS, key=lambda m: m.__qualname__):
+        info = m.info()
+        if info.hits or info.misses:
+            print(
+                f'> memo {m.__qualname__}: {info.hits} hits, '
+                f'{info.misses} misses ({info.hit_rate:.1%}), '
+                f'{info.entries} entries, {info.evictions} evictions',
+                file=sys.stderr,
+            )
+
+
+def _print_memory(snapshot: tracemalloc.Snapshot, peak: int) -> None:
+    print(f'> peak memory: {peak / 1024 / 1024:.1f} MiB', file=sys.stderr)
+    # whatever was freed before returning isn't in the snapshot
+    print(
+        '> still allocated after compute() returned (not the peak):',
+        file=sys.stderr,
+    )
+    for stat in snapshot.statistics('lineno')[:10]:
+        print(f'>   {stat}', file=sys.stderr)
+
+
+def iter_lines(path: str) -> Generator[str, None, None]:
+    """the lines of a file (without newlines), like `s.splitlines()`
+
+    the file is read through a fixed size buffer, so memory use doesn't
+    depend on how big it is.
+    """
+    with open(path, buffering=READ_BUFFER) as f:
+        for line in f:
+            yield line.rstrip('\r\n')
+
+
+class BatchResult(NamedTuple):
+    path: str
+    answer: str
+    time: int
+    error: str = ''
+
+
+def _batch_paths(paths: Iterable[str]) -> list[str]:
+    """the files to run, directories stand for the (visible) files in them"""
+    ret: list[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            ret.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if not name.startswith('.')
+                if os.path.isfile(os.path.join(path, name))
+            )
+        else:
+            ret.append(path)
+    return ret
+
+
+def _run_file(
+        func: Callable[[Any], object],
+        path: str,
+        stream: bool,
+) -> BatchResult:
+    # every input is timed here, phases of many inputs (in many workers)
+    # printed as they finish would only interleave
+    sections = _sections[:]
+    _sections.clear()
+    try:
+        if stream:
+            arg: Any = iter_lines(path)
+        else:
+            with open(path) as f:
+                arg = f.read()
+        before = time.perf_counter_ns()
+        answer = func(arg)
+        t = time.perf_counter_ns() - before
+    except Exception as e:
+        return BatchResult(path, '', 0, f'{type(e).__name__}: {e}')
+    else:
+        return BatchResult(path, str(answer), t)
+    finally:
+        _sections[:] = sections
+        # one input's caches are no use for the next one
+        clear_memos()
+
+
+def run_batch(
+        func: Callable[[Any], object],
+        paths: Iterable[str],
+        *,
+        stream: bool = False,
+        jobs: int | None = None,
+) -> Generator[BatchResult, None, None]:
+    """run `func` on many inputs, yielding the results in order
+
+    the inputs are spread over a pool of `jobs` worker processes which
+    live for the whole batch, so imports and warm-up are only paid once
+    per worker.  `jobs=1` runs everything in this process.
+    """
+    paths = _batch_paths(paths)
+    if jobs == 1:
+        for path in paths:
+            yield _run_file(func, path, stream)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+                jobs, initializer=set_parse_cache, initargs=(_parse_cache,),
+        ) as executor:
+            yield from executor.map(
+                _run_file,
+                itertools.repeat(func),
+                paths,
+                itertools.repeat(stream),
+            )
+
+
+def _batch_main(
+        func: Callable[[Any], object],
+        paths: Iterable[str],
+        *,
+        stream: bool,
+        jobs: int | None,
+) -> int:
+    ret = 0
+    with timing():
+        for result in run_batch(func, paths, stream=stream, jobs=jobs):
+            if result.error:
+                print(f'{result.path}: {result.error}', file=sys.stderr)
+                ret = 1
+            else:
+                print(f'{result.path}: {result.answer}', flush=True)
+    return ret
+
+
+def part_main(
+        compute: Callable[[str], object],
+        input_txt: str,
+        *,
+        compute_stream: Callable[[Iterable[str]], object] | None = None,
+) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        'data_files', nargs='*', default=[input_txt], metavar='data_file',
+        help='with more than one file, or a directory, every input is run '
+             'on a pool of workers and printed as `file: answer`',
+    )
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='worker processes for a batch (default: number of cpus)',
+    )
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='feed compute_stream() the lines as they are read instead of '
+             'reading the whole file, for inputs too big for memory',
+    )
+    parser.add_argument(
+        '--trace', type=int, nargs='?', const=1, metavar='LEVEL',
+        help='turn up this day\'s trace output (default level: %(const)s)',
+    )
+    parser.add_argument(
+        '--trace-file', metavar='FILE',
+        help='write the trace output to FILE instead of stderr',
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='run compute() under cProfile and print the hottest calls',
+    )
+    parser.add_argument(
+        '--profile-out', metavar='FILE',
+        help='write the cProfile stats to FILE instead of printing them',
+    )
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='report the tracemalloc peak, and the sites still holding '
+             'the most memory once compute() returns',
+    )
+    args = parser.parse_args()
+
+    if args.trace is not None:
+        set_trace_level(_day_of(input_txt), args.trace)
+    if args.trace_file:
+        trace_to(args.trace_file)
+
+    func: Callable[[Any], object]
+    if args.stream:
+        if compute_stream is None:
+            parser.error('this part has no compute_stream()')
+        func = compute_stream
+    else:
+        func = compute
+
+    set_parse_cache(True)
+
+    data_file, *rest = args.data_files
+    if rest or os.path.isdir(data_file):
+        if args.profile or args.profile_out or args.memory:
+            parser.error('--profile and --memory take a single data_file')
+        return _batch_main(
+            func, args.data_files, stream=args.stream, jobs=args.jobs,
+        )
+
+    arg: Any
+    if args.stream:
+        arg = iter_lines(data_file)
+    else:
+        with open(data_file) as f:
+            arg = f.read()
+
+    if args.memory:
+        tracemalloc.start()
+
+    profiler = cProfile.Profile() if args.profile or args.profile_out else None
+
+    with timing():
+        if profiler is not None:
+            print(profiler.runcall(func, arg))
+        else:
+            print(func(arg))
+
+    _print_memos()
+
+    if args.memory:
+        # sites still holding memory when compute() returns, e.g. caches
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _print_memory(snapshot, peak)
+
+    if profiler is not None:
+        if args.profile_out:
+            profiler.dump_stats(args.profile_out)
+        else:
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats('cumulative').print_stats(25)
+
+    return 0
+
+
 def adjacent_4(x: int, y: int) -> Generator[tuple[int, int], None, None]:
     yield x, y - 1
     yield x + 1, y
@@ -205,6 +1599,311 @@ def bounds(points: Iterable[tuple[int, ...]]) -> tuple[Bound, ...]:
     return tuple(Bound(min(dim), max(dim)) for dim in zip(*points))
 
 
+def merge_intervals(intervals: Iterable[tuple[int, int]]) -> list[Bound]:
+    """sorted, non-overlapping cover of inclusive `(min, max)` intervals
+
+    touching intervals (`(1, 3)` and `(4, 6)`) are merged as well.
+    """
+    ret: list[Bound] = []
+    for lo, hi in sorted(intervals):
+        if hi < lo:
+            continue
+        elif ret and lo <= ret[-1].max + 1:
+            if hi > ret[-1].max:
+                ret[-1] = Bound(ret[-1].min, hi)
+        else:
+            ret.append(Bound(lo, hi))
+    return ret
+
+
+class IntervalSet:
+    """set of integers stored as merged inclusive intervals
+
+    costs depend on the number of intervals, not on how wide they are.
+    """
+    __slots__ = ('intervals', '_mins')
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        self.intervals = tuple(merge_intervals(intervals))
+        self._mins = [b.min for b in self.intervals]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self.intervals)})'
+
+    def __contains__(self, x: int) -> bool:
+        i = bisect.bisect_right(self._mins, x) - 1
+        return i >= 0 and x <= self.intervals[i].max
+
+    def __len__(self) -> int:
+        return sum(b.max - b.min + 1 for b in self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.intervals == other.intervals
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet((*self.intervals, *other.intervals))
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        ret = []
+        i = j = 0
+        while i < len(self.intervals) and j < len(other.intervals):
+            a, b = self.intervals[i], other.intervals[j]
+            lo, hi = max(a.min, b.min), min(a.max, b.max)
+            if lo <= hi:
+                ret.append((lo, hi))
+            if a.max < b.max:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet(ret)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        ret = []
+        j = 0
+        for lo, hi in self.intervals:
+            while j < len(other.intervals) and other.intervals[j].max < lo:
+                j += 1
+            k = j
+            while k < len(other.intervals) and other.intervals[k].min <= hi:
+                b = other.intervals[k]
+                if b.min > lo:
+                    ret.append((lo, b.min - 1))
+                lo = b.max + 1
+                k += 1
+            if lo <= hi:
+                ret.append((lo, hi))
+        return IntervalSet(ret)
+
+    @property
+    def bounds(self) -> Bound:
+        """the smallest and largest members, a ValueError when empty"""
+        if not self.intervals:
+            raise ValueError('an empty IntervalSet has no bounds')
+        return Bound(self.intervals[0].min, self.intervals[-1].max)
+
+    def issubset(self, other: IntervalSet) -> bool:
+        return self & other == self
+
+    def issuperset(self, other: IntervalSet) -> bool:
+        return other.issubset(self)
+
+    def isdisjoint(self, other: IntervalSet) -> bool:
+        return not self & other
+
+
+class Grid:
+    """dense board of single ascii characters backed by a bytearray
+
+    a drop-in for `dict[tuple[int, int], str]` boards at a fraction of the
+    memory: one byte per cell instead of a tuple key and dict slot.
+    """
+    __slots__ = ('width', 'height', 'data')
+
+    def __init__(self, width: int, height: int, fill: str = '.') -> None:
+        self.width = width
+        self.height = height
+        self.data = bytearray(fill.encode() * (width * height))
+
+    @classmethod
+    def parse(cls, s: str, *, fill: str = ' ') -> Grid:
+        """ragged lines are padded on the right with `fill`"""
+        lines = s.splitlines()
+        width = max((len(line) for line in lines), default=0)
+        ret = cls(width, len(lines), fill)
+        for y, line in enumerate(lines):
+            ret.data[y * width:y * width + len(line)] = line.encode()
+        return ret
+
+    def _index(self, pos: tuple[int, int]) -> int:
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        else:
+            raise IndexError(pos)
+
+    # the index math is inlined in the accessors, they are the hot path
+    def __getitem__(self, pos: tuple[int, int]) -> str:
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return chr(self.data[y * self.width + x])
+        else:
+            raise IndexError(pos)
+
+    def __setitem__(self, pos: tuple[int, int], c: str) -> None:
+        x, y = pos
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.data[y * self.width + x] = ord(c)
+        else:
+            raise IndexError(pos)
+
+    def __contains__(self, pos: tuple[int, int]) -> bool:
+        x, y = pos
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.data) == (other.width, other.data)
+
+    def get(self, pos: tuple[int, int], default: str = '') -> str:
+        return self[pos] if pos in self else default
+
+    def copy(self) -> Grid:
+        ret = Grid(self.width, self.height)
+        ret.data[:] = self.data
+        return ret
+
+    @property
+    def bounds(self) -> tuple[Bound, Bound]:
+        return Bound(0, self.width - 1), Bound(0, self.height - 1)
+
+    def row(self, y: int) -> str:
+        self._index((0, y))
+        return self.data[y * self.width:(y + 1) * self.width].decode()
+
+    def col(self, x: int) -> str:
+        self._index((x, 0))
+        return self.data[x::self.width].decode()
+
+    def adjacent_4(
+            self, x: int, y: int,
+    ) -> Generator[tuple[int, int], None, None]:
+        for pos in adjacent_4(x, y):
+            if pos in self:
+                yield pos
+
+    def adjacent_8(
+            self, x: int, y: int,
+    ) -> Generator[tuple[int, int], None, None]:
+        for pos in adjacent_8(x, y):
+            if pos in self:
+                yield pos
+
+    def items(self) -> Generator[tuple[tuple[int, int], str], None, None]:
+        i = 0
+        for y in range(self.height):
+            for x in range(self.width):
+                yield (x, y), chr(self.data[i])
+                i += 1
+
+    def find(self, c: str) -> Generator[tuple[int, int], None, None]:
+        b = ord(c)
+        i = self.data.find(b)
+        while i != -1:
+            y, x = divmod(i, self.width)
+            yield x, y
+            i = self.data.find(b, i + 1)
+
+    def format(self) -> str:
+        return '\n'.join(self.row(y) for y in range(self.height))
+
+
+_PACK_SHIFT = 32
+_PACK_BIAS = 1 << 31
+_PACK_MASK = (1 << _PACK_SHIFT) - 1
+
+
+def pack(x: int, y: int) -> int:
+    """pack a point (each coordinate within ±2**31) into one int
+
+    packed points order by y first, then by x.
+    """
+    return ((y + _PACK_BIAS) << _PACK_SHIFT) | (x + _PACK_BIAS)
+
+
+def unpack(p: int) -> tuple[int, int]:
+    return (p & _PACK_MASK) - _PACK_BIAS, (p >> _PACK_SHIFT) - _PACK_BIAS
+
+
+def pack_offset(dx: int, dy: int) -> int:
+    """adding this to a packed point moves it by (dx, dy)"""
+    return (dy << _PACK_SHIFT) + dx
+
+
+class PointSet:
+    """set of (x, y) points, each stored as a single packed int
+
+    shifting a shape is one int addition per point rather than building
+    a new tuple per point, which keeps collision checks of shifted shapes
+    cheap.  `packed` is the underlying `set[int]` for hot loops.
+    """
+    __slots__ = ('packed',)
+
+    def __init__(self, points: Iterable[tuple[int, int]] = ()) -> None:
+        self.packed = {pack(x, y) for x, y in points}
+
+    @classmethod
+    def from_packed(cls, packed: Iterable[int]) -> PointSet:
+        ret = cls()
+        ret.packed = set(packed)
+        return ret
+
+    @classmethod
+    def parse(cls, s: str) -> PointSet:
+        return cls(parse_coords_hash(s))
+
+    def __contains__(self, point: tuple[int, int]) -> bool:
+        return pack(*point) in self.packed
+
+    def __iter__(self) -> Generator[tuple[int, int], None, None]:
+        for p in self.packed:
+            yield unpack(p)
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointSet):
+            return NotImplemented
+        return self.packed == other.packed
+
+    def __or__(self, other: PointSet) -> PointSet:
+        return PointSet.from_packed(self.packed | other.packed)
+
+    def __and__(self, other: PointSet) -> PointSet:
+        return PointSet.from_packed(self.packed & other.packed)
+
+    def __sub__(self, other: PointSet) -> PointSet:
+        return PointSet.from_packed(self.packed - other.packed)
+
+    def add(self, x: int, y: int) -> None:
+        self.packed.add(pack(x, y))
+
+    def discard(self, x: int, y: int) -> None:
+        self.packed.discard(pack(x, y))
+
+    def update(self, other: PointSet) -> None:
+        self.packed |= other.packed
+
+    def translate(self, dx: int, dy: int) -> PointSet:
+        d = pack_offset(dx, dy)
+        return PointSet.from_packed(p + d for p in self.packed)
+
+    def intersects(self, other: PointSet, dx: int = 0, dy: int = 0) -> bool:
+        """whether `other` shifted by (dx, dy) overlaps this set"""
+        d = pack_offset(dx, dy)
+        packed = self.packed
+        for p in other.packed:
+            if p + d in packed:
+                return True
+        return False
+
+    @property
+    def bounds(self) -> tuple[Bound, ...]:
+        return bounds(self)
+
+    def to_coords(self) -> set[tuple[int, int]]:
+        return set(self)
+
+    def format(self) -> str:
+        return format_coords_hash(self.to_coords())
+
+
 def format_coords_hash(coords: set[tuple[int, int]]) -> str:
     min_x = min(x for x, _ in coords)
     max_x = max(x for x, _ in coords)
@@ -253,3 +1952,243 @@ class Direction4(enum.Enum):
 
     def apply(self, x: int, y: int, *, n: int = 1) -> tuple[int, int]:
         return self.x * n + x, self.y * n + y
+
+
+class SearchResult(NamedTuple):
+    cost: int
+    node: Any
+    # start to goal (inclusive), only filled in with `path=True`
+    path: tuple[Any, ...] = ()
+
+
+def _identity(node: T) -> T:
+    return node
+
+
+def _path(
+        parents: dict[Hashable, Any],
+        key: Callable[[Any], Hashable],
+        node: Any,
+) -> tuple[Any, ...]:
+    ret = [node]
+    while (node := parents[key(node)]) is not None:
+        ret.append(node)
+    return tuple(reversed(ret))
+
+
+def bfs(
+        starts: Iterable[T],
+        neighbors: Callable[[T], Iterable[T]],
+        is_goal: Callable[[T], bool],
+        *,
+        key: Callable[[T], Hashable] = _identity,
+        path: bool = False,
+) -> SearchResult | None:
+    """fewest steps from any of `starts` to a node where `is_goal`
+
+    `key` picks what is remembered per visited node, e.g. `pack` for points
+    or a smaller projection of a larger state.
+    """
+    parents: dict[Hashable, Any] = {}
+    seen = set()
+    todo: collections.deque[tuple[int, T]] = collections.deque()
+    for start in starts:
+        k = key(start)
+        if k not in seen:
+            seen.add(k)
+            parents[k] = None
+            todo.append((0, start))
+
+    while todo:
+        cost, node = todo.popleft()
+        if is_goal(node):
+            return SearchResult(
+                cost, node, _path(parents, key, node) if path else (),
+            )
+        for n in neighbors(node):
+            k = key(n)
+            if k not in seen:
+                seen.add(k)
+                if path:
+                    parents[k] = node
+                todo.append((cost + 1, n))
+
+    return None
+
+
+def bfs_01(
+        starts: Iterable[T],
+        neighbors: Callable[[T], Iterable[tuple[T, int]]],
+        is_goal: Callable[[T], bool],
+        *,
+        key: Callable[[T], Hashable] = _identity,
+        path: bool = False,
+) -> SearchResult | None:
+    """cheapest path when every edge costs 0 or 1
+
+    `neighbors` yields `(node, cost)` pairs.
+    """
+    parents: dict[Hashable, Any] = {}
+    best: dict[Hashable, int] = {}
+    todo: collections.deque[tuple[int, T]] = collections.deque()
+    for start in starts:
+        best[key(start)] = 0
+        parents[key(start)] = None
+        todo.append((0, start))
+
+    done = set()
+    while todo:
+        cost, node = todo.popleft()
+        k = key(node)
+        if k in done:
+            continue
+        done.add(k)
+        if is_goal(node):
+            return SearchResult(
+                cost, node, _path(parents, key, node) if path else (),
+            )
+        for n, edge in neighbors(node):
+            n_cost = cost + edge
+            n_k = key(n)
+            if n_k not in best or n_cost < best[n_k]:
+                best[n_k] = n_cost
+                if path:
+                    parents[n_k] = node
+                if edge == 0:
+                    todo.appendleft((n_cost, n))
+                else:
+                    todo.append((n_cost, n))
+
+    return None
+
+
+def dijkstra(
+        starts: Iterable[T],
+        neighbors: Callable[[T], Iterable[tuple[T, int]]],
+        is_goal: Callable[[T], bool],
+        *,
+        heuristic: Callable[[T], int] | None = None,
+        key: Callable[[T], Hashable] = _identity,
+        path: bool = False,
+) -> SearchResult | None:
+    """cheapest path with non-negative edge costs
+
+    `neighbors` yields `(node, cost)` pairs.  with a `heuristic` (which must
+    never overestimate the remaining cost) this is A*.  a node is expanded
+    again whenever a cheaper way to it turns up, which only happens with an
+    inconsistent heuristic.
+    """
+    h = heuristic if heuristic is not None else (lambda node: 0)
+    # the counter breaks ties so nodes themselves are never compared
+    tie = itertools.count()
+    parents: dict[Hashable, Any] = {}
+    best: dict[Hashable, int] = {}
+    todo: list[tuple[int, int, int, T]] = []
+    for start in starts:
+        best[key(start)] = 0
+        parents[key(start)] = None
+        heapq.heappush(todo, (h(start), next(tie), 0, start))
+
+    while todo:
+        _, _, cost, node = heapq.heappop(todo)
+        if cost > best[key(node)]:
+            continue  # reached more cheaply since this was queued
+        if is_goal(node):
+            return SearchResult(
+                cost, node, _path(parents, key, node) if path else (),
+            )
+        for n, edge in neighbors(node):
+            n_cost = cost + edge
+            n_k = key(n)
+            if n_k not in best or n_cost < best[n_k]:
+                best[n_k] = n_cost
+                if path:
+                    parents[n_k] = node
+                heapq.heappush(todo, (n_cost + h(n), next(tie), n_cost, n))
+
+    return None
+
+
+def astar(
+        starts: Iterable[T],
+        neighbors: Callable[[T], Iterable[tuple[T, int]]],
+        is_goal: Callable[[T], bool],
+        heuristic: Callable[[T], int],
+        *,
+        key: Callable[[T], Hashable] = _identity,
+        path: bool = False,
+) -> SearchResult | None:
+    return dijkstra(
+        starts, neighbors, is_goal,
+        heuristic=heuristic, key=key, path=path,
+    )
+
+
+class Cycle(NamedTuple):
+    # steps before the first state that repeats, and how often it repeats
+    start: int
+    period: int
+
+
+def find_cycle(
+        state: T,
+        step: Callable[[T], T],
+        *,
+        key: Callable[[T], Hashable] = _identity,
+) -> Cycle:
+    """Brent's cycle detection on `state, step(state), step(step(state))...`
+
+    only a couple of states are alive at a time, so memory doesn't grow with
+    the length of the cycle.  `step` must not mutate its argument and two
+    states are the same when their `key`s are equal.
+    """
+    power = period = 1
+    tortoise, hare = state, step(state)
+    tortoise_key = key(tortoise)
+    while tortoise_key != key(hare):
+        if power == period:
+            tortoise, tortoise_key = hare, key(hare)
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+
+    tortoise = hare = state
+    for _ in range(period):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    return Cycle(start, period)
+
+
+def extrapolate(
+        state: T,
+        step: Callable[[T], T],
+        n: int,
+        cycle: Cycle,
+        *,
+        value: Callable[[T], int],
+) -> int:
+    """`value` of the state after `n` steps, without taking them all
+
+    assumes `value` changes by the same amount every time around the cycle,
+    which covers both counters (e.g. a height) and values that only depend
+    on the state itself.
+    """
+    if n <= cycle.start + cycle.period:
+        for _ in range(n):
+            state = step(state)
+        return value(state)
+
+    q, r = divmod(n - cycle.start, cycle.period)
+    for _ in range(cycle.start):
+        state = step(state)
+    first = at_r = value(state)
+    for i in range(1, cycle.period + 1):
+        state = step(state)
+        if i == r:
+            at_r = value(state)
+    return at_r + q * (value(state) - first)
@@ -1,8 +1,147 @@
 from __future__ import annotations
 
+import collections
+import http.server
+import io
+import os
+import pathlib
+import sys
+import threading
+import urllib.parse
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+
+import pytest
+
 import support
 
 
+class FakeAoc(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    inputs: dict[str, str] = {}
+    requests: list[str] = []
+    # the client port of every request, to tell the connections apart
+    clients: list[int] = []
+    # paths that fail with a 500 this many more times
+    failures: collections.Counter[str] = collections.Counter()
+    # paths answered with a garbled response this many more times
+    garbled: collections.Counter[str] = collections.Counter()
+    chunked = False
+
+    def do_GET(self) -> None:
+        self.requests.append(self.path)
+        self.clients.append(self.client_address[1])
+        if self.garbled[self.path] > 0:
+            self.garbled[self.path] -= 1
+            self.wfile.write(b'garbage\r\n\r\n')
+            self.close_connection = True
+            return
+        if self.failures[self.path] > 0:
+            self.failures[self.path] -= 1
+            self.send_error(500)
+            return
+        try:
+            body = self.inputs[self.path].encode()
+        except KeyError:
+            self.send_error(404)
+        else:
+            self.send_response(200)
+            if self.chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for i in range(0, len(body), 4):
+                    chunk = body[i:i + 4]
+                    self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                self.wfile.write(b'0\r\n\r\n')
+            else:
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+    # the right answer of each (day, part), and how many more posts to it
+    # are answered with "too quick"
+    answers: dict[tuple[int, int], str] = {}
+    too_quick: collections.Counter[int] = collections.Counter()
+    solved: set[tuple[int, int]] = set()
+
+    def do_POST(self) -> None:
+        self.clients.append(self.client_address[1])
+        body = self.rfile.read(int(self.headers['Content-Length'])).decode()
+        self.requests.append(f'{self.path} {body}')
+        day = int(self.path.split('/')[3])
+        params = urllib.parse.parse_qs(body)
+        key = (day, int(params['level'][0]))
+
+        if self.too_quick[day] > 0:
+            self.too_quick[day] -= 1
+            contents = (
+                'You gave an answer too recently; you have to wait after '
+                'submitting an answer before trying again.  You have 1m 5s '
+                'left to wait.'
+            )
+        elif key in self.solved or (
+                key[1] == 2 and (day, 1) not in self.solved
+        ):
+            contents = (
+                "You don't seem to be solving the right level.  "
+                'Did you already complete it?'
+            )
+        elif self.answers[key] == params['answer'][0]:
+            self.solved.add(key)
+            contents = "That's the right answer!  You are one star closer."
+        else:
+            contents = "That's not the right answer.  If you're stuck, ..."
+
+        data = f'<article><p>{contents}</p></article>'.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def part_cache(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """`part_main` turns the parse cache on, keep that out of the real one"""
+    monkeypatch.setattr(support, '_parse_cache', False)
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path.joinpath('cache')))
+
+
+@pytest.fixture
+def fake_aoc(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> Generator[type[FakeAoc], None, None]:
+    """a local stand-in for adventofcode.com with an empty input cache"""
+    FakeAoc.inputs = {'/2022/day/5/input': 'hello\nworld\n'}
+    FakeAoc.requests = []
+    FakeAoc.clients = []
+    FakeAoc.failures = collections.Counter()
+    FakeAoc.garbled = collections.Counter()
+    FakeAoc.chunked = False
+    FakeAoc.answers = {}
+    FakeAoc.too_quick = collections.Counter()
+    FakeAoc.solved = set()
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FakeAoc)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    monkeypatch.setattr(support, 'AOC_URL', f'http://{host!s}:{port}')
+    monkeypatch.setattr(support, '_get_cookie_headers', dict)
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path.joinpath('cache')))
+    try:
+        yield FakeAoc
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def test_adjacent_4() -> None:
     pts = set(support.adjacent_4(1, 2))
     assert pts == {(0, 2), (2, 2), (1, 3), (1, 1)}
@@ -53,3 +192,732 @@ def test_direction4() -> None:
     assert support.Direction4.UP.ccw is support.Direction4.LEFT
     assert support.Direction4.UP.opposite is support.Direction4.DOWN
     assert support.Direction4.UP.apply(0, 0) == (0, -1)
+
+
+@pytest.mark.parametrize(
+    ('ns', 'expected'),
+    (
+        (12, '12 ns'),
+        (1500, '1.50 μs'),
+        (2_000_000, '2.00 ms'),
+        (3_250_000_000, '3.25 s'),
+    ),
+)
+def test_format_ns(ns: int, expected: str) -> None:
+    assert support.format_ns(ns) == expected
+
+
+def test_timing_nested_sections(
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(support, '_summary_registered', True)
+    support.reset_timings()
+    with support.timing('outer'):
+        for _ in range(3):
+            with support.timing('inner', quiet=True):
+                pass
+
+    assert list(support.TIMINGS) == ['outer/inner', 'outer']
+    inner = support.TIMINGS['outer/inner']
+    assert inner.count == 3
+    assert inner.min <= inner.mean <= inner.max
+    assert inner.total <= support.TIMINGS['outer'].total
+
+    err = capsys.readouterr().err
+    assert err.startswith('> ')
+    assert err.endswith(' (outer)\n')
+    assert 'section' in support.format_timings()
+    support.reset_timings()
+
+
+def test_part_main(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        part_cache: None,
+) -> None:
+    input_txt = tmp_path.joinpath('input.txt')
+    input_txt.write_text('1 2 3\n')
+    profile_out = tmp_path.joinpath('out.pstats')
+
+    def compute(s: str) -> int:
+        return sum(support.parse_numbers_split(s))
+
+    argv = ['part1.py', '--memory', '--profile-out', str(profile_out)]
+    monkeypatch.setattr(sys, 'argv', argv)
+    assert support.part_main(compute, str(input_txt)) == 0
+
+    out, err = capsys.readouterr()
+    assert out == '6\n'
+    assert '> peak memory:' in err
+    assert '> still allocated after compute() returned' in err
+    assert profile_out.exists()
+    assert list(support.TIMINGS) == ['<total>']
+    support.reset_timings()
+
+
+def test_parse_trace_levels() -> None:
+    assert support._parse_trace_levels('') == {}
+    assert support._parse_trace_levels('day05=2, day12') == {
+        'day05': 2, 'day12': 1,
+    }
+    assert support._parse_trace_levels('3') == {'*': 3}
+
+
+def test_tracer(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(support, 'TRACE_LEVELS', {'day05': 2})
+    monkeypatch.setattr(support, '_tracers', [])
+    day05 = support.tracer(str(tmp_path / 'day05' / 'part1.py'))
+    day06 = support.tracer(str(tmp_path / 'day06' / 'part1.py'))
+    assert (day05.level, day06.level) == (2, 0)
+
+    day05('a')
+    day05('b', level=2)
+    day05('c', level=3)
+    day06('d')
+    assert capsys.readouterr() == ('', 'a\nb\n')
+
+    support.set_trace_level('day06', 1)
+    trace_txt = tmp_path.joinpath('trace.txt')
+    support.trace_to(str(trace_txt))
+    try:
+        day06('e')
+    finally:
+        support.trace_to(None)
+    assert trace_txt.read_text() == 'e\n'
+
+    support.set_trace_level('*', 0)
+    assert (day05.level, day06.level) == (0, 0)
+
+
+def test_iter_lines(tmp_path: pathlib.Path) -> None:
+    f = tmp_path.joinpath('input.txt')
+    f.write_bytes(b'a\r\n\nb c\nd')
+    assert list(support.iter_lines(str(f))) == ['a', '', 'b c', 'd']
+
+
+def test_part_main_stream(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        part_cache: None,
+) -> None:
+    input_txt = tmp_path.joinpath('input.txt')
+    input_txt.write_text('1\n2\n3\n')
+
+    def compute_stream(lines: Iterable[str]) -> int:
+        return sum(int(line) for line in lines)
+
+    monkeypatch.setattr(sys, 'argv', ['part1.py', '--stream'])
+    ret = support.part_main(
+        lambda s: -1, str(input_txt), compute_stream=compute_stream,
+    )
+    assert ret == 0
+    assert capsys.readouterr().out == '6\n'
+    support.reset_timings()
+
+    with pytest.raises(SystemExit):
+        support.part_main(lambda s: -1, str(input_txt))
+
+
+def _sum(s: str) -> int:
+    return sum(support.parse_numbers_split(s))
+
+
+@pytest.mark.parametrize('jobs', ('1', '2'))
+def test_part_main_batch(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        part_cache: None,
+        jobs: str,
+) -> None:
+    inputs = tmp_path.joinpath('inputs')
+    inputs.mkdir()
+    inputs.joinpath('a.txt').write_text('1 2\n')
+    inputs.joinpath('b.txt').write_text('3 4\n')
+    inputs.joinpath('c.txt').write_text('oops\n')
+    inputs.joinpath('.hidden').write_text('5\n')
+    extra = tmp_path.joinpath('extra.txt')
+    extra.write_text('10\n')
+
+    argv = ['part1.py', '-j', jobs, str(inputs), str(extra)]
+    monkeypatch.setattr(sys, 'argv', argv)
+    assert support.part_main(_sum, str(extra)) == 1
+
+    out, err = capsys.readouterr()
+    assert out == (
+        f'{inputs / "a.txt"}: 3\n'
+        f'{inputs / "b.txt"}: 7\n'
+        f'{extra}: 10\n'
+    )
+    assert f'{inputs / "c.txt"}: ValueError: ' in err
+    support.reset_timings()
+
+
+def test_get_input_cached(fake_aoc: type[FakeAoc]) -> None:
+    assert support.get_input(2022, 5) == 'hello\nworld\n'
+    assert support.get_input(2022, 5) == 'hello\nworld\n'
+    assert fake_aoc.requests == ['/2022/day/5/input']
+
+    fake_aoc.inputs['/2022/day/5/input'] = 'new\n'
+    assert support.get_input(2022, 5, refresh=True) == 'new\n'
+    assert support.get_input(2022, 5) == 'new\n'
+    assert len(fake_aoc.requests) == 2
+
+
+def test_get_input_corrupt_cache(fake_aoc: type[FakeAoc]) -> None:
+    support.get_input(2022, 5)
+    objects = pathlib.Path(support.cache_dir(), 'inputs', 'objects')
+    obj, = objects.iterdir()
+    obj.write_text('truncat')
+
+    assert support.get_input(2022, 5) == 'hello\nworld\n'
+    assert len(fake_aoc.requests) == 2
+
+
+def _set_inputs(fake_aoc: type[FakeAoc], days: Iterable[int]) -> None:
+    fake_aoc.inputs = {
+        f'/2022/day/{day}/input': f'day {day}\n' * day for day in days
+    }
+
+
+@pytest.mark.parametrize('chunked', (False, True))
+def test_download_inputs(fake_aoc: type[FakeAoc], chunked: bool) -> None:
+    fake_aoc.chunked = chunked
+    _set_inputs(fake_aoc, range(1, 6))
+    downloads = support.download_inputs(2022, range(1, 6), jobs=2)
+    assert downloads == [
+        support.Download(day, f'day {day}\n' * day) for day in range(1, 6)
+    ]
+    # two workers, each reusing its connection
+    assert len(fake_aoc.requests) == 5
+    assert len(set(fake_aoc.clients)) == 2
+
+    # the second time around the inputs come from the cache
+    assert support.download_inputs(2022, [2, 3]) == downloads[1:3]
+    assert len(fake_aoc.requests) == 5
+
+
+def test_download_inputs_retries(fake_aoc: type[FakeAoc]) -> None:
+    _set_inputs(fake_aoc, [1])
+    fake_aoc.failures['/2022/day/1/input'] = 1
+    fake_aoc.garbled['/2022/day/1/input'] = 1
+    downloads = support.download_inputs(
+        2022, [1, 2], jobs=1, retries=2, backoff=.001,
+    )
+    assert downloads == [
+        support.Download(1, 'day 1\n'),
+        support.Download(2, error='HTTP 404: /2022/day/2/input'),
+    ]
+    assert fake_aoc.requests == [
+        *['/2022/day/1/input'] * 3,
+        *['/2022/day/2/input'] * 3,
+    ]
+
+
+def test_download_input_all(
+        fake_aoc: type[FakeAoc],
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    _set_inputs(fake_aoc, [1, 3])
+    year_dir = tmp_path.joinpath('aoc2022')
+    for day in ('day00', 'day01', 'day03'):
+        year_dir.joinpath(day).mkdir(parents=True)
+    monkeypatch.chdir(year_dir.joinpath('day01'))
+    monkeypatch.setattr(sys, 'argv', ['aoc-download-input', '--all'])
+
+    assert support.download_input() == 0
+    assert capsys.readouterr().out == 'day01: 1 lines\nday03: 3 lines\n'
+    assert year_dir.joinpath('day03', 'input.txt').read_text() == 'day 3\n' * 3
+    assert not year_dir.joinpath('day00', 'input.txt').exists()
+    assert os.listdir(year_dir.joinpath('day01')) == ['input.txt']
+
+
+def test_submit_queue(fake_aoc: type[FakeAoc]) -> None:
+    fake_aoc.answers = {(1, 1): '42', (2, 1): '8'}
+    fake_aoc.too_quick[1] = 1
+    fake_aoc.solved = {(3, 1)}
+    subs = [
+        support.Submission(2022, 1, 1, 42),
+        support.Submission(2022, 2, 1, 7),
+        support.Submission(2022, 1, 1, 42),
+        support.Submission(2022, 1, 1, 43),
+        support.Submission(2022, 3, 1, 5),
+    ]
+    sleeps: list[float] = []
+
+    with support.SubmissionLog() as log:
+        queue = support.SubmitQueue(log, sleep=sleeps.append, clock=float)
+        with queue:
+            results = [
+                (r.submission, r.verdict, r.cached)
+                for r in queue.submit(subs)
+            ]
+
+    # day 1 waits out the rate limit, without holding up the other days
+    assert results == [
+        (subs[1], 'wrong', False),
+        (subs[4], 'done', False),
+        (subs[0], 'right', False),
+        (subs[2], 'right', True),
+        (subs[3], 'wrong', True),
+    ]
+    assert max(sleeps) == 65
+    assert len(fake_aoc.requests) == 4
+    assert len(set(fake_aoc.clients)) == 1
+
+    # the verdicts are remembered
+    with support.SubmissionLog() as log, support.SubmitQueue(log) as queue:
+        verdicts = [(r.verdict, r.cached) for r in queue.submit(subs)]
+    assert verdicts == [
+        ('right', True),
+        ('wrong', True),
+        ('right', True),
+        ('wrong', True),
+        ('done', False),
+    ]
+    assert len(fake_aoc.requests) == 5
+
+
+def test_submit_queue_part2_before_part1(fake_aoc: type[FakeAoc]) -> None:
+    fake_aoc.answers = {(1, 1): '42', (1, 2): '43'}
+    part2 = support.Submission(2022, 1, 2, 43)
+    subs = [part2, support.Submission(2022, 1, 1, 42), part2]
+
+    with support.SubmissionLog() as log, support.SubmitQueue(log) as queue:
+        verdicts = [(r.verdict, r.cached) for r in queue.submit(subs)]
+    # part 2 is locked at first, which mustn't stick once part 1 is in
+    assert verdicts == [('done', False), ('right', False), ('right', False)]
+
+
+def test_submit_solution_batch(
+        fake_aoc: type[FakeAoc],
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    fake_aoc.answers = {(1, 1): '42', (1, 2): '43'}
+    year_dir = tmp_path.joinpath('aoc2022')
+    year_dir.mkdir()
+    monkeypatch.chdir(year_dir)
+    monkeypatch.setattr(sys, 'argv', ['aoc-submit', '--batch'])
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('1 1 42\n1 2 44\n'))
+
+    assert support.submit_solution() == 1
+    out = capsys.readouterr().out
+    assert "day01 part 1: answer: 42\n\033[42mThat's the right" in out
+    assert "day01 part 2: answer: 44\n\033[41mThat's not the right" in out
+
+
+def test_variant() -> None:
+    @support.variant
+    def compute2(s: str) -> int:
+        return 0
+
+    assert 'compute2' in support._VARIANTS[__name__]
+    part = support.Part(9, 'part2_2', 'day09/part2_2.py')
+    assert support.Variant(part).id == 'day09/part2_2'
+    assert support.Variant(part, 'compute2').id == 'day09/part2_2:compute2'
+    assert support.Variant(part).group == 'day09/part2'
+
+
+def test_pick_fastest() -> None:
+    parts = [
+        support.Part(3, 'part1', 'day03/part1.py'),
+        support.Part(3, 'part2', 'day03/part2.py'),
+        support.Part(9, 'part2', 'day09/part2.py'),
+        support.Part(9, 'part2_2', 'day09/part2_2.py'),
+    ]
+    fastest = {
+        'day03/part2': 'day03/part2:compute2',
+        'day09/part2': 'day09/part2_2',
+    }
+    ret = support.pick_fastest(parts, fastest)
+    assert [v.id for v in ret] == [
+        'day03/part1', 'day03/part2:compute2', 'day09/part2_2',
+    ]
+    # the winner wasn't selected, so run what was
+    ret = support.pick_fastest(parts[2:3], fastest)
+    assert [v.id for v in ret] == ['day09/part2']
+
+
+def test_cached_parse(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(support, 'PARSED_MAX_ENTRIES', 2)
+    calls = []
+
+    def parse(s: str) -> list[int]:
+        calls.append(s)
+        return support.parse_numbers_split(s)
+
+    assert support.cached_parse(parse, '1 2') == [1, 2]
+    assert support.cached_parse(parse, '1 2') == [1, 2]
+    assert calls == ['1 2']
+
+    parsed_dir = tmp_path.joinpath('parsed')
+    path, = parsed_dir.iterdir()
+    path.write_bytes(b'garbage')
+    assert support.cached_parse(parse, '1 2') == [1, 2]
+    assert calls == ['1 2', '1 2']
+
+    # only the most recent inputs are kept, other writers' files are not
+    # touched
+    in_flight = parsed_dir.joinpath('x.marshal.123.tmp')
+    in_flight.write_bytes(b'')
+    for s in ('3', '4', '5'):
+        support.cached_parse(parse, s)
+    assert len(list(parsed_dir.glob('*.marshal'))) == 2
+    assert in_flight.exists()
+
+    # a cache that can't be written to doesn't fail the parse
+    not_a_dir = tmp_path.joinpath('file')
+    not_a_dir.write_text('')
+    monkeypatch.setenv('AOC_CACHE_DIR', str(not_a_dir))
+    assert support.cached_parse(parse, '6') == [6]
+
+
+def test_parse_solve(
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv('AOC_CACHE_DIR', str(tmp_path))
+
+    def solve(numbers: list[int]) -> int:
+        return sum(numbers)
+
+    s = '1 2 3'
+    assert support.parse_solve(support.parse_numbers_split, solve, s) == 6
+    # off unless turned on, and untimed outside of a timing block
+    assert not tmp_path.joinpath('parsed').exists()
+    assert support.TIMINGS == {}
+
+    with support.timing('part', quiet=True):
+        ret = support.parse_solve(
+            support.parse_numbers_split, solve, s, cache=True,
+        )
+        assert ret == 6
+    assert list(support.TIMINGS) == ['part/parse', 'part/solve', 'part']
+    assert len(list(tmp_path.joinpath('parsed').iterdir())) == 1
+    support.reset_timings()
+
+
+def test_result_cache(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path.joinpath('results.sqlite'))
+    with support.ResultCache(path, max_entries=2) as cache:
+        assert cache.get('day01/part1.py', 'src', 'in') is None
+        cache.put('day01/part1.py', 'src', 'in', support.CachedResult('1', 5))
+        cache.put('day01/part2.py', 'src', 'in', support.CachedResult('2', 5))
+        # touching part1 makes part2 the least recently used
+        assert cache.get('day01/part1.py', 'src', 'in') == ('1', 5)
+        cache.put('day02/part1.py', 'src', 'in', support.CachedResult('3', 5))
+        assert len(cache) == 2
+        assert cache.get('day01/part2.py', 'src', 'in') is None
+
+    with support.ResultCache(path) as cache:
+        assert cache.get('day01/part1.py', 'src', 'in') == ('1', 5)
+        assert cache.get('day01/part1.py', 'other', 'in') is None
+
+
+def test_lazy_import(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, 'colorsys', raising=False)
+    mod = support.lazy_import('colorsys')
+    assert sys.modules['colorsys'] is mod
+    assert mod.rgb_to_hsv(0, 0, 0) == (0, 0, 0)
+    assert support.lazy_import('colorsys') is mod
+
+
+def test_lazy_import_missing() -> None:
+    with pytest.raises(ModuleNotFoundError):
+        support.lazy_import('does_not_exist_hopefully')
+
+
+def test_grid() -> None:
+    grid = support.Grid.parse('#..\n.#\n')
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid[0, 0] == '#'
+    assert grid[2, 1] == ' '
+    assert grid.row(1) == '.# '
+    assert grid.col(1) == '.#'
+    assert list(grid.find('#')) == [(0, 0), (1, 1)]
+    assert (3, 0) not in grid
+    assert grid.get((3, 0)) == ''
+    assert set(grid.adjacent_4(0, 0)) == {(1, 0), (0, 1)}
+    assert len(list(grid.adjacent_8(1, 0))) == 5
+    assert grid.bounds == ((0, 2), (0, 1))
+
+    other = grid.copy()
+    other[2, 1] = 'o'
+    assert other != grid
+    assert other.format() == '#..\n.#o'
+    assert dict(other.items())[(2, 1)] == 'o'
+
+
+def test_grid_out_of_bounds() -> None:
+    grid = support.Grid(2, 2)
+    assert grid.format() == '..\n..'
+    with pytest.raises(IndexError):
+        grid[2, 0]
+    with pytest.raises(IndexError):
+        grid[0, -1] = '#'
+    with pytest.raises(IndexError):
+        grid.row(2)
+
+
+def test_merge_intervals() -> None:
+    intervals = [(5, 8), (1, 3), (4, 4), (10, 12), (11, 11), (7, 6)]
+    assert support.merge_intervals(intervals) == [(1, 8), (10, 12)]
+
+
+def test_interval_set() -> None:
+    a = support.IntervalSet([(0, 10**9), (-5, -3)])
+    b = support.IntervalSet([(-4, 2), (10, 20), (10**9, 10**9 + 5)])
+    assert len(a) == 10**9 + 4
+    assert 10**9 in a and -4 in a
+    assert -2 not in a and 10**9 + 1 not in a
+    assert a.bounds == (-5, 10**9)
+
+    assert (a | b).intervals == ((-5, 10**9 + 5),)
+    assert (a & b).intervals == ((-4, -3), (0, 2), (10, 20), (10**9, 10**9))
+    assert (a - b).intervals == ((-5, -5), (3, 9), (21, 10**9 - 1))
+    assert (b - a).intervals == ((-2, -1), (10**9 + 1, 10**9 + 5))
+
+    assert support.IntervalSet([(3, 4)]).issubset(a)
+    assert not b.issubset(a)
+    assert a.issuperset(a & b)
+    assert b.isdisjoint(support.IntervalSet([(21, 99)]))
+    assert not support.IntervalSet()
+
+
+def test_interval_set_empty_bounds() -> None:
+    empty = support.IntervalSet([(1, 2)]) - support.IntervalSet([(0, 5)])
+    with pytest.raises(ValueError, match='empty'):
+        empty.bounds
+
+
+@pytest.mark.parametrize('point', ((0, 0), (-5, 7), (2**31 - 1, -(2**31))))
+def test_pack_roundtrip(point: tuple[int, int]) -> None:
+    assert support.unpack(support.pack(*point)) == point
+
+
+def test_pack_offset() -> None:
+    p = support.pack(3, -2) + support.pack_offset(-10, 5)
+    assert support.unpack(p) == (-7, 3)
+
+
+def test_point_set() -> None:
+    points = support.PointSet.parse(' # \n#  \n')
+    assert points.to_coords() == support.parse_coords_hash(' # \n#  \n')
+    assert (1, 0) in points
+    assert (0, 0) not in points
+    assert len(points) == 2
+    assert points.bounds == ((0, 1), (0, 1))
+    assert points.format() == ' #\n# '
+
+    shifted = points.translate(-1, 1)
+    assert shifted.to_coords() == {(0, 1), (-1, 2)}
+    assert points.intersects(shifted, 1, -1)
+    assert not points.intersects(shifted, 5, 5)
+    assert (points & shifted).to_coords() == {(0, 1)}
+    assert (points | shifted) - shifted == support.PointSet([(1, 0)])
+
+    points.add(5, 5)
+    points.update(shifted)
+    points.discard(1, 0)
+    assert points.to_coords() == {(0, 1), (5, 5), (-1, 2)}
+
+
+MAZE = '''\
+#######
+#S..#.#
+#.#.#.#
+#.#...#
+#...#E#
+#######
+'''
+
+
+def _maze_neighbors(
+        walls: set[tuple[int, int]],
+) -> Callable[[tuple[int, int]], Iterable[tuple[int, int]]]:
+    def neighbors(pos: tuple[int, int]) -> Iterable[tuple[int, int]]:
+        return (n for n in support.adjacent_4(*pos) if n not in walls)
+    return neighbors
+
+
+def test_bfs() -> None:
+    walls = support.parse_coords_hash(MAZE)
+    neighbors = _maze_neighbors(walls)
+    result = support.bfs(((1, 1),), neighbors, lambda p: p == (5, 4))
+    assert result == support.SearchResult(7, (5, 4))
+
+    result = support.bfs(
+        ((1, 1),), neighbors, lambda p: p == (5, 4),
+        key=lambda p: support.pack(*p), path=True,
+    )
+    assert result is not None
+    assert result.path[0] == (1, 1) and result.path[-1] == (5, 4)
+    assert len(result.path) == result.cost + 1
+
+    assert support.bfs(((1, 1),), neighbors, lambda p: p == (9, 9)) is None
+
+
+def test_bfs_multiple_starts() -> None:
+    neighbors = _maze_neighbors(support.parse_coords_hash(MAZE))
+    result = support.bfs(((1, 1), (5, 1)), neighbors, lambda p: p == (5, 4))
+    assert result is not None
+    assert result.cost == 3
+
+
+def _weighted(
+        edges: dict[str, dict[str, int]],
+) -> Callable[[str], Iterable[tuple[str, int]]]:
+    return lambda node: edges.get(node, {}).items()
+
+
+def test_bfs_01() -> None:
+    edges = {'a': {'b': 1, 'c': 0}, 'b': {'d': 1}, 'c': {'b': 0, 'd': 1}}
+    result = support.bfs_01(
+        ('a',), _weighted(edges), lambda n: n == 'd', path=True,
+    )
+    assert result == support.SearchResult(1, 'd', ('a', 'c', 'd'))
+
+
+def test_dijkstra() -> None:
+    edges = {'a': {'b': 7, 'c': 2}, 'b': {'d': 1}, 'c': {'b': 3, 'd': 8}}
+    result = support.dijkstra(
+        ('a',), _weighted(edges), lambda n: n == 'd', path=True,
+    )
+    assert result == support.SearchResult(6, 'd', ('a', 'c', 'b', 'd'))
+    result = support.dijkstra(('d',), _weighted(edges), lambda n: n == 'a')
+    assert result is None
+
+
+def test_astar() -> None:
+    walls = support.parse_coords_hash(MAZE)
+
+    def neighbors(
+            pos: tuple[int, int],
+    ) -> Iterable[tuple[tuple[int, int], int]]:
+        return ((n, 1) for n in _maze_neighbors(walls)(pos))
+
+    result = support.astar(
+        ((1, 1),), neighbors, lambda p: p == (5, 4),
+        lambda p: abs(p[0] - 5) + abs(p[1] - 4),
+    )
+    assert result is not None
+    assert result.cost == 7
+
+
+def test_astar_inconsistent_heuristic() -> None:
+    edges = {'s': {'a': 4, 'b': 1}, 'b': {'a': 1}, 'a': {'g': 5}}
+    # admissible, but 'a' is first reached the expensive way
+    h = {'s': 0, 'a': 0, 'b': 5, 'g': 0}
+    result = support.astar(
+        ('s',), _weighted(edges), lambda n: n == 'g', h.__getitem__,
+        path=True,
+    )
+    assert result == support.SearchResult(7, 'g', ('s', 'b', 'a', 'g'))
+
+
+def test_find_cycle() -> None:
+    # 0 1 2 3 4 5 6 4 5 6 ...
+    def step(n: int) -> int:
+        return n + 1 if n < 6 else 4
+
+    assert support.find_cycle(0, step) == support.Cycle(start=4, period=3)
+    assert support.find_cycle(4, step) == support.Cycle(start=0, period=3)
+
+
+def test_find_cycle_key() -> None:
+    # (counter, position) where only the position repeats
+    def step(state: tuple[int, int]) -> tuple[int, int]:
+        n, pos = state
+        return n + pos, (pos + 3) % 10
+
+    cycle = support.find_cycle((0, 5), step, key=lambda state: state[1])
+    assert cycle == support.Cycle(start=0, period=10)
+
+    def counter(state: tuple[int, int]) -> int:
+        return state[0]
+
+    state = (0, 5)
+    for _ in range(1234):
+        state = step(state)
+    value = support.extrapolate((0, 5), step, 1234, cycle, value=counter)
+    assert value == state[0]
+    assert support.extrapolate((0, 5), step, 3, cycle, value=counter) == 14
+
+
+def test_extrapolate_periodic_value() -> None:
+    def step(n: int) -> int:
+        return n + 1 if n < 6 else 4
+
+    cycle = support.find_cycle(0, step)
+    for n in (0, 5, 7, 10**12):
+        value = n if n < 4 else 4 + (n - 4) % 3
+        assert support.extrapolate(0, step, n, cycle, value=int) == value
+
+
+def test_memo() -> None:
+    calls = []
+
+    @support.memo
+    def fib(n: int) -> int:
+        calls.append(n)
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(30) == 832040
+    assert len(calls) == 31
+    info = fib.info()
+    assert (info.hits, info.misses, info.entries) == (28, 31, 31)
+    assert info.evictions == 0
+
+    support.clear_memos()
+    assert fib.info().entries == 0
+    fib(2)
+    assert calls[-3:] == [2, 1, 0]
+
+
+def test_memo_maxsize() -> None:
+    @support.memo(maxsize=2)
+    def square(n: int) -> int:
+        return n * n
+
+    for n in (1, 2, 1, 3, 2):
+        square(n)
+    info = square.info()
+    assert (info.hits, info.misses, info.entries) == (1, 4, 2)
+    assert info.evictions == 2
+
+    # refilling after a clear is cold misses, not evictions
+    square.clear()
+    square(1)
+    square(2)
+    assert square.info().evictions == 0
+
+
+def test_memo_cost() -> None:
+    @support.memo(maxsize=5, cost=len)
+    def letters(n: int) -> str:
+        return 'x' * n
+
+    letters(2)
+    letters(3)
+    assert letters.info().size == 5
+    letters(2)  # most recently used now, so 3 goes first
+    letters(1)
+    info = letters.info()
+    assert (info.entries, info.size, info.evictions) == (2, 3, 1)
+    letters.clear()
+    assert letters.info() == support.MemoInfo(0, 0, 0, 0, 0, 5)